@@ -0,0 +1,109 @@
+###############################################################################
+# Benchmark for the response compression of the TODOs list/export endpoints:
+# payload bytes (Lambda response and client) and handler time per encoding
+# --> Run with: "poe benchmark-compression"
+###############################################################################
+
+# Built-in imports
+import os
+import sys
+import time
+import base64
+import argparse
+import statistics
+import contextlib
+
+# Environment for the app (must be set before importing it)
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "WARNING")
+os.environ.setdefault("TODOS_CACHE_TTL_SECONDS", "0")
+os.environ["DYNAMODB_TABLE"] = "compression-table"
+os.environ.pop("ENDPOINT_URL", None)
+os.environ.pop("ENVIRONMENT", None)
+
+# External imports
+from ulid import ULID
+
+# Own imports
+from benchmarks.events import api_gateway_event, lambda_context
+from benchmarks.local_dynamodb import seed_todos, start_local_dynamodb
+
+
+TABLE_NAME = os.environ["DYNAMODB_TABLE"]
+
+# (case, path, number of items of the user, query parameters)
+CASES = [
+    ("list limit=10", "/api/v1/todos", 100, {"limit": 10}),
+    ("list limit=50", "/api/v1/todos", 100, {"limit": 50}),
+    ("list limit=100", "/api/v1/todos", 100, {"limit": 100}),
+    ("export 1k items", "/api/v1/todos/export", 1_000, {}),
+    ("export 10k items", "/api/v1/todos/export", 10_000, {}),
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20, help="Requests per case")
+    args = parser.parse_args()
+
+    # Local DynamoDB stand-in must be started before the app's lazy client is created
+    client = start_local_dynamodb(TABLE_NAME)
+    from todo_app.api.v1.main import handler
+    from todo_app.api.v1.middlewares.compression import brotli
+
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    users_by_size = {}
+    for _, _, size, _ in CASES:
+        if size not in users_by_size:
+            users_by_size[size] = f"compression-{size}@example.com"
+            seed_todos(
+                client,
+                TABLE_NAME,
+                users_by_size[size],
+                [str(ULID()) for _ in range(size)],
+            )
+
+    print("Response payload and handler time per encoding (through the Mangum handler)")
+    print(
+        f"{'case':<18}{'encoding':>10}{'client KB':>11}{'lambda KB':>11}"
+        f"{'ratio':>8}{'p50 ms':>9}{'p95 ms':>9}"
+    )
+    for name, path, size, query_params in CASES:
+        identity_bytes = None
+        for encoding in encodings:
+            event = api_gateway_event(
+                "GET",
+                path,
+                {"user_email": users_by_size[size], **query_params},
+                headers={"Accept-Encoding": encoding},
+            )
+            latencies_ms = []
+            # The EMF metrics are still published (and measured), but not to the console
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                handler(event, lambda_context())  # Warm-up (not measured)
+                for _ in range(args.iterations):
+                    t0 = time.perf_counter()
+                    response = handler(event, lambda_context())
+                    latencies_ms.append((time.perf_counter() - t0) * 1000)
+
+            # Client bytes (after API-GW decodes the base64) vs. Lambda response bytes
+            lambda_bytes = len(response["body"])
+            client_bytes = (
+                len(base64.b64decode(response["body"]))
+                if response["isBase64Encoded"]
+                else len(response["body"].encode("utf-8"))
+            )
+            identity_bytes = identity_bytes or client_bytes
+            percentiles = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+            print(
+                f"{name:<18}{encoding:>10}{client_bytes / 1024:>11.1f}"
+                f"{lambda_bytes / 1024:>11.1f}{identity_bytes / client_bytes:>7.1f}x"
+                f"{percentiles[49]:>9.2f}{percentiles[94]:>9.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
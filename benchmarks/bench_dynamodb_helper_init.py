@@ -0,0 +1,117 @@
+###############################################################################
+# Benchmark for the cold start cost of the DynamoDB data access layer
+# (import time, helper initialization and first invocation)
+# --> Run with: "poe benchmark-dynamodb-init"
+###############################################################################
+
+# Built-in imports
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+
+NUMBER_OF_SAMPLES = 10
+
+# Each sample runs in a fresh interpreter, to measure a real cold start
+SAMPLE_TEMPLATE = """
+import json, time
+t0 = time.perf_counter()
+{imports}
+t1 = time.perf_counter()
+
+# Local DynamoDB stand-in (imported after the measured imports)
+from moto import mock_dynamodb
+mock = mock_dynamodb()
+mock.start()
+# Isolated session for the setup, to not warm up the measured clients
+import botocore.session
+botocore.session.get_session().create_client("dynamodb").create_table(
+    TableName="benchmark-table",
+    AttributeDefinitions=[
+        {{"AttributeName": "PK", "AttributeType": "S"}},
+        {{"AttributeName": "SK", "AttributeType": "S"}},
+    ],
+    KeySchema=[
+        {{"AttributeName": "PK", "KeyType": "HASH"}},
+        {{"AttributeName": "SK", "KeyType": "RANGE"}},
+    ],
+    BillingMode="PAY_PER_REQUEST",
+)
+
+t2 = time.perf_counter()
+{init}
+t3 = time.perf_counter()
+{first_call}
+t4 = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "init_ms": (t3 - t2) * 1000,
+    "first_call_ms": (t4 - t3) * 1000,
+}}))
+"""
+
+CASES = {
+    # Previous implementation: boto3 client + resource created at import time
+    "boto3 client+resource": {
+        "imports": (
+            "import todo_app.common.logger\n"
+            "import boto3\n"
+            "from boto3.dynamodb.conditions import Key"
+        ),
+        "init": (
+            "client = boto3.client('dynamodb')\n"
+            "table = boto3.resource('dynamodb').Table('benchmark-table')"
+        ),
+        "first_call": (
+            "client.get_item(TableName='benchmark-table', "
+            "Key={'PK': {'S': 'USER#a'}, 'SK': {'S': 'TODO#1'}})"
+        ),
+    },
+    # Current implementation: lazy low-level client on a shared botocore session
+    "lazy botocore client": {
+        "imports": "from todo_app.helpers.dynamodb_helper import DynamoDBHelper",
+        "init": "helper = DynamoDBHelper('benchmark-table')",
+        "first_call": "helper.get_item_by_pk_and_sk('USER#a', 'TODO#1')",
+    },
+}
+
+
+def run_sample(case: dict) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", SAMPLE_TEMPLATE.format(**case)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            "AWS_DEFAULT_REGION": "us-east-1",
+            "AWS_ACCESS_KEY_ID": "benchmark",
+            "AWS_SECRET_ACCESS_KEY": "benchmark",
+            "POWERTOOLS_LOG_LEVEL": "ERROR",
+            **os.environ,
+        },
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    print(f"DynamoDB layer cold start (median of {NUMBER_OF_SAMPLES} fresh processes)")
+    print(
+        f"{'case':<24}{'import (ms)':>13}{'init (ms)':>12}"
+        f"{'first call (ms)':>17}{'total (ms)':>12}"
+    )
+    for name, case in CASES.items():
+        samples = [run_sample(case) for _ in range(NUMBER_OF_SAMPLES)]
+        medians = {
+            key: statistics.median(sample[key] for sample in samples)
+            for key in ("import_ms", "init_ms", "first_call_ms")
+        }
+        print(
+            f"{name:<24}{medians['import_ms']:>13.1f}{medians['init_ms']:>12.1f}"
+            f"{medians['first_call_ms']:>17.1f}{sum(medians.values()):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+###############################################################################
+# Benchmark for the per-request logging overhead of the TODOs API
+# --> Run with: "poe benchmark-logging"
+###############################################################################
+
+# Built-in imports
+import os
+import sys
+import timeit
+import logging
+import contextvars
+
+# Own imports
+import todo_app.common.logger as logger_module
+from todo_app.common.logger import append_log_keys, custom_logger, start_log_context
+
+
+NUMBER_OF_REQUESTS = 2000
+USER_EMAIL = "rick@example.com"
+
+# Realistic payloads of a request (a TODO item and the responses of its DynamoDB calls)
+TODO_ITEM = {
+    "PK": {"S": f"USER#{USER_EMAIL}"},
+    "SK": {"S": "TODO#01HQ1Z6S2K4W8Y0B3C5D7E9F1G"},
+    "todo_title": {"S": "Complete project"},
+    "todo_details": {"S": "Finish the report with notes and diagrams " * 4},
+    "todo_date": {"S": "2024-02-29"},
+    "is_done": {"S": "False"},
+    "created_at": {"S": "2024-01-05T05:51:02.350Z"},
+    "updated_at": {"S": "2024-01-06T02:31:02.350Z"},
+}
+DYNAMODB_RESPONSE = {
+    "Attributes": TODO_ITEM,
+    "ResponseMetadata": {
+        "RequestId": "6QKUJL0TK8S7N5CQ3FOC0TB1GFVV4KQNSO5AEMVJF66Q9ASUAAJG",
+        "HTTPStatusCode": 200,
+        "HTTPHeaders": {
+            "server": "Server",
+            "content-type": "application/x-amz-json-1.0",
+            "content-length": "512",
+            "connection": "keep-alive",
+            "x-amz-crc32": "2745614147",
+        },
+        "RetryAttempts": 0,
+    },
+}
+
+# The log records are formatted, but written to /dev/null (only the overhead is measured)
+_stdout = sys.stdout
+sys.stdout = open(os.devnull, "w")
+logger = custom_logger()
+sys.stdout = _stdout
+std_logger = logging.getLogger(logger.service)
+
+
+def request_before() -> None:
+    """Per-request logging before the request-scoped context (shared keys, eager payloads)."""
+    logger.append_keys(correlation_id="1234", user_email=USER_EMAIL)
+    logger.info("Starting todos handler for patch_todo_item()")
+    for _ in range(2):
+        logger.info("Starting update_item operation.")
+        logger.debug(f"pk: {TODO_ITEM['PK']}, sk: {TODO_ITEM['SK']} data: {TODO_ITEM}")
+        logger.info(DYNAMODB_RESPONSE)
+    logger.info("Finished patch_todo_item() successfully")
+
+
+def request_after() -> None:
+    """Per-request logging with the request-scoped context (sampled, lazy payloads)."""
+    start_log_context(correlation_id="1234")
+    append_log_keys(user_email=USER_EMAIL)
+    logger.info("Starting todos handler for patch_todo_item()")
+    for _ in range(2):
+        logger.info("Starting update_item operation.")
+        logger.debug(
+            "update_item pk: %s, sk: %s, data: %s",
+            TODO_ITEM["PK"],
+            TODO_ITEM["SK"],
+            TODO_ITEM,
+        )
+        logger.debug("update_item response", extra={"response": DYNAMODB_RESPONSE})
+    logger.info("Finished patch_todo_item() successfully")
+
+
+def measure(func, log_level: int, sample_rate: float) -> float:
+    """Average time per request (in microseconds), each one in its own context."""
+    std_logger.setLevel(log_level)
+    logger_module.LOG_DEBUG_SAMPLE_RATE = sample_rate
+    run_request = lambda: contextvars.copy_context().run(func)  # noqa: E731
+    run_request()  # Warm-up
+    total_seconds = timeit.timeit(run_request, number=NUMBER_OF_REQUESTS)
+    return total_seconds / NUMBER_OF_REQUESTS * 1_000_000
+
+
+def main() -> None:
+    # The app sets the logger to DEBUG when sampling is enabled (see <custom_logger>),
+    # and the filter drops the DEBUG records of the requests that were not sampled
+    cases = (
+        ("before (INFO)", request_before, logging.INFO, 0.0),
+        ("after (INFO, no sampling)", request_after, logging.INFO, 0.0),
+        ("after (not sampled)", request_after, logging.DEBUG, 0.0),
+        ("after (sampled)", request_after, logging.DEBUG, 1.0),
+    )
+    print(f"Logging cost per request ({NUMBER_OF_REQUESTS} requests per case)")
+    print(f"{'case':<28}{'us/request':>12}")
+    for name, func, log_level, sample_rate in cases:
+        print(f"{name:<28}{measure(func, log_level, sample_rate):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+###############################################################################
+# Benchmark for the DynamoDB items --> TODO models conversion on the read paths
+# --> Run with: "poe benchmark-model-conversion"
+###############################################################################
+
+# Built-in imports
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+# External imports
+from fastapi.encoders import jsonable_encoder
+
+# Own imports
+from todo_app.helpers.dynamodb_serializer import deserialize_item
+from todo_app.models.todos import TodoModel, TodosPage
+
+
+NUMBER_OF_ITEMS = 10_000
+REPETITIONS = 5
+DYNAMODB_ITEMS = [
+    {
+        "PK": {"S": "USER#rick@example.com"},
+        "SK": {"S": f"TODO#01HQ0000000000000000{index:04d}"},
+        "todo_title": {"S": f"Complete project {index}"},
+        "todo_details": {"S": "Finish the project with notes and diagrams"},
+        "todo_date": {"S": "2024-08-14"},
+        "is_done": {"S": "True" if index % 2 else "False"},
+        "created_at": {"S": "2024-01-05T05:51:02.350Z"},
+        "updated_at": {"S": "2024-01-06T02:31:02.350Z"},
+    }
+    for index in range(NUMBER_OF_ITEMS)
+]
+
+# Before: validated models for "get", and generic deserialization to dicts for "list",
+# both encoded by FastAPI (<jsonable_encoder>)
+# After: one bulk validation (<TypeAdapter>) for both (same response shape), encoded by
+# pydantic-core
+CASES: dict[str, tuple[Callable[[list[dict]], list], Callable[[list], object]]] = {
+    "validated models (before, get)": (
+        lambda items: [TodoModel.from_dynamodb_item(item) for item in items],
+        lambda todos: jsonable_encoder({"items": todos, "next_token": None}),
+    ),
+    "deserialized dicts (before, list)": (
+        lambda items: [deserialize_item(item) for item in items],
+        lambda todos: jsonable_encoder({"items": todos, "next_token": None}),
+    ),
+    "bulk validated models (after)": (
+        TodoModel.from_dynamodb_items,
+        lambda todos: TodosPage.model_construct(items=todos).model_dump_json(),
+    ),
+}
+
+
+def measure_cpu(func: Callable[[], object]) -> float:
+    """Best CPU time (ms) out of the repetitions."""
+    timings = []
+    for _ in range(REPETITIONS):
+        gc.collect()
+        start = time.process_time()
+        func()
+        timings.append((time.process_time() - start) * 1000)
+    return min(timings)
+
+
+def measure_allocations(func: Callable[[], object]) -> float:
+    """Peak of the memory allocated (MiB) while running the function."""
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def main() -> None:
+    print(f"Conversion of {NUMBER_OF_ITEMS} DynamoDB items (best of {REPETITIONS})")
+    print(
+        f"{'case':<36}{'convert ms':>12}{'+ encode ms':>13}"
+        f"{'convert MiB':>12}{'+ encode MiB':>14}"
+    )
+    for name, (convert, encode) in CASES.items():
+        convert_ms = measure_cpu(lambda: convert(DYNAMODB_ITEMS))
+        end_to_end_ms = measure_cpu(lambda: encode(convert(DYNAMODB_ITEMS)))
+        convert_mib = measure_allocations(lambda: convert(DYNAMODB_ITEMS))
+        end_to_end_mib = measure_allocations(lambda: encode(convert(DYNAMODB_ITEMS)))
+        print(
+            f"{name:<36}{convert_ms:>12.1f}{end_to_end_ms:>13.1f}"
+            f"{convert_mib:>12.1f}{end_to_end_mib:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
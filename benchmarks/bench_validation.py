@@ -0,0 +1,80 @@
+###############################################################################
+# Benchmark for the per-request JSON-Schema validation cost of the TODOs API
+# --> Run with: "poe benchmark-validation"
+###############################################################################
+
+# Built-in imports
+import copy
+import timeit
+
+# External imports
+import jsonschema
+from jsonschema import FormatChecker
+
+# Own imports
+from todo_app.api.v1.schemas.schema import Schema
+from todo_app.api.v1.services.validator import get_validator, validate_json
+from todo_app.common.enums import JSONSchemaType, SchemaOperation
+from todo_app.common.logger import custom_logger
+
+
+NUMBER_OF_REQUESTS = 2000
+PAYLOADS = {
+    SchemaOperation.CREATE: {
+        "user_email": "rick@example.com",
+        "todo_title": "Complete project",
+        "todo_details": "Finish the report",
+        "todo_date": "2024-02-29",
+        "is_done": False,
+    },
+    SchemaOperation.PATCH: {
+        "todo_details": "Finish the report with diagrams",
+        "is_done": True,
+    },
+}
+
+# Silent logger, to only measure the validation itself
+logger = custom_logger()
+logger.setLevel("ERROR")
+
+
+def validate_before(data: dict, operation: SchemaOperation) -> None:
+    """Per-request behavior before the validator registry (load + check + compile)."""
+    json_schema = Schema(JSONSchemaType.TODOS, logger=logger).get_schema()
+    if operation == SchemaOperation.PATCH:
+        json_schema.pop("required", None)
+    jsonschema.validate(
+        instance=data, schema=json_schema, format_checker=FormatChecker()
+    )
+
+
+def validate_after(data: dict, operation: SchemaOperation) -> None:
+    """Per-request behavior with the process-wide validator registry."""
+    validate_json(
+        data=data,
+        validator=get_validator(JSONSchemaType.TODOS, operation),
+        logger=logger,
+    )
+
+
+def main() -> None:
+    print(f"Validation cost per request ({NUMBER_OF_REQUESTS} requests per case)")
+    print(f"{'operation':<10}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for operation, payload in PAYLOADS.items():
+        results = {}
+        for name, func in (("before", validate_before), ("after", validate_after)):
+            # Warm-up (the "after" case compiles its validator only once per process)
+            func(copy.deepcopy(payload), operation)
+            total_seconds = timeit.timeit(
+                lambda: func(copy.deepcopy(payload), operation),
+                number=NUMBER_OF_REQUESTS,
+            )
+            results[name] = total_seconds / NUMBER_OF_REQUESTS * 1_000_000
+        print(
+            f"{operation.value:<10}{results['before']:>14.1f}{results['after']:>14.1f}"
+            f"{results['before'] / results['after']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+###############################################################################
+# Cold start benchmark harness for the Mangum handler of the TODOs API
+# --> Run with: "poe benchmark-cold-start" (exits with 1 if the budget regresses)
+###############################################################################
+
+# Built-in imports
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from collections import defaultdict
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+DEFAULT_BUDGET_FILE = os.path.join(BENCHMARKS_DIR, "cold_start_budget.json")
+
+RESULT_PREFIX = "COLD_START_RESULT "
+APP_MODULE = "todo_app.api.v1.main"
+ROUTES = [
+    "list_todos",
+    "get_todo",
+    "create_todo",
+    "patch_todo",
+    "delete_todo",
+    "docs",
+    "openapi",
+]
+
+# Code for each sample, that runs in a fresh interpreter with "-X importtime"
+SAMPLE_CODE = f"""
+import sys, json, time
+route = sys.argv[1]
+
+t0 = time.perf_counter()
+import {APP_MODULE} as main
+t1 = time.perf_counter()
+
+from mangum import Mangum
+Mangum(main.app)
+t2 = time.perf_counter()
+
+# The docs routes build the OpenAPI schema in their first request
+openapi_ms = None
+if route not in ("docs", "openapi"):
+    main.app.openapi()
+    openapi_ms = (time.perf_counter() - t2) * 1000
+
+# Local DynamoDB stand-in (after the measured imports, before the app's lazy client)
+from benchmarks.events import lambda_context, route_events
+from benchmarks.local_dynamodb import seed_todos, start_local_dynamodb
+client = start_local_dynamodb("cold-start-table")
+seed_todos(client, "cold-start-table", "rick@example.com", ["01HKZ4M0000000000000000000"])
+event = route_events("rick@example.com", "01HKZ4M0000000000000000000")[route]
+
+t3 = time.perf_counter()
+response = main.handler(event, lambda_context())
+t4 = time.perf_counter()
+
+print({RESULT_PREFIX!r} + json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "mangum_ms": (t2 - t1) * 1000,
+    "openapi_ms": openapi_ms,
+    "first_request_ms": (t4 - t3) * 1000,
+    "status_code": response["statusCode"],
+}}))
+"""
+
+
+def parse_import_times(stderr: str) -> dict[str, int]:
+    """
+    Function to parse the "-X importtime" output of the app import (in microseconds).
+    Returns the self import time of each top-level package, and the cumulative time of the app.
+    :param stderr (str): Standard error of the sample process.
+    """
+    import_times = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        module = module.strip()
+        import_times[module.split(".")[0]] += int(self_us)
+
+        # Only the imports of the app are measured (the rest are from the setup)
+        if module == APP_MODULE:
+            import_times[f"{APP_MODULE} (cumulative)"] = int(cumulative_us)
+            break
+    return dict(import_times)
+
+
+def run_sample(route: str) -> dict:
+    """
+    Function to run a single cold start sample for a route in a fresh interpreter.
+    :param route (str): Name of the route to send the first request to.
+    """
+    env = {
+        "AWS_DEFAULT_REGION": "us-east-1",
+        "AWS_ACCESS_KEY_ID": "benchmark",
+        "AWS_SECRET_ACCESS_KEY": "benchmark",
+        "POWERTOOLS_LOG_LEVEL": "WARNING",
+        **os.environ,
+        "DYNAMODB_TABLE": "cold-start-table",
+        "PYTHONPATH": os.pathsep.join([os.path.join(ROOT_DIR, "src"), ROOT_DIR]),
+    }
+    env.pop("ENDPOINT_URL", None)
+    env.pop("ENVIRONMENT", None)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SAMPLE_CODE, route],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR,
+        env=env,
+    )
+    lines = [
+        line for line in result.stdout.splitlines() if line.startswith(RESULT_PREFIX)
+    ]
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(f"Sample for route {route} failed:\n{result.stderr[-2000:]}")
+
+    sample = json.loads(lines[-1][len(RESULT_PREFIX) :])
+    sample["import_times_us"] = parse_import_times(result.stderr)
+    return sample
+
+
+def check_budget(results: dict, budget: dict) -> list[str]:
+    """
+    Function to compare the results against the budget (in milliseconds).
+    Returns the list of regressions (empty if the budget is met).
+    :param results (dict): Median results of the benchmark.
+    :param budget (dict): Budget with the same structure as the results.
+    """
+    regressions = []
+    for metric in ("import_ms", "mangum_ms", "openapi_ms"):
+        if metric in budget and results[metric] > budget[metric]:
+            regressions.append(
+                f"{metric}: {results[metric]:.1f} > budget {budget[metric]:.1f}"
+            )
+    for route, value in results["first_request_ms"].items():
+        route_budget = budget.get("first_request_ms", {}).get(route)
+        if route_budget is not None and value > route_budget:
+            regressions.append(
+                f"first_request_ms[{route}]: {value:.1f} > budget {route_budget:.1f}"
+            )
+    for package, value in results["packages_import_ms"].items():
+        package_budget = budget.get("packages_import_ms", {}).get(package)
+        if package_budget is not None and value > package_budget:
+            regressions.append(
+                f"packages_import_ms[{package}]: {value:.1f} > budget {package_budget:.1f}"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=5, help="Samples per route")
+    parser.add_argument("--routes", nargs="+", default=ROUTES, choices=ROUTES)
+    parser.add_argument("--budget", default=DEFAULT_BUDGET_FILE, help="Budget file")
+    parser.add_argument("--top", type=int, default=15, help="Packages to report")
+    parser.add_argument("--output", help="Optional file to write the JSON results")
+    args = parser.parse_args()
+
+    samples = {
+        route: [run_sample(route) for _ in range(args.samples)] for route in args.routes
+    }
+    all_samples = [sample for route in samples.values() for sample in route]
+
+    packages = {
+        package
+        for sample in all_samples
+        for package in sample["import_times_us"].keys()
+    }
+    results = {
+        "import_ms": statistics.median(s["import_ms"] for s in all_samples),
+        "mangum_ms": statistics.median(s["mangum_ms"] for s in all_samples),
+        "openapi_ms": statistics.median(
+            [s["openapi_ms"] for s in all_samples if s["openapi_ms"] is not None]
+            or [0.0]
+        ),
+        "first_request_ms": {
+            route: statistics.median(s["first_request_ms"] for s in route_samples)
+            for route, route_samples in samples.items()
+        },
+        "status_codes": {
+            route: sorted({s["status_code"] for s in route_samples})
+            for route, route_samples in samples.items()
+        },
+        "packages_import_ms": {
+            package: statistics.median(
+                s["import_times_us"].get(package, 0) / 1000 for s in all_samples
+            )
+            for package in packages
+        },
+    }
+
+    print(f"Cold start of {APP_MODULE} (median of {len(all_samples)} fresh processes)")
+    print(f"  import app (FastAPI app + routers):  {results['import_ms']:>8.1f} ms")
+    print(f"  Mangum(app) setup:                   {results['mangum_ms']:>8.1f} ms")
+    print(f"  OpenAPI schema construction:         {results['openapi_ms']:>8.1f} ms")
+    print("First request latency per route:")
+    for route, value in results["first_request_ms"].items():
+        status_codes = ",".join(map(str, results["status_codes"][route]))
+        print(f"  {route:<36} {value:>8.1f} ms  (status {status_codes})")
+    print(f"Top {args.top} packages by self import time:")
+    top_packages = sorted(
+        results["packages_import_ms"].items(), key=lambda item: item[1], reverse=True
+    )[: args.top]
+    for package, value in top_packages:
+        print(f"  {package:<36} {value:>8.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    budget = {}
+    if args.budget and os.path.exists(args.budget):
+        with open(args.budget, "r") as file:
+            budget = json.load(file)
+    regressions = check_budget(results, budget)
+    if regressions:
+        print("Cold start budget regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("Cold start budget met")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+###############################################################################
+# Synthetic API Gateway (REST API proxy) events and Lambda context for benchmarks
+###############################################################################
+
+# Built-in imports
+import json
+from types import SimpleNamespace
+from typing import Optional
+from uuid import uuid4
+
+
+def api_gateway_event(
+    method: str,
+    path: str,
+    query_params: Optional[dict] = None,
+    body: Optional[dict | list] = None,
+    headers: Optional[dict] = None,
+    stage: str = "dev",
+) -> dict:
+    """
+    Function to build a realistic API Gateway REST API proxy event (payload format 1.0).
+    :param method (str): HTTP method of the request.
+    :param path (str): Path of the request (without the stage).
+    :param query_params (Optional(dict)): Query string parameters of the request.
+    :param body (Optional(dict | list)): JSON body of the request.
+    :param headers (Optional(dict)): Additional headers of the request.
+    :param stage (str): API Gateway stage name.
+    """
+    request_headers = {
+        "accept": "application/json",
+        "content-type": "application/json",
+        "host": "abcdef1234.execute-api.us-east-1.amazonaws.com",
+        "user-agent": "benchmark",
+        "x-api-key": "benchmark-api-key",
+        "x-forwarded-for": "127.0.0.1",
+        "x-forwarded-port": "443",
+        "x-forwarded-proto": "https",
+        **(headers or {}),
+    }
+    query_params = {key: str(value) for key, value in (query_params or {}).items()}
+    request_id = str(uuid4())
+
+    return {
+        "resource": "/api/v1/todos/{proxy+}",
+        "path": path,
+        "httpMethod": method,
+        "headers": request_headers,
+        "multiValueHeaders": {key: [value] for key, value in request_headers.items()},
+        "queryStringParameters": query_params or None,
+        "multiValueQueryStringParameters": (
+            {key: [value] for key, value in query_params.items()} or None
+        ),
+        "pathParameters": {"proxy": path.rsplit("/", 1)[-1]},
+        "stageVariables": None,
+        "requestContext": {
+            "resourcePath": "/api/v1/todos/{proxy+}",
+            "httpMethod": method,
+            "path": f"/{stage}{path}",
+            "stage": stage,
+            "requestId": request_id,
+            "extendedRequestId": request_id,
+            "requestTimeEpoch": 1704067200000,
+            "protocol": "HTTP/1.1",
+            "identity": {"sourceIp": "127.0.0.1", "userAgent": "benchmark"},
+            "accountId": "123456789012",
+            "apiId": "abcdef1234",
+        },
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+
+def lambda_context(function_name: str = "todo-app-benchmark") -> SimpleNamespace:
+    """
+    Function to build a minimal Lambda context object.
+    :param function_name (str): Name of the Lambda Function.
+    """
+    return SimpleNamespace(
+        function_name=function_name,
+        function_version="$LATEST",
+        invoked_function_arn=(
+            f"arn:aws:lambda:us-east-1:123456789012:function:{function_name}"
+        ),
+        memory_limit_in_mb=512,
+        aws_request_id=str(uuid4()),
+        log_group_name=f"/aws/lambda/{function_name}",
+        log_stream_name="benchmark",
+        get_remaining_time_in_millis=lambda: 20000,
+    )
+
+
+def route_events(user_email: str, todo_ulid: str) -> dict[str, dict]:
+    """
+    Function to build one API Gateway event for each of the routes of the TODOs API.
+    :param user_email (str): Email of the user that owns the TODO items.
+    :param todo_ulid (str): ULID of an existing TODO item of the user.
+    """
+    todo_path = f"/api/v1/todos/{todo_ulid}"
+    user_params = {"user_email": user_email}
+
+    return {
+        "list_todos": api_gateway_event("GET", "/api/v1/todos", user_params),
+        "get_todo": api_gateway_event("GET", todo_path, user_params),
+        "create_todo": api_gateway_event(
+            "POST",
+            "/api/v1/todos",
+            body={
+                "user_email": user_email,
+                "todo_title": "Benchmark TODO",
+                "todo_details": "Created by the benchmark suite",
+                "todo_date": "2024-02-29",
+            },
+        ),
+        "patch_todo": api_gateway_event(
+            "PATCH", todo_path, user_params, body={"is_done": True}
+        ),
+        "delete_todo": api_gateway_event("DELETE", todo_path, user_params),
+        "docs": api_gateway_event(
+            "GET", "/api/v1/docs", headers={"accept": "text/html"}
+        ),
+        "openapi": api_gateway_event("GET", "/api/v1/docs/openapi.json"),
+    }
@@ -0,0 +1,141 @@
+###############################################################################
+# Size and per-package import time report of the "common" Lambda layer
+# --> Run with: "poe layer-report" (after "make install" in "lambda-layers")
+###############################################################################
+
+# Built-in imports
+import io
+import os
+import sys
+import json
+import zipfile
+import argparse
+import statistics
+import subprocess
+import importlib.util
+from collections import defaultdict
+
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+DEFAULT_LAYER_DIR = os.path.join(
+    ROOT_DIR, "lambda-layers", "common", "modules", "python"
+)
+
+
+def get_package_name(relative_path: str) -> str:
+    """
+    Function to get the top-level package of a file of the layer (the metadata folders
+    are grouped as "*.dist-info").
+    :param relative_path (str): Path of the file, relative to the layer directory.
+    """
+    parts = relative_path.split(os.sep)
+    if parts[0].endswith(".dist-info"):
+        return "*.dist-info"
+    if parts[0] == "__pycache__":
+        # Bytecode of the top-level modules (e.g. "typing_extensions.cpython-311.pyc")
+        return parts[1].split(".")[0]
+    return parts[0][: -len(".py")] if parts[0].endswith(".py") else parts[0]
+
+
+def get_sizes(layer_dir: str) -> dict[str, dict]:
+    """
+    Function to get the size on disk and the zipped size of each top-level package, and
+    how many of its modules are precompiled for the running Python version.
+    :param layer_dir (str): Directory with the installed packages of the layer.
+    """
+    sizes = defaultdict(
+        lambda: {"files": 0, "bytes": 0, "zip_bytes": 0, "py": 0, "pyc": 0}
+    )
+    for directory, _, file_names in os.walk(layer_dir):
+        for file_name in file_names:
+            path = os.path.join(directory, file_name)
+            package = sizes[get_package_name(os.path.relpath(path, layer_dir))]
+            package["files"] += 1
+            package["bytes"] += os.path.getsize(path)
+
+            # Compressed size of the file (as in the layer zip)
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                zip_file.write(path, file_name)
+            package["zip_bytes"] += buffer.tell()
+
+            if file_name.endswith(".py"):
+                package["py"] += 1
+                package["pyc"] += os.path.exists(importlib.util.cache_from_source(path))
+    return dict(sizes)
+
+
+def get_import_time_us(layer_dir: str, package: str) -> int:
+    """
+    Function to measure the cumulative import time of a package in a fresh interpreter,
+    that only has the standard library and the layer (no site-packages).
+    :param layer_dir (str): Directory with the installed packages of the layer.
+    :param package (str): Name of the top-level package to import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", "-c", f"import {package}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": layer_dir},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import of {package} failed:\n{result.stderr[-2000:]}")
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, module = line[len("import time:") :].split("|")
+        if module.strip() == package:
+            return int(cumulative_us)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layer-dir", default=DEFAULT_LAYER_DIR, help="Layer packages")
+    parser.add_argument("--samples", type=int, default=3, help="Samples per package")
+    parser.add_argument("--output", help="Optional file to write the JSON results")
+    args = parser.parse_args()
+
+    layer_dir = os.path.abspath(args.layer_dir)
+    if not os.path.isdir(layer_dir):
+        print(f"Layer directory not found: {layer_dir} (run 'make install' first)")
+        return 1
+
+    sizes = get_sizes(layer_dir)
+    import_ms = {
+        package: statistics.median(
+            get_import_time_us(layer_dir, package) / 1000 for _ in range(args.samples)
+        )
+        for package in sizes
+        if package != "*.dist-info" and package.isidentifier()
+    }
+
+    print(f"Layer report of {layer_dir} (import times: median of {args.samples})")
+    print(
+        f"{'package':<28}{'files':>7}{'size (KB)':>11}{'zip (KB)':>10}"
+        f"{'pyc':>10}{'import (ms)':>13}"
+    )
+    for package, size in sorted(sizes.items(), key=lambda item: -item[1]["bytes"]):
+        import_time = import_ms.get(package)
+        print(
+            f"{package:<28}{size['files']:>7}{size['bytes'] / 1024:>11.1f}"
+            f"{size['zip_bytes'] / 1024:>10.1f}{size['pyc']:>6}/{size['py']:<3}"
+            + (f"{import_time:>13.1f}" if import_time is not None else f"{'-':>13}")
+        )
+    total_bytes = sum(size["bytes"] for size in sizes.values())
+    total_zip_bytes = sum(size["zip_bytes"] for size in sizes.values())
+    print(
+        f"{'total':<28}{sum(size['files'] for size in sizes.values()):>7}"
+        f"{total_bytes / 1024:>11.1f}{total_zip_bytes / 1024:>10.1f}"
+    )
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"sizes": sizes, "import_ms": import_ms}, output_file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
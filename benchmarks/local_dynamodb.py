@@ -0,0 +1,97 @@
+###############################################################################
+# Local DynamoDB stand-in (moto) for the benchmarks of the TODOs API
+###############################################################################
+
+# Built-in imports
+from datetime import datetime
+
+# External imports
+import botocore.session
+from moto import mock_dynamodb
+
+
+def start_local_dynamodb(table_name: str):
+    """
+    Function to start the in-process DynamoDB mock and create the TODOs table on it.
+    Returns a low-level client (from an isolated session) to seed the table.
+    ! Note--> the app's own client must be created after this function is called.
+    :param table_name (str): Name of the DynamoDB table to create.
+    """
+    mock = mock_dynamodb()
+    mock.start()
+
+    # Isolated session for the setup, to not warm up the clients being measured
+    client = botocore.session.get_session().create_client("dynamodb")
+    client.create_table(
+        TableName=table_name,
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+            {"AttributeName": "todo_date", "AttributeType": "S"},
+            {"AttributeName": "OPEN_SK", "AttributeType": "S"},
+        ],
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        # Same indexes as the ones in the CDK stack
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "todo-date-index",
+                "KeySchema": [
+                    {"AttributeName": "PK", "KeyType": "HASH"},
+                    {"AttributeName": "todo_date", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "open-todos-index",
+                "KeySchema": [
+                    {"AttributeName": "PK", "KeyType": "HASH"},
+                    {"AttributeName": "OPEN_SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    return client
+
+
+def todo_item(user_email: str, ulid: str, index: int = 0) -> dict:
+    """
+    Function to build a TODO item in the DynamoDB format (as stored by the app).
+    :param user_email (str): Email of the user that owns the TODO item.
+    :param ulid (str): ULID of the TODO item.
+    :param index (int): Index of the TODO item, to vary its attributes.
+    """
+    current_time = datetime.now().isoformat()
+    return {
+        "PK": {"S": f"USER#{user_email}"},
+        "SK": {"S": f"TODO#{ulid}"},
+        "todo_title": {"S": f"Benchmark TODO {index}"},
+        "todo_details": {"S": "Details of the TODO item " * 8},
+        "todo_date": {"S": f"2024-{index % 12 + 1:02d}-{index % 28 + 1:02d}"},
+        "is_done": {"S": str(index % 3 == 0)},
+        "created_at": {"S": current_time},
+        "updated_at": {"S": current_time},
+    }
+
+
+def seed_todos(client, table_name: str, user_email: str, ulids: list[str]) -> None:
+    """
+    Function to add TODO items for a user with batch writes.
+    :param client: Low-level DynamoDB client.
+    :param table_name (str): Name of the DynamoDB table.
+    :param user_email (str): Email of the user that owns the TODO items.
+    :param ulids (list[str]): ULIDs of the TODO items to add.
+    """
+    for i in range(0, len(ulids), 25):
+        client.batch_write_item(
+            RequestItems={
+                table_name: [
+                    {"PutRequest": {"Item": todo_item(user_email, ulid, i + j)}}
+                    for j, ulid in enumerate(ulids[i : i + 25])
+                ]
+            }
+        )
@@ -0,0 +1,189 @@
+###############################################################################
+# End-to-end throughput/latency benchmark of the TODOs API over synthetic
+# API Gateway events, sent through the Mangum handler (warm container)
+# --> Run with: "poe benchmark-throughput"
+###############################################################################
+
+# Built-in imports
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import contextlib
+from typing import Callable
+
+# Environment for the app (must be set before importing it)
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "WARNING")
+os.environ.setdefault("TODOS_CACHE_TTL_SECONDS", "0")
+os.environ["DYNAMODB_TABLE"] = "throughput-table"
+os.environ.pop("ENDPOINT_URL", None)
+os.environ.pop("ENVIRONMENT", None)
+
+# External imports
+from ulid import ULID
+
+# Own imports
+from benchmarks.events import api_gateway_event, lambda_context, route_events
+from benchmarks.local_dynamodb import seed_todos, start_local_dynamodb
+
+
+TABLE_NAME = os.environ["DYNAMODB_TABLE"]
+LIST_SIZES = [10, 1_000, 10_000]
+
+
+class DynamoDBCallCounter:
+    """Counter of the DynamoDB API calls made by the app's client."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, **kwargs) -> None:
+        self.calls += 1
+
+
+def measure(
+    handler: Callable,
+    name: str,
+    events: Callable[[int], dict],
+    iterations: int,
+    counter: DynamoDBCallCounter,
+) -> dict:
+    """
+    Function to send a number of events through the handler and collect the statistics.
+    :param handler (Callable): Lambda handler (Mangum).
+    :param name (str): Name of the case.
+    :param events (Callable[[int], dict]): Function that returns the event for an iteration.
+    :param iterations (int): Number of requests to send.
+    :param counter (DynamoDBCallCounter): Counter of the DynamoDB calls.
+    """
+    latencies_ms = []
+    status_codes = set()
+    response_bytes = 0
+    # The EMF metrics are still published (and measured), but not to the console
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        # Warm-up request (not measured)
+        handler(events(-1), lambda_context())
+
+        calls_before = counter.calls
+        start = time.perf_counter()
+        for iteration in range(iterations):
+            event = events(iteration)
+            t0 = time.perf_counter()
+            response = handler(event, lambda_context())
+            latencies_ms.append((time.perf_counter() - t0) * 1000)
+            status_codes.add(response["statusCode"])
+            response_bytes += len(response.get("body") or "")
+        total_seconds = time.perf_counter() - start
+
+    percentiles = (
+        statistics.quantiles(latencies_ms, n=100, method="inclusive")
+        if len(latencies_ms) > 1
+        else latencies_ms * 99
+    )
+    return {
+        "case": name,
+        "requests": iterations,
+        "p50_ms": percentiles[49],
+        "p95_ms": percentiles[94],
+        "p99_ms": percentiles[98],
+        "requests_per_second": iterations / total_seconds,
+        "dynamodb_calls_per_request": (counter.calls - calls_before) / iterations,
+        "response_bytes_per_request": response_bytes / iterations,
+        "status_codes": sorted(status_codes),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="Requests per route"
+    )
+    parser.add_argument(
+        "--list-iterations", type=int, default=20, help="Requests per list size"
+    )
+    parser.add_argument("--list-sizes", type=int, nargs="+", default=LIST_SIZES)
+    parser.add_argument("--output", help="Optional file to write the JSON results")
+    args = parser.parse_args()
+
+    # Local DynamoDB stand-in must be started before the app's lazy client is created
+    client = start_local_dynamodb(TABLE_NAME)
+    from todo_app.api.v1.main import handler
+    from todo_app.access_patterns.todos import dynamodb_helper
+
+    counter = DynamoDBCallCounter()
+    dynamodb_helper.dynamodb_client.meta.events.register(
+        "before-call.dynamodb", counter
+    )
+
+    # Seed data for the routes (a dedicated user, with one TODO per delete request)
+    user_email = "routes@example.com"
+    ulids = [str(ULID()) for _ in range(args.iterations + 2)]
+    seed_todos(client, TABLE_NAME, user_email, ulids)
+    events = route_events(user_email, ulids[0])
+    delete_events = {
+        iteration: route_events(user_email, ulids[iteration + 1])["delete_todo"]
+        for iteration in range(-1, args.iterations)
+    }
+
+    results = [
+        measure(handler, route, lambda _, event=event: event, args.iterations, counter)
+        for route, event in events.items()
+        if route != "delete_todo"
+    ]
+    results.append(
+        measure(
+            handler, "delete_todo", delete_events.__getitem__, args.iterations, counter
+        )
+    )
+
+    # List path scalability (first page and full NDJSON export) per partition size
+    for size in args.list_sizes:
+        size_user_email = f"list-{size}@example.com"
+        seed_todos(
+            client, TABLE_NAME, size_user_email, [str(ULID()) for _ in range(size)]
+        )
+        list_event = api_gateway_event(
+            "GET", "/api/v1/todos", {"user_email": size_user_email, "limit": 100}
+        )
+        export_event = api_gateway_event(
+            "GET", "/api/v1/todos/export", {"user_email": size_user_email}
+        )
+        for name, event in (("list_todos", list_event), ("export_todos", export_event)):
+            results.append(
+                measure(
+                    handler,
+                    f"{name}[{size} items]",
+                    lambda _, event=event: event,
+                    args.list_iterations,
+                    counter,
+                )
+            )
+
+    print("End-to-end latency/throughput through the Mangum handler (moto DynamoDB)")
+    print(
+        f"{'case':<28}{'reqs':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'req/s':>9}{'ddb/req':>9}{'KB/resp':>9}  status"
+    )
+    for result in results:
+        print(
+            f"{result['case']:<28}{result['requests']:>6}{result['p50_ms']:>9.2f}"
+            f"{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+            f"{result['requests_per_second']:>9.1f}"
+            f"{result['dynamodb_calls_per_request']:>9.2f}"
+            f"{result['response_bytes_per_request'] / 1024:>9.1f}"
+            f"  {','.join(map(str, result['status_codes']))}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,13 +7,19 @@ from aws_cdk import (
     RemovalPolicy,
     Tags,
     Duration,
+    Size,
     aws_dynamodb,
     aws_lambda,
+    aws_secretsmanager,
     aws_apigateway as aws_apigw,
 )
 from constructs import Construct
 
 
+# Min size (bytes) of the responses to compress (by the Lambda Function and API-GW)
+RESPONSE_COMPRESSION_MIN_SIZE = 1024
+
+
 class BackendStack(Stack):
     """
     Class to create the backend resources, which includes the DynamoDB database,
@@ -44,6 +50,7 @@ class BackendStack(Stack):
 
         # Main methods for the deployment
         self.create_dynamodb_table()
+        self.create_secrets()
         self.create_lambda_layers()
         self.create_lambda_functions()
         self.create_rest_api()
@@ -68,9 +75,54 @@ class BackendStack(Stack):
             ),
             billing_mode=aws_dynamodb.BillingMode.PAY_PER_REQUEST,
             removal_policy=RemovalPolicy.DESTROY,
+            # Expiration of the idempotency records (the TODO items never have it)
+            time_to_live_attribute="expiration",
         )
         Tags.of(self.dynamodb_table).add("Name", self.app_config["table_name"])
 
+        # Index for the date-range queries of the TODO items of a user (only the items
+        # with a "todo_date" are projected, as the index is sparse)
+        self.dynamodb_table.add_global_secondary_index(
+            index_name="todo-date-index",
+            partition_key=aws_dynamodb.Attribute(
+                name="PK", type=aws_dynamodb.AttributeType.STRING
+            ),
+            sort_key=aws_dynamodb.Attribute(
+                name="todo_date", type=aws_dynamodb.AttributeType.STRING
+            ),
+            projection_type=aws_dynamodb.ProjectionType.ALL,
+        )
+
+        # Sparse index for the open TODO items of a user ("OPEN_SK" is a copy of the "SK"
+        # that only exists while the TODO item is not done)
+        self.dynamodb_table.add_global_secondary_index(
+            index_name="open-todos-index",
+            partition_key=aws_dynamodb.Attribute(
+                name="PK", type=aws_dynamodb.AttributeType.STRING
+            ),
+            sort_key=aws_dynamodb.Attribute(
+                name="OPEN_SK", type=aws_dynamodb.AttributeType.STRING
+            ),
+            projection_type=aws_dynamodb.ProjectionType.ALL,
+        )
+
+    def create_secrets(self) -> None:
+        """
+        Create the secrets generated at deployment time for the Lambda Functions.
+        """
+
+        # Key to sign the pagination tokens (shared by all the Lambda containers)
+        self.pagination_token_secret = aws_secretsmanager.Secret(
+            self,
+            "Secret-PaginationToken",
+            description="Key to sign the pagination tokens of the TODO app",
+            generate_secret_string=aws_secretsmanager.SecretStringGenerator(
+                password_length=64,
+                exclude_punctuation=True,
+            ),
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
     def create_lambda_layers(self) -> None:
         """
         Create the Lambda layers that are necessary for the additional runtime
@@ -120,7 +172,31 @@ class BackendStack(Stack):
             environment={
                 "ENVIRONMENT": self.app_config["deployment_environment"],
                 "LOG_LEVEL": self.app_config["log_level"],
+                # Ratio of the requests that log their DEBUG records (full payloads)
+                "LOG_DEBUG_SAMPLE_RATE": "0.01",
                 "DYNAMODB_TABLE": self.dynamodb_table.table_name,
+                # Botocore configuration of the DynamoDB client (pool, timeouts, retries)
+                "DYNAMODB_MAX_WORKERS": "10",
+                "DYNAMODB_MAX_POOL_CONNECTIONS": "50",
+                "DYNAMODB_CONNECT_TIMEOUT": "2",
+                "DYNAMODB_READ_TIMEOUT": "5",
+                "DYNAMODB_RETRY_MODE": "adaptive",
+                "DYNAMODB_MAX_ATTEMPTS": "3",
+                "DYNAMODB_TCP_KEEPALIVE": "true",
+                # Secret to sign the pagination tokens (read on first use)
+                "PAGINATION_TOKEN_SECRET_ARN": self.pagination_token_secret.secret_arn,
+                # In-container read-through cache for the TODO reads (disabled, as the
+                # other containers can serve stale reads for up to the TTL after a write)
+                "TODOS_CACHE_TTL_SECONDS": "0",
+                "TODOS_CACHE_MAX_ITEMS": "1000",
+                # Hot-path timing metrics (CloudWatch EMF)
+                "TODOS_METRICS_ENABLED": "true",
+                "POWERTOOLS_METRICS_NAMESPACE": "TodoApp",
+                # Response compression (same threshold as the API-GW one)
+                "RESPONSE_COMPRESSION_MIN_SIZE": str(RESPONSE_COMPRESSION_MIN_SIZE),
+                # Idempotency-Key support for the TODO creations
+                "IDEMPOTENCY_TTL_SECONDS": "3600",
+                "IDEMPOTENCY_CACHE_MAX_ITEMS": "256",
             },
             layers=[
                 self.lambda_layer_powertools,
@@ -129,6 +205,7 @@ class BackendStack(Stack):
         )
 
         self.dynamodb_table.grant_read_write_data(self.lambda_todo_app)
+        self.pagination_token_secret.grant_read(self.lambda_todo_app)
 
     def create_rest_api(self):
         """
@@ -154,6 +231,10 @@ class BackendStack(Stack):
             ),
             cloud_watch_role=False,
             proxy=False,  # Proxy disabled to have more control
+            # Compressed responses from Lambda are base64-encoded (decoded by API-GW for
+            # all media types), and API-GW compresses the ones that are not compressed yet
+            binary_media_types=["*/*"],
+            min_compression_size=Size.bytes(RESPONSE_COMPRESSION_MIN_SIZE),
         )
 
         # API Key (used for authentication via "x-api-key" header in request)
@@ -198,6 +279,8 @@ class BackendStack(Stack):
         # Endpoints for "todos"resources
         root_resource_todos = root_resource_v1.add_resource("todos")
         todos_resource = root_resource_todos.add_resource("{todo_id}")
+        todos_export_resource = root_resource_todos.add_resource("export")
+        todos_stats_resource = root_resource_todos.add_resource("stats")
 
         # Define all API-Lambda integrations for the API methods
         api_lambda_integration_todos = aws_apigw.LambdaIntegration(self.lambda_todo_app)
@@ -209,6 +292,20 @@ class BackendStack(Stack):
         # API-Path: "/api/v1/todos/{todo_id}"
         todos_resource.add_method("GET", api_lambda_integration_todos)
 
+        # API-Path: "/api/v1/todos/export"
+        todos_export_resource.add_method("GET", api_lambda_integration_todos)
+
+        # API-Path: "/api/v1/todos/stats"
+        todos_stats_resource.add_method("GET", api_lambda_integration_todos)
+
+        # API-Path: "/api/v1/todos:batch"
+        todos_batch_resource = root_resource_v1.add_resource("todos:batch")
+        todos_batch_resource.add_method("POST", api_lambda_integration_todos)
+
+        # API-Path: "/api/v1/todos:bulk"
+        todos_bulk_resource = root_resource_v1.add_resource("todos:bulk")
+        todos_bulk_resource.add_method("PATCH", api_lambda_integration_todos)
+
         # API-Path: "/api/v1/docs"
         root_resource_docs.add_method("GET", api_lambda_integration_todos)
 
@@ -248,3 +345,9 @@ class BackendStack(Stack):
             any_method=True,  # To don't explicitly adding methods on the `proxy` resource
             default_integration=api_lambda_integration_todos,
         )
+
+        # Enable the custom methods for "/api/v1/todos:<method>" endpoints
+        root_resource_todos_batch = root_resource_v1.add_resource("todos:batch")
+        root_resource_todos_batch.add_method("POST", api_lambda_integration_todos)
+        root_resource_todos_bulk = root_resource_v1.add_resource("todos:bulk")
+        root_resource_todos_bulk.add_method("PATCH", api_lambda_integration_todos)
@@ -19,8 +19,11 @@ export DYNAMODB_TABLE=TESTING-LOCALLY
 # ONLY RUN ONCE:
 aws dynamodb create-table \
     --table-name TESTING-LOCALLY \
-    --attribute-definitions AttributeName=PK,AttributeType=S AttributeName=SK,AttributeType=S \
+    --attribute-definitions AttributeName=PK,AttributeType=S AttributeName=SK,AttributeType=S AttributeName=todo_date,AttributeType=S AttributeName=OPEN_SK,AttributeType=S \
     --key-schema AttributeName=PK,KeyType=HASH AttributeName=SK,KeyType=RANGE \
+    --global-secondary-indexes \
+        "IndexName=todo-date-index,KeySchema=[{AttributeName=PK,KeyType=HASH},{AttributeName=todo_date,KeyType=RANGE}],Projection={ProjectionType=ALL}" \
+        "IndexName=open-todos-index,KeySchema=[{AttributeName=PK,KeyType=HASH},{AttributeName=OPEN_SK,KeyType=RANGE}],Projection={ProjectionType=ALL}" \
     --billing-mode PAY_PER_REQUEST \
     --endpoint-url http://localhost:8000 \
     --region us-east-1
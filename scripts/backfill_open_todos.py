@@ -0,0 +1,92 @@
+###############################################################################
+# Backfill of the sparse "open TODOs" index key (OPEN_SK) for the TODO items
+# written before the index existed (they are missing from "is_done=false" lists)
+# --> Run with: "poe backfill-open-todos" (DYNAMODB_TABLE must be set)
+###############################################################################
+
+# Built-in imports
+import os
+import argparse
+
+# External imports
+from botocore.exceptions import ClientError
+
+# Own imports
+from todo_app.common.enums import DDBAttributes, DDBPrefixes
+from todo_app.helpers.dynamodb_helper import DynamoDBHelper
+
+
+# Open TODO items without the index key (done ones have "True", or a BOOL if legacy)
+MISSING_OPEN_SK_CONDITION = (
+    f"attribute_not_exists({DDBAttributes.OPEN_SK.value}) "
+    "AND NOT (is_done IN (:done, :legacy_done))"
+)
+MISSING_OPEN_SK_VALUES = {":done": str(True), ":legacy_done": True}
+
+
+def backfill_open_todos(
+    dynamodb_helper: DynamoDBHelper, page_size: int = 1000, dry_run: bool = False
+) -> dict:
+    """
+    Function to set the "OPEN_SK" of the open TODO items that do not have it, with a scan
+    of the table. Each update is conditioned on the item still being open and without
+    the key, so it's safe to run while the app is writing (and to run it again).
+    Returns the number of TODO items found and updated.
+    :param dynamodb_helper (DynamoDBHelper): Helper of the TODOs table.
+    :param page_size (int): Max number of items to scan per page.
+    :param dry_run (bool): Only count the TODO items to update (without updating them).
+    """
+    pages = dynamodb_helper.dynamodb_client.get_paginator("scan").paginate(
+        TableName=dynamodb_helper.table_name,
+        FilterExpression=f"begins_with(SK, :todo) AND {MISSING_OPEN_SK_CONDITION}",
+        ProjectionExpression="PK, SK",
+        ExpressionAttributeValues={
+            ":todo": {"S": DDBPrefixes.SK_TODO_DATA.value},
+            ":done": {"S": MISSING_OPEN_SK_VALUES[":done"]},
+            ":legacy_done": {"BOOL": MISSING_OPEN_SK_VALUES[":legacy_done"]},
+        },
+        PaginationConfig={"PageSize": page_size},
+    )
+
+    result = {"found": 0, "updated": 0}
+    for page in pages:
+        for todo_item in page.get("Items", []):
+            result["found"] += 1
+            if dry_run:
+                continue
+            sort_key = todo_item["SK"]["S"]
+            try:
+                dynamodb_helper.update_item(
+                    partition_key=todo_item["PK"]["S"],
+                    sort_key=sort_key,
+                    data_attributes_only={DDBAttributes.OPEN_SK.value: sort_key},
+                    condition_expression=(
+                        f"attribute_exists(PK) AND {MISSING_OPEN_SK_CONDITION}"
+                    ),
+                    condition_attribute_values=MISSING_OPEN_SK_VALUES,
+                )
+                result["updated"] += 1
+            except ClientError as error:
+                # Deleted, done or already in the index since the scan
+                if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise error
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    result = backfill_open_todos(
+        DynamoDBHelper(os.environ["DYNAMODB_TABLE"]),
+        page_size=args.page_size,
+        dry_run=args.dry_run,
+    )
+    print(f"Open TODO items without {DDBAttributes.OPEN_SK.value}: {result['found']}")
+    print(f"Open TODO items updated: {result['updated']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,174 @@
 # Built-in imports
 import os
+import asyncio
+import functools
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional
 
 # External imports
+from botocore.exceptions import ClientError
 from fastapi import HTTPException
 from ulid import ULID
 from aws_lambda_powertools import Logger
 
 # Own imports
 from todo_app.common.logger import custom_logger
-from todo_app.helpers.dynamodb_helper import DynamoDBHelper
-from todo_app.common.enums import DDBPrefixes
-from todo_app.models.todos import TodoModel, TodoModelUpdates
+from todo_app.common.metrics import record_timing
+from todo_app.helpers.dynamodb_helper import (
+    DynamoDBHelper,
+    TRANSACT_WRITE_MAX_ITEMS,
+    UnprocessedKeysError,
+    get_botocore_config,
+)
+from todo_app.helpers.async_dynamodb_helper import AsyncDynamoDBHelper
+from todo_app.helpers.cache import TTLCache
+from todo_app.helpers.idempotency import (
+    IdempotencyHelper,
+    IdempotencyInProgressError,
+    IdempotencyKeyReusedError,
+)
+from todo_app.helpers.etags import (
+    NotModifiedException,
+    compute_list_etag,
+    compute_todo_etag,
+    etag_matches,
+)
+from todo_app.helpers.dynamodb_serializer import deserialize_item, serialize_item
+from todo_app.helpers.pagination import (
+    decode_next_token,
+    encode_next_token,
+    is_secret_loaded,
+    load_secret,
+)
+from todo_app.common.enums import DDBAttributes, DDBIndexes, DDBPrefixes
+from todo_app.models.todos import (
+    TodoModel,
+    TodoModelUpdates,
+    TodoPartialModel,
+    TodosPage,
+    TodosPartialPage,
+    TodoStatsModel,
+)
 
 # Initialize DynamoDB helper for item's abstraction
 DYNAMODB_TABLE = os.environ.get("DYNAMODB_TABLE")
 ENDPOINT_URL = os.environ.get("ENDPOINT_URL")
-dynamodb_helper = DynamoDBHelper(DYNAMODB_TABLE, ENDPOINT_URL)
+DYNAMODB_MAX_WORKERS = int(os.environ.get("DYNAMODB_MAX_WORKERS", "10"))
+dynamodb_helper = DynamoDBHelper(
+    DYNAMODB_TABLE, ENDPOINT_URL, config=get_botocore_config()
+)
+async_dynamodb_helper = AsyncDynamoDBHelper(dynamodb_helper, DYNAMODB_MAX_WORKERS)
+
+# Initialize in-container read-through cache for TODO reads (disabled by default)
+# ! Note--> the writes only invalidate the cache of the container that served them, so the
+# other containers can return stale reads for up to the TTL when it's enabled
+todos_cache = TTLCache(
+    ttl_seconds=float(os.environ.get("TODOS_CACHE_TTL_SECONDS", "0")),
+    max_items=int(os.environ.get("TODOS_CACHE_MAX_ITEMS", "1000")),
+)
+
+# Initialize idempotency for the TODO creations (records in the same table, with TTL,
+# under a partition per user: "IDEMPOTENCY#<user_email>")
+create_todo_idempotency = IdempotencyHelper(
+    async_dynamodb_helper,
+    function_name="create_todo",
+    partition_key_prefix=DDBPrefixes.PK_IDEMPOTENCY.value,
+    expires_after_seconds=int(os.environ.get("IDEMPOTENCY_TTL_SECONDS", "3600")),
+    local_cache_max_items=int(os.environ.get("IDEMPOTENCY_CACHE_MAX_ITEMS", "256")),
+    in_progress_timeout_seconds=int(
+        os.environ.get("IDEMPOTENCY_IN_PROGRESS_TIMEOUT_SECONDS", "30")
+    ),
+)
+
+# Cache keys (within the user partition) for the pages of the TODOs list
+CACHE_LIST_PREFIX = "LIST#"
+
+# Max attempts for the transactions that are conditioned on the status of the TODO items
+TRANSACTION_MAX_ATTEMPTS = 3
+
+# Result of the bulk updates for the TODO items that do not exist
+_BULK_NOT_FOUND_RESULT = {"status": "failed", "error": "TODO item does not exist"}
+
+
+def _get_projection_attributes(fields: Optional[list[str]]) -> Optional[list[str]]:
+    """
+    Function to get the attributes to read for the given fields (None to read all of them).
+    The keys and <updated_at> are always read, as they are needed for the ETags.
+    :param fields (Optional(list[str])): Fields requested by the client.
+    """
+    if not fields:
+        return None
+    return list(dict.fromkeys(["PK", "SK", "updated_at", *fields]))
+
+
+def _is_done(todo_item: dict) -> bool:
+    """
+    Function to get the status of a TODO item in the DynamoDB format.
+    :param todo_item (dict): TODO item in the DynamoDB format.
+    """
+    # Stored as "True"/"False" strings (or BOOL for legacy items)
+    is_done = todo_item.get("is_done", {})
+    return is_done.get("S") == "True" or is_done.get("BOOL") is True
+
+
+def _is_transaction_condition_failure(error: ClientError) -> bool:
+    """
+    Function to check if a transaction was canceled by a failed condition.
+    :param error (ClientError): Error raised by <TransactWriteItems>.
+    """
+    if error.response["Error"]["Code"] != "TransactionCanceledException":
+        return False
+    return any(
+        reason.get("Code") == "ConditionalCheckFailed"
+        for reason in error.response.get("CancellationReasons", [])
+    )
+
+
+def _is_stats_condition_failure(error: ClientError) -> bool:
+    """
+    Function to check if a transaction was canceled because the user stats do not exist
+    (the stats update must be the last operation of the transaction).
+    :param error (ClientError): Error raised by <TransactWriteItems>.
+    """
+    reasons = error.response.get("CancellationReasons", [])
+    return bool(reasons) and reasons[-1].get("Code") == "ConditionalCheckFailed"
+
+
+def _get_status_condition(was_open: bool) -> tuple[str, dict]:
+    """
+    Function to get the condition of a write that the TODO item exists and has the status
+    that its stats deltas are based on.
+    :param was_open (bool): Status expected for the TODO item (True if it is not done).
+    """
+    # Done TODO items have "True" (or a BOOL for legacy items)
+    is_done_condition = "is_done IN (:done, :legacy_done)"
+    if was_open:
+        is_done_condition = f"NOT ({is_done_condition})"
+    return (
+        f"attribute_exists(PK) AND {is_done_condition}",
+        {":done": str(True), ":legacy_done": True},
+    )
+
+
+def _add_status_condition(operation: dict, was_open: bool) -> None:
+    """
+    Function to add the status condition (see <_get_status_condition>) to a transaction
+    operation (together with its own condition, if any), that returns the current TODO
+    item if the condition fails.
+    :param operation (dict): Transaction operation of the TODO item (low-level format).
+    :param was_open (bool): Status expected for the TODO item (True if it is not done).
+    """
+    condition_expression, condition_attribute_values = _get_status_condition(was_open)
+    (operation_params,) = operation.values()
+    if "ConditionExpression" in operation_params:
+        condition_expression = (
+            f"({operation_params['ConditionExpression']}) AND {condition_expression}"
+        )
+    operation_params["ConditionExpression"] = condition_expression
+    operation_params.setdefault("ExpressionAttributeValues", {}).update(
+        serialize_item(condition_attribute_values)
+    )
+    operation_params["ReturnValuesOnConditionCheckFailure"] = "ALL_OLD"
 
 
 class Todos:
@@ -32,69 +183,725 @@ class Todos:
         self.partition_key = f"{DDBPrefixes.PK_USER.value}{self.user_email}"
         self.logger = logger or custom_logger()
 
-    def get_all_todos(self) -> list:
+    async def get_all_todos(
+        self,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> TodosPage | TodosPartialPage:
         """
-        Method to get all TODO items for a given user.
+        Method to get a page of TODO items for a given user.
+        Raises <NotModifiedException> if the page matches the given ETag.
+        :param limit (int): Max number of TODO items to return in the page.
+        :param next_token (Optional(str)): Pagination token from a previous page.
+        :param if_none_match (Optional(str)): ETag(s) of the page already known by the client.
+        :param fields (Optional(list[str])): Fields to return (all if None).
         """
         self.logger.info(f"Retrieving all TODO items for user_email: {self.user_email}")
 
-        results = dynamodb_helper.query_by_pk_and_sk_begins_with(
-            partition_key=self.partition_key,
-            sort_key_portion="TODO#",
+        return await self._get_todos_page(
+            functools.partial(
+                async_dynamodb_helper.query_page_by_pk_and_sk_begins_with,
+                partition_key=self.partition_key,
+                sort_key_portion=DDBPrefixes.SK_TODO_DATA.value,
+            ),
+            query_scope="ALL",
+            limit=limit,
+            next_token=next_token,
+            if_none_match=if_none_match,
+            fields=fields,
         )
-        self.logger.debug(results)
+
+    async def get_todos_by_date_range(
+        self,
+        due_from: Optional[str] = None,
+        due_to: Optional[str] = None,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> TodosPage | TodosPartialPage:
+        """
+        Method to get a page of TODO items for a given user with a <todo_date> in a range
+        (inclusive), sorted by date. It queries the "todo_date" index, so that only the
+        TODO items in the range are read.
+        Raises <NotModifiedException> if the page matches the given ETag.
+        :param due_from (Optional(str)): Min TODO date (YYYY-MM-DD), unbounded if None.
+        :param due_to (Optional(str)): Max TODO date (YYYY-MM-DD), unbounded if None.
+        :param limit (int): Max number of TODO items to return in the page.
+        :param next_token (Optional(str)): Pagination token from a previous page.
+        :param if_none_match (Optional(str)): ETag(s) of the page already known by the client.
+        :param fields (Optional(list[str])): Fields to return (all if None).
+        """
+        self.logger.info(
+            f"Retrieving TODO items from {due_from} to {due_to} "
+            f"for user_email: {self.user_email}"
+        )
+
+        return await self._get_todos_page(
+            functools.partial(
+                async_dynamodb_helper.query_page_by_index_range,
+                index_name=DDBIndexes.TODO_DATE.value,
+                partition_key=self.partition_key,
+                range_key_name="todo_date",
+                range_from=due_from,
+                range_to=due_to,
+            ),
+            query_scope=f"DATE#{due_from or ''}#{due_to or ''}",
+            limit=limit,
+            next_token=next_token,
+            if_none_match=if_none_match,
+            fields=fields,
+        )
+
+    async def get_todos_by_status(
+        self,
+        is_done: bool,
+        limit: int = 50,
+        next_token: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> TodosPage | TodosPartialPage:
+        """
+        Method to get a page of TODO items for a given user by their status. The open ones
+        are read from the sparse "open TODOs" index (so the done ones are never read), and
+        the done ones are filtered from the user partition.
+        Raises <NotModifiedException> if the page matches the given ETag.
+        :param is_done (bool): Status of the TODO items to return.
+        :param limit (int): Max number of TODO items to return in the page.
+        :param next_token (Optional(str)): Pagination token from a previous page.
+        :param if_none_match (Optional(str)): ETag(s) of the page already known by the client.
+        :param fields (Optional(list[str])): Fields to return (all if None).
+        """
+        self.logger.info(
+            f"Retrieving TODO items with is_done: {is_done} "
+            f"for user_email: {self.user_email}"
+        )
+
+        if is_done:
+            # ! Note--> filters are applied after the read (pages can have less items)
+            query_page = functools.partial(
+                async_dynamodb_helper.query_page_by_pk_and_sk_begins_with,
+                partition_key=self.partition_key,
+                sort_key_portion=DDBPrefixes.SK_TODO_DATA.value,
+                filter_expression="is_done = :is_done",
+                filter_attribute_values={":is_done": str(True)},
+            )
+        else:
+            query_page = functools.partial(
+                async_dynamodb_helper.query_page_by_index_range,
+                index_name=DDBIndexes.OPEN_TODOS.value,
+                partition_key=self.partition_key,
+                range_key_name=DDBAttributes.OPEN_SK.value,
+            )
+
+        return await self._get_todos_page(
+            query_page,
+            query_scope=f"DONE#{is_done}",
+            limit=limit,
+            next_token=next_token,
+            if_none_match=if_none_match,
+            fields=fields,
+        )
+
+    async def _get_todos_page(
+        self,
+        query_page: Callable[..., Awaitable[tuple[list[dict], Optional[dict]]]],
+        query_scope: str,
+        limit: int,
+        next_token: Optional[str],
+        if_none_match: Optional[str],
+        fields: Optional[list[str]] = None,
+    ) -> TodosPage | TodosPartialPage:
+        """
+        Method to get a page of TODO items from a query (cached in the container).
+        Raises <NotModifiedException> if the page matches the given ETag.
+        :param query_page (Callable): Async query for a page of the user's TODO items.
+        :param query_scope (str): Index and filters of the query (e.g. "DONE#True"), as
+            the pagination tokens are only valid for the query that issued them.
+        :param limit (int): Max number of TODO items to return in the page.
+        :param next_token (Optional(str)): Pagination token from a previous page.
+        :param if_none_match (Optional(str)): ETag(s) of the page already known by the client.
+        :param fields (Optional(list[str])): Fields to return (all if None).
+        """
+        if not is_secret_loaded():
+            # Read once per container (from Secrets Manager), outside the event loop
+            await async_dynamodb_helper.run_blocking(load_secret)
+        exclusive_start_key = self._get_exclusive_start_key(next_token, query_scope)
+        cache_key = f"{CACHE_LIST_PREFIX}{query_scope}#{limit}#{next_token or ''}"
+        if fields:
+            cache_key = f"{cache_key}#FIELDS#{','.join(fields)}"
+        cached_page = todos_cache.get(self.partition_key, cache_key)
+        if cached_page is not None:
+            self.logger.info("Retrieved TODO items page from cache")
+            results, last_evaluated_key = cached_page
+        else:
+            results, last_evaluated_key = await query_page(
+                limit=limit,
+                exclusive_start_key=exclusive_start_key,
+                deserialize=False,
+                projection_attributes=_get_projection_attributes(fields),
+            )
+            todos_cache.set(
+                self.partition_key,
+                cache_key,
+                (results, last_evaluated_key),
+                item_count=max(len(results), 1),
+            )
         self.logger.info(f"Items from query: {len(results)}")
-        return results
 
-    def get_todo_by_ulid(self, ulid: str) -> dict:
+        response_next_token = encode_next_token(last_evaluated_key, query_scope)
+        self._check_not_modified(
+            if_none_match,
+            compute_list_etag(
+                ((item["SK"]["S"], item["updated_at"]["S"]) for item in results),
+                response_next_token,
+                fields,
+            ),
+        )
+
+        todos = self._to_models(results, fields)
+        self.logger.debug(todos)
+        page_model = TodosPartialPage if fields else TodosPage
+        return page_model.model_construct(items=todos, next_token=response_next_token)
+
+    async def get_todos_by_ulids(
+        self,
+        ulids: list[str],
+        if_none_match: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> TodosPage | TodosPartialPage:
+        """
+        Method to get multiple TODO items by their ULIDs with batch reads.
+        Non-existing TODO items are skipped, and the order of the ULIDs is kept.
+        Raises <NotModifiedException> if the items match the given ETag.
+        :param ulids (list[str]): ULIDs for the specific TODO items.
+        :param if_none_match (Optional(str)): ETag(s) of the items already known by the client.
+        :param fields (Optional(list[str])): Fields to return (all if None). The full items
+            are read (and cached), as the batch reads are shared with the item cache.
+        """
+        self.logger.info(
+            f"Retrieving {len(ulids)} TODO items by ULID for user_email: {self.user_email}"
+        )
+
+        unique_ulids = list(dict.fromkeys(ulids))
+        sort_keys = [f"{DDBPrefixes.SK_TODO_DATA.value}{ulid}" for ulid in unique_ulids]
+
+        # Only the TODO items that are not cached are requested to DynamoDB
+        results = []
+        missing_sort_keys = []
+        for sort_key in sort_keys:
+            cached_item = todos_cache.get(self.partition_key, sort_key)
+            if cached_item is not None:
+                results.append(cached_item)
+            else:
+                missing_sort_keys.append(sort_key)
+
+        if missing_sort_keys:
+            try:
+                missing_results = await async_dynamodb_helper.batch_get(
+                    [(self.partition_key, sort_key) for sort_key in missing_sort_keys]
+                )
+            except UnprocessedKeysError as error:
+                self.logger.warning(f"Batch get of the TODO items failed: {error}")
+                raise HTTPException(
+                    status_code=503,
+                    detail="TODO items could not be read, please retry",
+                    headers={"Retry-After": "1"},
+                )
+            for item in missing_results:
+                todos_cache.set(self.partition_key, item["SK"]["S"], item)
+            results.extend(missing_results)
+        self.logger.info(
+            f"Items from batch get: {len(results)} "
+            f"({len(sort_keys) - len(missing_sort_keys)} from cache)"
+        )
+
+        items_by_sort_key = {item["SK"]["S"]: item for item in results}
+        ordered_items = [
+            items_by_sort_key[sort_key]
+            for sort_key in sort_keys
+            if sort_key in items_by_sort_key
+        ]
+        self._check_not_modified(
+            if_none_match,
+            compute_list_etag(
+                ((item["SK"]["S"], item["updated_at"]["S"]) for item in ordered_items),
+                fields=fields,
+            ),
+        )
+
+        todos = self._to_models(ordered_items, fields)
+        page_model = TodosPartialPage if fields else TodosPage
+        return page_model.model_construct(items=todos, next_token=None)
+
+    async def iter_all_todos(
+        self, page_size: int = 100
+    ) -> AsyncIterator[list[TodoModel]]:
+        """
+        Method to iterate over all TODO items for a given user, one query page at a time.
+        :param page_size (int): Max number of TODO items to fetch per query page.
+        """
+        self.logger.info(f"Iterating all TODO items for user_email: {self.user_email}")
+
+        total_items = 0
+        async for results in async_dynamodb_helper.iter_query_pages_by_pk_and_sk_begins_with(
+            partition_key=self.partition_key,
+            sort_key_portion=DDBPrefixes.SK_TODO_DATA.value,
+            limit=page_size,
+            deserialize=False,
+        ):
+            total_items += len(results)
+            with record_timing("serialize_ms"):
+                todos = TodoModel.from_dynamodb_items(results)
+            yield todos
+        self.logger.info(f"Items from iteration: {total_items}")
+
+    def _to_models(
+        self, dynamodb_items: list[dict], fields: Optional[list[str]] = None
+    ) -> list[TodoModel] | list[TodoPartialModel]:
+        """
+        Method to convert the TODO items read from the table into (partial) models.
+        All the items are validated at once (see <TodoModel.from_dynamodb_items>).
+        :param dynamodb_items (list[dict]): TODO items in the DynamoDB format.
+        :param fields (Optional(list[str])): Fields to return (all if None).
+        """
+        with record_timing("serialize_ms"):
+            if fields:
+                return TodoPartialModel.from_dynamodb_items(dynamodb_items, fields)
+            return TodoModel.from_dynamodb_items(dynamodb_items)
+
+    def _check_not_modified(self, if_none_match: Optional[str], etag: str) -> None:
+        """
+        Method to stop processing a read (before the model conversion and serialization)
+        when the client already has the current version of the resource.
+        :param if_none_match (Optional(str)): ETag(s) from the <If-None-Match> header.
+        :param etag (str): Current ETag of the resource.
+        """
+        if etag_matches(if_none_match, etag):
+            self.logger.info(f"Resource not modified for ETag: {etag}")
+            raise NotModifiedException(etag)
+
+    def _get_exclusive_start_key(
+        self, next_token: Optional[str], query_scope: str
+    ) -> Optional[dict]:
+        """
+        Method to decode a pagination token and validate that it belongs to the user and
+        to the same query.
+        :param next_token (Optional(str)): Pagination token from a previous page.
+        :param query_scope (str): Index and filters of the query.
+        """
+        if not next_token:
+            return None
+
+        try:
+            exclusive_start_key = decode_next_token(next_token, query_scope)
+        except ValueError as error:
+            self.logger.error(f"Invalid pagination token received: {error}")
+            raise HTTPException(status_code=400, detail=f"Invalid next_token: {error}")
+
+        # Tokens are only valid for the partition (user) that generated them
+        if exclusive_start_key.get("PK") != self.partition_key:
+            self.logger.error("Pagination token does not belong to the user")
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid next_token: token does not belong to the user",
+            )
+        return exclusive_start_key
+
+    async def get_todo_by_ulid(
+        self,
+        ulid: str,
+        if_none_match: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+    ) -> dict:
         """
         Method to get a TODO item by its ULID.
+        Raises <NotModifiedException> if the TODO item matches the given ETag.
         :param ulid (str): ULID for a specific TODO item.
+        :param if_none_match (Optional(str)): ETag(s) of the TODO item already known by the client.
+        :param fields (Optional(list[str])): Fields to return (all if None).
         """
         self.logger.info(
             f"Retrieving TODO item by ULID: {ulid} for user_email: {self.user_email}"
         )
 
-        result = dynamodb_helper.get_item_by_pk_and_sk(
-            partition_key=self.partition_key,
-            sort_key=f"TODO#{ulid}",
-        )
+        sort_key = f"{DDBPrefixes.SK_TODO_DATA.value}{ulid}"
+        result = todos_cache.get(self.partition_key, sort_key)
+        if result is not None:
+            self.logger.info("Retrieved TODO item from cache")
+        else:
+            result = await async_dynamodb_helper.get_item_by_pk_and_sk(
+                partition_key=self.partition_key,
+                sort_key=sort_key,
+                projection_attributes=_get_projection_attributes(fields),
+            )
+            # Only the full items are cached (projections are built from them)
+            if result and not fields:
+                todos_cache.set(self.partition_key, sort_key, result)
 
-        formatted_todo = TodoModel.from_dynamodb_item(result) if result else {}
+        if result:
+            self._check_not_modified(
+                if_none_match,
+                compute_todo_etag(result["SK"]["S"], result["updated_at"]["S"], fields),
+            )
+        formatted_todo = self._to_models([result], fields)[0] if result else {}
         self.logger.debug(formatted_todo)
         return formatted_todo
 
-    def create_todo(self, todo_data: dict) -> Optional[TodoModel]:
+    async def create_todo(
+        self,
+        todo_data: dict,
+        idempotency_key: Optional[str] = None,
+        remaining_time_in_millis: Optional[int] = None,
+    ) -> Optional[TodoModel]:
         """
         Method to create a new TODO item.
+        With an idempotency key, the retries of the same request (within the expiration of
+        the key) return the TODO item created by the first one, without any writes.
         :param todo_data (dict): Data for the new TODO item.
+        :param idempotency_key (Optional(str)): Key sent by the client for the request.
+        :param remaining_time_in_millis (Optional(int)): Time left for the invocation.
         """
-        todo_data["PK"] = self.partition_key
-        todo_data["SK"] = f"TODO#{ULID()}"
-        current_time = datetime.now().isoformat()
-        todo_data["created_at"] = current_time
-        todo_data["updated_at"] = current_time
+        if not idempotency_key:
+            return await self._create_todo(todo_data)
+
+        async def create_todo_response() -> dict:
+            # Copy, as the keys added to the TODO data would change the payload hash
+            todo = await self._create_todo(dict(todo_data))
+            return todo.model_dump() if todo else {}
+
+        try:
+            response = await create_todo_idempotency.run(
+                idempotency_key=idempotency_key,
+                scope=self.user_email,
+                payload=todo_data,
+                operation=create_todo_response,
+                remaining_time_in_millis=remaining_time_in_millis,
+            )
+        except IdempotencyInProgressError as error:
+            self.logger.error(f"create_todo failed for: {error}")
+            raise HTTPException(
+                status_code=409,
+                detail="A request with the same Idempotency-Key is in progress",
+            )
+        except IdempotencyKeyReusedError as error:
+            self.logger.error(f"create_todo failed for: {error}")
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key was already used with a different payload",
+            )
+
+        # Stored responses were validated when the TODO item was created
+        return TodoModel.model_construct(**response) if response else {}
 
-        todo = TodoModel(**todo_data)
+    async def _create_todo(self, todo_data: dict) -> Optional[TodoModel]:
+        """
+        Method to write a new TODO item (and its user stats).
+        :param todo_data (dict): Data for the new TODO item.
+        """
+        todo = self._build_todo(todo_data)
 
-        result = dynamodb_helper.put_item(todo.to_dynamodb_dict())
+        # The TODO item and the user stats are written atomically
+        todo_item = todo.to_dynamodb_dict()
+        transact_items = [
+            {"Put": {"Item": todo_item}},
+            self._get_stats_update(total_delta=1, open_delta=int(not todo.is_done)),
+        ]
+        try:
+            result = await async_dynamodb_helper.transact_write(transact_items)
+        except ClientError as error:
+            if not _is_stats_condition_failure(error):
+                raise error
+            # Nothing was written, so the recount does not include the new TODO item
+            await self._recount_stats()
+            result = await async_dynamodb_helper.transact_write(transact_items)
         self.logger.debug(result)
 
         if result.get("ResponseMetadata", {}).get("HTTPStatusCode") == 200:
+            self._update_cache(todo.SK, todo_item)
             return todo
 
         return {}
 
-    def patch_todo(self, ulid: str, todo_data: dict) -> Optional[TodoModel]:
+    async def create_todos(self, todos_data: list[dict]) -> list[dict]:
+        """
+        Method to create multiple TODO items with batch writes.
+        Returns the per-item results, in the same order as the input items.
+        :param todos_data (list[dict]): Data for each of the new TODO items.
+        """
+        self.logger.info(
+            f"Creating {len(todos_data)} TODO items for user_email: {self.user_email}"
+        )
+
+        todos = [self._build_todo(todo_data) for todo_data in todos_data]
+        failed_items = await async_dynamodb_helper.batch_write(
+            [todo.to_dynamodb_dict() for todo in todos]
+        )
+        failed_sort_keys = {item["SK"]["S"] for item in failed_items}
+        self.logger.info(f"Items not created from batch: {len(failed_sort_keys)}")
+
+        created_todos = [todo for todo in todos if todo.SK not in failed_sort_keys]
+        if created_todos:
+            await self._add_created_todos_to_stats(created_todos)
+
+        todos_cache.invalidate_partition(self.partition_key, CACHE_LIST_PREFIX)
+        for todo in todos:
+            if todo.SK not in failed_sort_keys:
+                todos_cache.set(self.partition_key, todo.SK, todo.to_dynamodb_dict())
+
+        return [
+            (
+                {"status": "failed", "error": "TODO item could not be written"}
+                if todo.SK in failed_sort_keys
+                else {"status": "created", "todo": todo}
+            )
+            for todo in todos
+        ]
+
+    async def _add_created_todos_to_stats(self, created_todos: list[TodoModel]) -> None:
+        """
+        Method to add the TODO items written by a batch to the user stats.
+        ! Note--> batch writes can't be transactional, so the stats are updated after them
+        (with a single update, retried on errors). The counters can miss the new TODO items
+        until then, and if all the attempts fail they stay wrong until the "STATS" item is
+        deleted (and recounted on the next read), which is logged as an error.
+        The counters can also drift when the "STATS" item is missing and a concurrent
+        request recounts it between the batch write and this update: the recount already
+        includes the new TODO items, so they are counted twice. It's only possible for the
+        first writes of a user without stats, and it's fixed the same way (deleting it).
+        :param created_todos (list[TodoModel]): TODO items that were written.
+        """
+        total_delta = len(created_todos)
+        open_delta = sum(1 for todo in created_todos if not todo.is_done)
+        for attempt in range(TRANSACTION_MAX_ATTEMPTS):
+            try:
+                await async_dynamodb_helper.update_item(
+                    partition_key=self.partition_key,
+                    sort_key=DDBPrefixes.SK_USER_STATS.value,
+                    data_attributes_only={"updated_at": datetime.now().isoformat()},
+                    condition_expression="attribute_exists(PK)",
+                    add_attributes={
+                        "total_todos": total_delta,
+                        "open_todos": open_delta,
+                    },
+                )
+                return
+            except ClientError as error:
+                if error.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    # The recount already includes the TODO items that were written
+                    await self._recount_stats()
+                    return
+                self.logger.warning(
+                    f"Stats update failed for {total_delta} created TODO items "
+                    f"(attempt {attempt + 1} of {TRANSACTION_MAX_ATTEMPTS}): {error}"
+                )
+
+        self.logger.error(
+            f"Stats of user_email {self.user_email} are missing {total_delta} created "
+            f"TODO items ({open_delta} open), delete its STATS item to recount them"
+        )
+
+    def _build_todo(self, todo_data: dict) -> TodoModel:
+        """
+        Method to build a new TODO item with its keys (ULID) and timestamps.
+        :param todo_data (dict): Data for the new TODO item.
+        """
+        todo_data["PK"] = self.partition_key
+        todo_data["SK"] = f"{DDBPrefixes.SK_TODO_DATA.value}{ULID()}"
+        current_time = datetime.now().isoformat()
+        todo_data["created_at"] = current_time
+        todo_data["updated_at"] = current_time
+
+        return TodoModel(**todo_data)
+
+    def _get_stats_update(self, total_delta: int, open_delta: int) -> dict:
+        """
+        Method to build the transaction operation that updates the user stats. It's
+        conditioned on the existence of the "STATS" item, which is created by a recount of
+        the TODO items (see <_recount_stats>) when it's missing.
+        :param total_delta (int): Change in the total number of TODO items.
+        :param open_delta (int): Change in the number of open (not done) TODO items.
+        """
+        return {
+            "Update": dynamodb_helper.get_update_request(
+                partition_key=self.partition_key,
+                sort_key=DDBPrefixes.SK_USER_STATS.value,
+                data_attributes_only={"updated_at": datetime.now().isoformat()},
+                condition_expression="attribute_exists(PK)",
+                add_attributes={"total_todos": total_delta, "open_todos": open_delta},
+            )
+        }
+
+    async def _write_with_stats(
+        self,
+        sort_key: str,
+        get_operation: Callable[
+            [bool, Optional[dict]], Optional[tuple[dict, int, int]]
+        ],
+        was_open: bool,
+        todo_item: Optional[dict] = None,
+    ) -> Optional[dict]:
+        """
+        Method to write a TODO item and the user stats in a single transaction. The write
+        is conditioned on the existence of the TODO item and on the status that the stats
+        deltas are based on, so the TODO item is only read (to retry the write with its
+        current status) when it did not have the expected one.
+        Returns the last version of the TODO item that was read before the write (an empty
+        dict if it was not read), or None if the TODO item does not exist.
+        :param sort_key (str): Sort key of the TODO item to write.
+        :param get_operation (Callable): Function that receives the status of the TODO
+            item (True if open) and its current version (if known), and returns its
+            transaction operation, the total delta and the open delta (or None to skip
+            the write, e.g. when it would not change the current version).
+        :param was_open (bool): Status expected for the TODO item in the first attempt.
+        :param todo_item (Optional(dict)): Current version of the TODO item (if known).
+        """
+        todo_item = todo_item or {}
+        for attempt in range(TRANSACTION_MAX_ATTEMPTS):
+            write = get_operation(was_open, todo_item or None)
+            if write is None:
+                return todo_item
+            operation, total_delta, open_delta = write
+            _add_status_condition(operation, was_open)
+            transact_items = [operation]
+            with_stats = bool(total_delta or open_delta)
+            if with_stats:
+                transact_items.append(self._get_stats_update(total_delta, open_delta))
+
+            try:
+                result = await async_dynamodb_helper.transact_write(transact_items)
+                self.logger.debug(result)
+                return todo_item
+            except ClientError as error:
+                if not _is_transaction_condition_failure(error):
+                    raise error
+                if with_stats and _is_stats_condition_failure(error):
+                    # Nothing was written, so it's retried once the stats are recounted
+                    await self._recount_stats()
+                    continue
+                # The current TODO item is returned by DynamoDB with the failed condition
+                todo_item = error.response["CancellationReasons"][0].get("Item")
+
+            if todo_item is None:
+                todo_item = await async_dynamodb_helper.get_item_by_pk_and_sk(
+                    partition_key=self.partition_key,
+                    sort_key=sort_key,
+                    consistent_read=True,
+                )
+            if not todo_item:
+                return None
+            was_open = not _is_done(todo_item)
+            self.logger.info(
+                f"TODO item {sort_key} changed since it was expected "
+                f"(attempt {attempt + 1} of {TRANSACTION_MAX_ATTEMPTS})"
+            )
+
+        raise HTTPException(
+            status_code=409,
+            detail=f"TODO item {sort_key} was modified concurrently, please retry",
+        )
+
+    async def get_todo_stats(self) -> TodoStatsModel:
+        """
+        Method to get the TODO counters of the user (single read of its "STATS" item).
+        """
+        self.logger.info(f"Retrieving TODO stats for user_email: {self.user_email}")
+
+        result = await async_dynamodb_helper.get_item_by_pk_and_sk(
+            partition_key=self.partition_key,
+            sort_key=DDBPrefixes.SK_USER_STATS.value,
+        )
+        if not result:
+            return await self._recount_stats()
+        return TodoStatsModel.from_dynamodb_item(result)
+
+    async def _recount_stats(self) -> TodoStatsModel:
+        """
+        Method to create the user stats from a count of its TODO items (a lazy backfill for
+        the users that existed before the stats). The stats updates are conditioned on the
+        existence of the "STATS" item, so the transactions of the user fail (and are
+        retried after the recount) instead of changing the counted TODO items meanwhile.
+        """
+        self.logger.info(f"Recounting TODO stats for user_email: {self.user_email}")
+
+        pages = async_dynamodb_helper.iter_query_pages_by_pk_and_sk_begins_with(
+            partition_key=self.partition_key,
+            sort_key_portion=DDBPrefixes.SK_TODO_DATA.value,
+            limit=1000,
+            deserialize=False,
+            projection_attributes=["is_done"],
+        )
+        total_todos = open_todos = 0
+        async for todo_items in pages:
+            total_todos += len(todo_items)
+            open_todos += sum(1 for todo_item in todo_items if not _is_done(todo_item))
+
+        try:
+            await async_dynamodb_helper.update_item(
+                partition_key=self.partition_key,
+                sort_key=DDBPrefixes.SK_USER_STATS.value,
+                data_attributes_only={
+                    "updated_at": datetime.now().isoformat(),
+                    "total_todos": total_todos,
+                    "open_todos": open_todos,
+                },
+                condition_expression="attribute_not_exists(PK)",
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise error
+            # Recounted concurrently (with the same TODO items)
+            self.logger.info("TODO stats were already recounted")
+
+        return TodoStatsModel(
+            total_todos=total_todos,
+            open_todos=open_todos,
+            done_todos=total_todos - open_todos,
+        )
+
+    def _update_cache(self, sort_key: str, todo_item: Optional[dict] = None) -> None:
+        """
+        Method to keep the in-container cache consistent after a write of a TODO item.
+        The list pages of the user are invalidated, and the item is written through
+        (or invalidated when no item is given).
+        :param sort_key (str): Sort key of the TODO item that was written.
+        :param todo_item (Optional(dict)): TODO item in the DynamoDB format.
+        """
+        todos_cache.invalidate_partition(self.partition_key, CACHE_LIST_PREFIX)
+        if todo_item:
+            todos_cache.set(self.partition_key, sort_key, todo_item)
+        else:
+            todos_cache.delete(self.partition_key, sort_key)
+
+    async def patch_todo(self, ulid: str, todo_data: dict) -> Optional[TodoModel]:
         """
         Method to patch an existing TODO item.
         :param ulid (str): ULID for a specific TODO item.
         :param todo_data (dict): Data for the new TODO item.
         """
 
-        # Validate that TODO item exists
-        existing_todo_item = self.get_todo_by_ulid(ulid)
-        if not existing_todo_item:
+        current_time = datetime.now().isoformat()
+        todo_data["updated_at"] = current_time
+        sort_key = f"{DDBPrefixes.SK_TODO_DATA.value}{ulid}"
+        if "is_done" in todo_data:
+            # Status changes also update the user stats (in the same transaction)
+            return await self._patch_todo_status(ulid, sort_key, todo_data)
+
+        # Single round trip: the condition validates that TODO item exists
+        try:
+            result = await async_dynamodb_helper.update_item(
+                partition_key=self.partition_key,
+                sort_key=sort_key,
+                data_attributes_only=todo_data,
+                condition_expression="attribute_exists(PK)",
+                return_values="ALL_NEW",
+            )
+        except ClientError as error:
+            self._update_cache(sort_key)
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise error
             self.logger.error(
                 f"patch_todo failed due to non-existing TODO item to update: {ulid}"
             )
@@ -103,33 +910,319 @@ class Todos:
                 detail=f"TODO patch request for ULID {ulid} "
                 "is not valid because item does not exist",
             )
-
-        current_time = datetime.now().isoformat()
-        todo_data["updated_at"] = current_time
-
-        result = dynamodb_helper.update_item(
-            partition_key=self.partition_key,
-            sort_key=f"TODO#{ulid}",
-            data_attributes_only=todo_data,
-        )
         self.logger.debug(result)
 
         if result.get("ResponseMetadata", {}).get("HTTPStatusCode") == 200:
-            return self.get_todo_by_ulid(ulid)
+            with record_timing("serialize_ms"):
+                todo = TodoModel(**result["Attributes"])
+            self._update_cache(sort_key, todo.to_dynamodb_dict())
+            return todo
 
+        self._update_cache(sort_key)
         return {}
 
-    def delete_todo(self, ulid: str) -> Optional[TodoModel]:
+    async def _patch_todo_status(
+        self, ulid: str, sort_key: str, todo_data: dict
+    ) -> TodoModel:
         """
-        Method to delete an existing TODO item.
+        Method to patch an existing TODO item that includes its status, together with the
+        user stats (when the status changes) in a single transaction.
         :param ulid (str): ULID for a specific TODO item.
+        :param sort_key (str): Sort key of the TODO item.
+        :param todo_data (dict): Data for the new TODO item (including "is_done").
+        """
+        is_done = bool(todo_data["is_done"])
+        attributes, remove_attributes = self._get_patch_attributes(sort_key, todo_data)
+        status_only = set(todo_data) <= {"is_done", "updated_at"}
+
+        def get_operation(
+            was_open: bool, todo_item: Optional[dict]
+        ) -> Optional[tuple[dict, int, int]]:
+            if status_only and todo_item and was_open != is_done:
+                # Already in the requested status (read with the failed condition)
+                return None
+            operation = {
+                "Update": dynamodb_helper.get_update_request(
+                    partition_key=self.partition_key,
+                    sort_key=sort_key,
+                    data_attributes_only=attributes,
+                    remove_attributes=remove_attributes,
+                )
+            }
+            return operation, 0, int(not is_done) - int(was_open)
+
+        # Most status patches change the status, so that one is expected. The transactions
+        # can't return the TODO item, so it's read at the same time for the response
+        current_item, todo_item = await asyncio.gather(
+            self._write_with_stats(sort_key, get_operation, was_open=is_done),
+            async_dynamodb_helper.get_item_by_pk_and_sk(
+                partition_key=self.partition_key, sort_key=sort_key
+            ),
+        )
+        if current_item is None:
+            self._update_cache(sort_key)
+            self.logger.warning(
+                f"patch_todo failed due to non-existing TODO item to update: {ulid}"
+            )
+            raise HTTPException(
+                status_code=400,
+                detail=f"TODO patch request for ULID {ulid} "
+                "is not valid because item does not exist",
+            )
+        if status_only and current_item and _is_done(current_item) == is_done:
+            # Nothing was written, so the current version is the response
+            with record_timing("serialize_ms"):
+                todo = TodoModel(**deserialize_item(current_item))
+            self._update_cache(sort_key, todo.to_dynamodb_dict())
+            return todo
+        if not todo_item:
+            # Eventually consistent read of a TODO item that was just created
+            todo_item = await async_dynamodb_helper.get_item_by_pk_and_sk(
+                partition_key=self.partition_key,
+                sort_key=sort_key,
+                consistent_read=True,
+            )
+            if not todo_item:
+                # Deleted right after the patch
+                self._update_cache(sort_key)
+                return {}
+
+        # The new version is the one that was read with the patched attributes
+        todo_item = {**todo_item, **serialize_item(attributes)}
+        for attribute in remove_attributes:
+            todo_item.pop(attribute, None)
+        with record_timing("serialize_ms"):
+            todo = TodoModel(**deserialize_item(todo_item))
+        self._update_cache(sort_key, todo.to_dynamodb_dict())
+        return todo
+
+    def _get_patch_attributes(
+        self, sort_key: str, todo_data: dict
+    ) -> tuple[dict, list[str]]:
+        """
+        Method to get the attributes to set and to remove for a patch of a TODO item.
+        :param sort_key (str): Sort key of the TODO item.
         :param todo_data (dict): Data for the new TODO item.
         """
+        attributes = dict(todo_data)
+        remove_attributes = []
+        if "is_done" in attributes:
+            is_done = bool(attributes["is_done"])
+            # Key of the sparse "open TODOs" index only exists while the TODO is not done
+            if is_done:
+                remove_attributes.append(DDBAttributes.OPEN_SK.value)
+            else:
+                attributes[DDBAttributes.OPEN_SK.value] = sort_key
+            # Same format as the one used by <TodoModel.to_dynamodb_dict>
+            attributes["is_done"] = str(is_done)
+        return attributes, remove_attributes
 
-        # Validate that TODO item exists
-        existing_todo_item = self.get_todo_by_ulid(ulid)
-        if not existing_todo_item:
-            self.logger.error(
+    async def patch_todos(self, ulids: list[str], todo_data: dict) -> list[dict]:
+        """
+        Method to patch multiple TODO items with the same update, atomically in transactions
+        of up to 100 TODO items (each one conditioned on the existence of its TODO item).
+        Status updates also update the user stats in the same transactions, conditioned on
+        the status of each TODO item (only the ones that did not have the expected status
+        are read, to retry them). Returns the per-item results, in the same order as the
+        unique ULIDs.
+        :param ulids (list[str]): ULIDs of the TODO items to patch.
+        :param todo_data (dict): Data to update in all the TODO items.
+        """
+        self.logger.info(
+            f"Patching {len(ulids)} TODO items for user_email: {self.user_email}"
+        )
+
+        todo_data["updated_at"] = datetime.now().isoformat()
+        unique_ulids = list(dict.fromkeys(ulids))
+        sort_keys = [f"{DDBPrefixes.SK_TODO_DATA.value}{ulid}" for ulid in unique_ulids]
+        # Status updates expect the status of the TODO items to change, and one operation
+        # of each transaction is kept for the user stats
+        expected_open = None
+        if "is_done" in todo_data:
+            expected_open = dict.fromkeys(sort_keys, bool(todo_data["is_done"]))
+        chunk_size = TRANSACT_WRITE_MAX_ITEMS - int(expected_open is not None)
+
+        results = {}
+        pending_sort_keys = sort_keys
+        for attempt in range(TRANSACTION_MAX_ATTEMPTS):
+            if not pending_sort_keys:
+                break
+
+            retry_sort_keys = []
+            for index in range(0, len(pending_sort_keys), chunk_size):
+                retry_sort_keys.extend(
+                    await self._patch_todos_chunk(
+                        pending_sort_keys[index : index + chunk_size],
+                        todo_data,
+                        expected_open,
+                        results,
+                    )
+                )
+            if retry_sort_keys:
+                self.logger.warning(
+                    f"{len(retry_sort_keys)} TODO items must be retried "
+                    f"(attempt {attempt + 1} of {TRANSACTION_MAX_ATTEMPTS})"
+                )
+            pending_sort_keys = retry_sort_keys
+
+        for sort_key in pending_sort_keys:
+            results[sort_key] = {
+                "status": "failed",
+                "error": "TODO item was modified concurrently, please retry",
+            }
+
+        todos_cache.invalidate_partition(self.partition_key, CACHE_LIST_PREFIX)
+        for sort_key in sort_keys:
+            todos_cache.delete(self.partition_key, sort_key)
+
+        return [
+            {"todo_id": ulid, **results[sort_key]}
+            for ulid, sort_key in zip(unique_ulids, sort_keys)
+        ]
+
+    async def _patch_todos_chunk(
+        self,
+        sort_keys: list[str],
+        todo_data: dict,
+        expected_open: Optional[dict],
+        results: dict,
+    ) -> list[str]:
+        """
+        Method to patch a chunk of TODO items in a single transaction (all of them or none).
+        The results of the chunk are added to <results>, and the sort keys of the TODO
+        items that must be retried are returned.
+        :param sort_keys (list[str]): Sort keys of the TODO items of the chunk.
+        :param todo_data (dict): Data to update in all the TODO items.
+        :param expected_open (Optional(dict)): Expected status of each TODO item (True if
+            open), by sort key. Updated with the current status of the ones that failed
+            their condition (only for status updates).
+        :param results (dict): Per-item results, by sort key.
+        """
+        transact_items = []
+        open_delta = 0
+        for sort_key in sort_keys:
+            attributes, remove_attributes = self._get_patch_attributes(
+                sort_key, todo_data
+            )
+            operation = {
+                "Update": dynamodb_helper.get_update_request(
+                    partition_key=self.partition_key,
+                    sort_key=sort_key,
+                    data_attributes_only=attributes,
+                    condition_expression="attribute_exists(PK)",
+                    remove_attributes=remove_attributes,
+                )
+            }
+            if expected_open is not None:
+                # Conditioned on the status that the stats delta is based on
+                _add_status_condition(operation, expected_open[sort_key])
+                open_delta += int(not todo_data["is_done"]) - int(
+                    expected_open[sort_key]
+                )
+            transact_items.append(operation)
+        if open_delta:
+            transact_items.append(self._get_stats_update(0, open_delta))
+
+        try:
+            result = await async_dynamodb_helper.transact_write(transact_items)
+            self.logger.debug(result)
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "TransactionCanceledException":
+                raise error
+            if open_delta and _is_stats_condition_failure(error):
+                await self._recount_stats()
+
+            # Nothing was written: the TODO items that failed their condition do not exist
+            # or have another status (then they are retried with their current status)
+            retry_sort_keys = []
+            failed_items = {}
+            reasons = error.response.get("CancellationReasons", [])
+            for sort_key, reason in zip(sort_keys, reasons):
+                if reason.get("Code") != "ConditionalCheckFailed":
+                    retry_sort_keys.append(sort_key)
+                elif expected_open is None:
+                    results[sort_key] = _BULK_NOT_FOUND_RESULT
+                else:
+                    failed_items[sort_key] = reason.get("Item")
+
+            unknown_sort_keys = [
+                sort_key for sort_key, item in failed_items.items() if item is None
+            ]
+            if unknown_sort_keys:
+                try:
+                    todo_items = await async_dynamodb_helper.batch_get(
+                        [
+                            (self.partition_key, sort_key)
+                            for sort_key in unknown_sort_keys
+                        ],
+                        consistent_read=True,
+                    )
+                except UnprocessedKeysError as error:
+                    # Their status is still unknown, so they are retried as they were
+                    self.logger.warning(
+                        f"Status of the failed TODO items could not be read: {error}"
+                    )
+                    retry_sort_keys.extend(unknown_sort_keys)
+                    todo_items = []
+                    for sort_key in unknown_sort_keys:
+                        del failed_items[sort_key]
+                failed_items.update((item["SK"]["S"], item) for item in todo_items)
+            for sort_key, todo_item in failed_items.items():
+                if todo_item is None:
+                    results[sort_key] = _BULK_NOT_FOUND_RESULT
+                else:
+                    expected_open[sort_key] = not _is_done(todo_item)
+                    retry_sort_keys.append(sort_key)
+            return retry_sort_keys
+
+        for sort_key in sort_keys:
+            results[sort_key] = {"status": "updated"}
+        return []
+
+    async def delete_todo(
+        self, ulid: str, return_deleted: bool = False
+    ) -> Optional[TodoModel]:
+        """
+        Method to delete an existing TODO item (and update the user stats).
+        :param ulid (str): ULID for a specific TODO item.
+        :param return_deleted (bool): Return the deleted TODO item in the response.
+        """
+
+        # The TODO item is deleted together with the update of the user stats
+        sort_key = f"{DDBPrefixes.SK_TODO_DATA.value}{ulid}"
+        read_item = None
+        if return_deleted:
+            # ! Note--> transactions can't return the deleted item, so it's read before
+            read_item = await async_dynamodb_helper.get_item_by_pk_and_sk(
+                partition_key=self.partition_key,
+                sort_key=sort_key,
+                consistent_read=True,
+            )
+
+        def get_operation(
+            was_open: bool, todo_item: Optional[dict]
+        ) -> tuple[dict, int, int]:
+            delete_params = {
+                "Key": {"PK": {"S": self.partition_key}, "SK": {"S": sort_key}},
+            }
+            if return_deleted:
+                # The deleted version must be the one that was read (else it's read again)
+                delete_params["ConditionExpression"] = "updated_at = :read_updated_at"
+                delete_params["ExpressionAttributeValues"] = {
+                    ":read_updated_at": todo_item["updated_at"]
+                }
+            return {"Delete": delete_params}, -1, -int(was_open)
+
+        # Deletes expect an open TODO item, unless it was read (with its current status)
+        was_open = not _is_done(read_item) if read_item else True
+        deleted_item = None
+        if read_item != {}:
+            deleted_item = await self._write_with_stats(
+                sort_key, get_operation, was_open=was_open, todo_item=read_item
+            )
+        self._update_cache(sort_key)
+        if deleted_item is None:
+            self.logger.warning(
                 f"delete_todo failed due to non-existing TODO item to delete: {ulid}"
             )
             raise HTTPException(
@@ -138,10 +1231,8 @@ class Todos:
                 "is not valid because item does not exist",
             )
 
-        result = dynamodb_helper.delete_item(
-            partition_key=self.partition_key,
-            sort_key=f"TODO#{ulid}",
-        )
-        self.logger.debug(result)
+        if return_deleted:
+            with record_timing("serialize_ms"):
+                return TodoModel(**deserialize_item(deleted_item))
 
         return {}
@@ -7,9 +7,13 @@ import os
 
 # External imports
 from mangum import Mangum
+from mangum.adapter import DEFAULT_TEXT_MIME_TYPES
 from fastapi import FastAPI
 
 # Own imports
+from todo_app.api.v1.middlewares.compression import CompressionMiddleware
+from todo_app.api.v1.middlewares.log_context import LogContextMiddleware
+from todo_app.api.v1.middlewares.metrics import MetricsMiddleware
 from todo_app.api.v1.routers import (
     todos,
 )
@@ -17,6 +21,11 @@ from todo_app.api.v1.routers import (
 # Environment used to dynamically load the FastAPI docs with stages
 ENVIRONMENT = os.environ.get("ENVIRONMENT")
 
+# Min size (bytes) of the responses to compress (same value as the API-GW one)
+RESPONSE_COMPRESSION_MIN_SIZE = int(
+    os.environ.get("RESPONSE_COMPRESSION_MIN_SIZE", "1024")
+)
+
 
 app = FastAPI(
     title="TODOs APP FastAPI",
@@ -30,5 +39,19 @@ app = FastAPI(
 
 app.include_router(todos.router, prefix="/api/v1")
 
+# Compression of the responses based on the "Accept-Encoding" of the requests
+app.add_middleware(CompressionMiddleware, minimum_size=RESPONSE_COMPRESSION_MIN_SIZE)
+
+# Hot-path timing metrics for each request (published as CloudWatch EMF)
+app.add_middleware(MetricsMiddleware)
+
+# Request-scoped logging context (added last, so the other middlewares log with it)
+app.add_middleware(LogContextMiddleware)
+
 # This is the Lambda Function's entrypoint (handler)
-handler = Mangum(app)
+# ! Note--> Mangum sends the bodies that are not valid UTF-8 (e.g. gzip) base64-encoded,
+# and API-GW decodes them, as all the media types are configured as binary in the API
+# (the NDJSON exports are text, to avoid the base64 overhead when not compressed)
+handler = Mangum(
+    app, text_mime_types=[*DEFAULT_TEXT_MIME_TYPES, "application/x-ndjson"]
+)
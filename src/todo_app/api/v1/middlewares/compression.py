@@ -0,0 +1,181 @@
+# Built-in imports
+import zlib
+from typing import Optional
+
+# External imports
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Own imports
+from todo_app.common.metrics import record_timing
+
+# Brotli is optional (only used when the package is installed)
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses the responses with "br" (if available) or "gzip",
+    based on the <Accept-Encoding> of the request. Responses smaller than the threshold
+    are sent uncompressed, and streaming responses are compressed chunk by chunk.
+    All the responses that could be compressed have "Vary: Accept-Encoding" (also the
+    uncompressed ones), so the caches keep one version per encoding.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """
+        :param app (ASGIApp): Application to wrap.
+        :param minimum_size (int): Min size (bytes) of the responses to compress.
+        :param gzip_level (int): Compression level for gzip (1-9).
+        :param brotli_quality (int): Compression quality for brotli (0-11).
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """
+    Wrapper of the ASGI <send> of a request, that compresses the response body.
+    """
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send
+    ) -> None:
+        """
+        :param middleware (CompressionMiddleware): Middleware with the configuration.
+        :param encoding (Optional(str)): Content encoding to use ("br" or "gzip"), None
+            if the client does not accept any of them.
+        :param send (Send): Original ASGI send function.
+        """
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Optional[Message] = None
+        self._compressor = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if self.encoding is None:
+                self._passthrough = True
+                _add_vary_header(message)
+                await self._send(message)
+                return
+            # Delayed until the first body chunk, to know if it has to be compressed
+            self._start_message = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start_message is not None:
+            start_message, self._start_message = self._start_message, None
+            headers = MutableHeaders(raw=start_message["headers"])
+            if "content-encoding" in headers or (
+                not more_body and len(body) < self.middleware.minimum_size
+            ):
+                self._passthrough = True
+                _add_vary_header(start_message)
+                await self._send(start_message)
+                await self._send(message)
+                return
+
+            self._compressor = self._new_compressor()
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            if not more_body:
+                body = self._compress(body, finish=True)
+                headers["Content-Length"] = str(len(body))
+                await self._send(start_message)
+                await self._send({**message, "body": body})
+                return
+            await self._send(start_message)
+
+        await self._send(
+            {**message, "body": self._compress(body, finish=not more_body)}
+        )
+
+    def _new_compressor(self):
+        if self.encoding == "br":
+            return brotli.Compressor(quality=self.middleware.brotli_quality)
+        # A "wbits" of 31 produces a gzip container (header and trailer)
+        return zlib.compressobj(self.middleware.gzip_level, zlib.DEFLATED, 31)
+
+    def _compress(self, body: bytes, finish: bool) -> bytes:
+        """
+        Method to compress a body chunk (flushed, so that each chunk can be sent).
+        :param body (bytes): Body chunk to compress.
+        :param finish (bool): Whether it's the last body chunk.
+        """
+        with record_timing("compress_ms"):
+            if self.encoding == "br":
+                compressed = self._compressor.process(body)
+                return compressed + (
+                    self._compressor.finish() if finish else self._compressor.flush()
+                )
+            return self._compressor.compress(body) + self._compressor.flush(
+                zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH
+            )
+
+
+def _add_vary_header(start_message: Message) -> None:
+    """
+    Function to add "Vary: Accept-Encoding" to a response that is sent uncompressed,
+    unless it was already encoded by the app (so the middleware would never compress it).
+    :param start_message (Message): ASGI "http.response.start" message of the response.
+    """
+    headers = MutableHeaders(raw=start_message["headers"])
+    if "content-encoding" not in headers:
+        headers.add_vary_header("Accept-Encoding")
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Function to select the content encoding to use from an <Accept-Encoding> header.
+    Returns "br" (only if available), "gzip" or None (no compression).
+    :param accept_encoding (str): Value of the <Accept-Encoding> header.
+    """
+    accepted = {}
+    for value in accept_encoding.lower().split(","):
+        coding, _, parameters = value.strip().partition(";")
+        quality = 1.0
+        parameter_name, _, parameter_value = parameters.strip().partition("=")
+        if parameter_name.strip() == "q":
+            try:
+                quality = float(parameter_value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best_encoding, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
@@ -0,0 +1,25 @@
+# Built-in imports
+from uuid import uuid4
+
+# External imports
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Own imports
+from todo_app.common.logger import start_log_context
+
+
+class LogContextMiddleware:
+    """
+    ASGI middleware that starts a new logging context for each request, with its
+    "correlation_id" (from the "correlation-id" header, or a new one) and debug sampling.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            correlation_id = Headers(scope=scope).get("correlation-id")
+            start_log_context(correlation_id=correlation_id or str(uuid4()))
+        await self.app(scope, receive, send)
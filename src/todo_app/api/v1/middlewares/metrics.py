@@ -0,0 +1,135 @@
+# Built-in imports
+import time
+import functools
+import asyncio
+from typing import Any, Callable
+
+# External imports
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Own imports
+from todo_app.api.v1.services.responses import ModelJSONResponse
+from todo_app.common.logger import custom_logger
+from todo_app.common.metrics import (
+    add_items_returned,
+    get_request_metrics,
+    start_request_metrics,
+)
+
+logger = custom_logger()
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that collects the hot-path metrics of each request, and publishes
+    them as CloudWatch EMF (with "route" and "status" dimensions) after the response.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_metrics = start_request_metrics()
+        if request_metrics is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            try:
+                request_metrics.flush(route=_get_route_name(scope), status=status_code)
+            except Exception as e:
+                logger.warning(f"Metrics could not be published: {e}")
+
+
+class MetricsRoute(APIRoute):
+    """
+    Route that measures the serialization of the endpoint results into the response
+    (<SerializeMs>) and counts the returned items (<ItemsReturned>).
+    """
+
+    def get_route_handler(self) -> Callable:
+        endpoint = self.dependant.call
+        if asyncio.iscoroutinefunction(endpoint):
+
+            @functools.wraps(endpoint)
+            async def endpoint_with_metrics(*args, **kwargs) -> Any:
+                result = await endpoint(*args, **kwargs)
+                request_metrics = get_request_metrics()
+                if request_metrics is not None:
+                    request_metrics.endpoint_finished_at = time.perf_counter()
+                    add_items_returned(_count_items(result))
+                return result
+
+            self.dependant.call = endpoint_with_metrics
+
+        route_handler = super().get_route_handler()
+
+        async def route_handler_with_metrics(request: Request) -> Response:
+            response = await route_handler(request)
+            request_metrics = get_request_metrics()
+            if request_metrics and request_metrics.endpoint_finished_at is not None:
+                request_metrics.serialize_ms += (
+                    time.perf_counter() - request_metrics.endpoint_finished_at
+                ) * 1000
+            return response
+
+        return route_handler_with_metrics
+
+
+def _get_route_name(scope: Scope) -> str:
+    """
+    Function to get the route template (not the path) of a request, to keep a low
+    cardinality for the "route" dimension.
+    :param scope (Scope): ASGI scope of the request (after routing).
+    """
+    route = scope.get("route")
+    if route is None and "endpoint" in scope:
+        # Non-API routes (e.g. docs) only set their endpoint in the scope
+        route = next(
+            (
+                app_route
+                for app_route in scope["app"].routes
+                if getattr(app_route, "endpoint", None) is scope["endpoint"]
+            ),
+            None,
+        )
+    return f"{scope['method']} {route.path}" if route is not None else "unmatched"
+
+
+def _count_items(result: Any) -> int:
+    """
+    Function to count the TODO items in the results of an endpoint.
+    :param result (Any): Results returned by the endpoint.
+    """
+    if isinstance(result, ModelJSONResponse):
+        result = result.model
+    if isinstance(result, BaseModel):
+        items = getattr(result, "items", None)
+        return len(items) if isinstance(items, list) else 1
+    if isinstance(result, dict):
+        if isinstance(result.get("items"), list):
+            return len(result["items"])
+        if isinstance(result.get("results"), list):
+            return len(result["results"])
+        return 1 if result else 0
+    if isinstance(result, list):
+        return len(result)
+    return 0
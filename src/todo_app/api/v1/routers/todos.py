@@ -1,62 +1,227 @@
 # Built-in imports
-from typing import Annotated
-from uuid import uuid4
+from datetime import date
+from typing import Annotated, Optional
 
 # External imports
-from fastapi import APIRouter, Header
-from aws_lambda_powertools import Logger
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 # Own imports
 from todo_app.access_patterns.todos import Todos
-from todo_app.api.v1.schemas.schema import Schema
+from todo_app.api.v1.middlewares.metrics import MetricsRoute
 from todo_app.api.v1.services.exceptions import SchemaValidationException
-from todo_app.api.v1.services.validator import validate_json
-from todo_app.common.enums import JSONSchemaType
+from todo_app.api.v1.services.responses import ModelJSONResponse
+from todo_app.api.v1.services.validator import get_validator, validate_json
+from todo_app.common.enums import JSONSchemaType, SchemaOperation
+from todo_app.common.logger import append_log_keys, custom_logger
+from todo_app.common.metrics import add_items_returned, record_timing
+from todo_app.helpers.etags import (
+    NotModifiedException,
+    compute_list_etag,
+    compute_todo_etag,
+)
+from todo_app.models.todos import (
+    TODO_PROJECTABLE_FIELDS,
+    TodosPage,
+    TodosPartialPage,
+    TodoStatsModel,
+)
 
 
-logger = Logger(
-    service="todo-app",
-    log_uncaught_exceptions=True,
-    owner="Santiago Garcia Arango",
-)
+logger = custom_logger()
+
+router = APIRouter(route_class=MetricsRoute)
+
+# Page sizes for the TODOs list endpoint
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
 
-router = APIRouter()
+# Max number of TODO items per batch request
+MAX_BATCH_ITEMS = 500
 
+# Max number of ULIDs per list request (bounded by the API-GW max URL length)
+MAX_BATCH_GET_IDS = 300
 
-@router.get("/todos", tags=["todos"])
+
+# ! Note--> the responses are sent as-is (<ModelJSONResponse>), so the model is only for
+# the docs, which must include the partial pages (<fields> projections)
+@router.get("/todos", tags=["todos"], response_model=TodosPage | TodosPartialPage)
 async def read_all_todos(
     user_email: str,
-    correlation_id: Annotated[str | None, Header()] = uuid4(),
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    next_token: Optional[str] = None,
+    ids: Annotated[
+        Optional[str], Query(description="Comma-separated ULIDs of the TODO items")
+    ] = None,
+    due_from: Annotated[
+        Optional[date], Query(description="Min TODO date (inclusive)")
+    ] = None,
+    due_to: Annotated[
+        Optional[date], Query(description="Max TODO date (inclusive)")
+    ] = None,
+    is_done: Annotated[
+        Optional[bool], Query(description="Status of the TODO items to return")
+    ] = None,
+    fields: Annotated[
+        Optional[str],
+        Query(description="Comma-separated fields to return (all if None)"),
+    ] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
     try:
-        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        append_log_keys(user_email=user_email)
         logger.info("Starting todos handler for read_all_todos()")
 
+        projected_fields = _parse_fields(fields)
         todo = Todos(user_email=user_email, logger=logger)
-        result = todo.get_all_todos()
-        logger.info("Finished read_todo_item() successfully")
-        return result
+        if ids is not None:
+            ulids = [ulid.strip() for ulid in ids.split(",") if ulid.strip()]
+            if not 0 < len(ulids) <= MAX_BATCH_GET_IDS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"ids must have between 1 and {MAX_BATCH_GET_IDS} ULIDs",
+                )
+            if due_from or due_to or is_done is not None:
+                raise HTTPException(
+                    status_code=400,
+                    detail="ids can not be combined with due_from, due_to or is_done",
+                )
+            result = await todo.get_todos_by_ulids(
+                ulids=ulids, if_none_match=if_none_match, fields=projected_fields
+            )
+        elif due_from or due_to:
+            if is_done is not None:
+                raise HTTPException(
+                    status_code=400,
+                    detail="is_done can not be combined with due_from or due_to",
+                )
+            if due_from and due_to and due_from > due_to:
+                raise HTTPException(
+                    status_code=400, detail="due_from must be before due_to"
+                )
+            result = await todo.get_todos_by_date_range(
+                due_from=due_from.isoformat() if due_from else None,
+                due_to=due_to.isoformat() if due_to else None,
+                limit=limit,
+                next_token=next_token,
+                if_none_match=if_none_match,
+                fields=projected_fields,
+            )
+        elif is_done is not None:
+            result = await todo.get_todos_by_status(
+                is_done=is_done,
+                limit=limit,
+                next_token=next_token,
+                if_none_match=if_none_match,
+                fields=projected_fields,
+            )
+        else:
+            result = await todo.get_all_todos(
+                limit=limit,
+                next_token=next_token,
+                if_none_match=if_none_match,
+                fields=projected_fields,
+            )
+        logger.info("Finished read_all_todos() successfully")
+        return ModelJSONResponse(
+            result,
+            headers={"ETag": _get_list_etag(result, projected_fields)},
+            exclude_unset=projected_fields is not None,
+        )
+
+    except NotModifiedException as e:
+        logger.info("Finished read_all_todos() with TODO items not modified")
+        return Response(status_code=304, headers={"ETag": e.etag})
 
     except Exception as e:
         logger.error(f"Error in read_all_todos(): {e}")
         raise e
 
 
+# ! Note--> must be declared before "/todos/{todo_id}" to take precedence
+@router.get("/todos/export", tags=["todos"])
+async def export_todos(
+    user_email: str,
+):
+    try:
+        append_log_keys(user_email=user_email)
+        logger.info("Starting todos handler for export_todos()")
+
+        todo = Todos(user_email=user_email, logger=logger)
+
+        async def generate_ndjson_lines():
+            # Only one query page is kept in memory at a time
+            async for todos in todo.iter_all_todos():
+                with record_timing("serialize_ms"):
+                    lines = "".join(f"{item.model_dump_json()}\n" for item in todos)
+                add_items_returned(len(todos))
+                yield lines
+            logger.info("Finished export_todos() successfully")
+
+        return StreamingResponse(
+            generate_ndjson_lines(), media_type="application/x-ndjson"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in export_todos(): {e}")
+        raise e
+
+
+# ! Note--> must be declared before "/todos/{todo_id}" to take precedence
+@router.get("/todos/stats", tags=["todos"], response_model=TodoStatsModel)
+async def read_todo_stats(
+    user_email: str,
+):
+    try:
+        append_log_keys(user_email=user_email)
+        logger.info("Starting todos handler for read_todo_stats()")
+
+        todo = Todos(user_email=user_email, logger=logger)
+        result = await todo.get_todo_stats()
+
+        logger.info("Finished read_todo_stats() successfully")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in read_todo_stats(): {e}")
+        raise e
+
+
 @router.get("/todos/{todo_id}", tags=["todos"])
 async def read_todo_item(
     user_email: str,
     todo_id: str,
-    correlation_id: Annotated[str | None, Header()] = uuid4(),
+    response: Response,
+    fields: Annotated[
+        Optional[str],
+        Query(description="Comma-separated fields to return (all if None)"),
+    ] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
     try:
-        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        append_log_keys(user_email=user_email)
         logger.info("Starting todos handler for read_todo_item()")
 
+        projected_fields = _parse_fields(fields)
         todo = Todos(user_email=user_email, logger=logger)
-        result = todo.get_todo_by_ulid(ulid=todo_id)
+        result = await todo.get_todo_by_ulid(
+            ulid=todo_id, if_none_match=if_none_match, fields=projected_fields
+        )
         logger.info("Finished read_todo_item() successfully")
+        if not result:
+            return result
+
+        etag = compute_todo_etag(result.SK, result.updated_at, projected_fields)
+        if projected_fields:
+            # Partial models only send the requested fields
+            return ModelJSONResponse(result, headers={"ETag": etag}, exclude_unset=True)
+        response.headers["ETag"] = etag
         return result
 
+    except NotModifiedException as e:
+        logger.info("Finished read_todo_item() with TODO item not modified")
+        return Response(status_code=304, headers={"ETag": e.etag})
+
     except Exception as e:
         logger.error(f"Error in read_todo_item(): {e}")
         raise e
@@ -64,26 +229,38 @@ async def read_todo_item(
 
 @router.post("/todos", tags=["todos"])
 async def create_todo_item(
+    request: Request,
     todo_details: dict,
-    correlation_id: Annotated[str | None, Header()] = uuid4(),
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
 ):
     try:
         # Inject additional keys to the logger for cross-referencing logs
         user_email = todo_details.get("user_email")
-        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        append_log_keys(user_email=user_email)
 
         # Validate payload with JSON-Schema
-        todos_schema = Schema(JSONSchemaType.TODOS, logger=logger).get_schema()
         validation_result = validate_json(
-            data=todo_details, json_schema=todos_schema, logger=logger
+            data=todo_details,
+            validator=get_validator(JSONSchemaType.TODOS, SchemaOperation.CREATE),
+            logger=logger,
         )
         if isinstance(validation_result, Exception):
             raise SchemaValidationException(todo_details, validation_result)
         logger.info("Starting todos handler for create_todo_item()")
 
         # After schema validation, it's safe to load the TODO element
+        # Retries with the same "Idempotency-Key" header return the first response
+        lambda_context = request.scope.get("aws.context")
         todos = Todos(user_email=user_email, logger=logger)
-        result = todos.create_todo_item(todo_details)
+        result = await todos.create_todo(
+            todo_details,
+            idempotency_key=idempotency_key,
+            remaining_time_in_millis=(
+                lambda_context.get_remaining_time_in_millis()
+                if lambda_context
+                else None
+            ),
+        )
 
         logger.info("Finished create_todo_item() successfully")
         return result
@@ -93,30 +270,141 @@ async def create_todo_item(
         raise e
 
 
+@router.post("/todos:batch", tags=["todos"])
+async def create_todo_items_batch(
+    todos_details: list[dict],
+):
+    try:
+        logger.info("Starting todos handler for create_todo_items_batch()")
+
+        if not 0 < len(todos_details) <= MAX_BATCH_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Batch requests must have between 1 and {MAX_BATCH_ITEMS} items",
+            )
+
+        # Validate each payload with JSON-Schema (invalid items are reported, not written)
+        validator = get_validator(JSONSchemaType.TODOS, SchemaOperation.CREATE)
+        results = [None] * len(todos_details)
+        valid_indexes_by_user = {}
+        for index, todo_details in enumerate(todos_details):
+            validation_result = validate_json(
+                data=todo_details, validator=validator, logger=logger
+            )
+            if isinstance(validation_result, Exception):
+                results[index] = {
+                    "status": "failed",
+                    "error": SchemaValidationException(
+                        todo_details, validation_result
+                    ).detail,
+                }
+                continue
+            valid_indexes_by_user.setdefault(todo_details["user_email"], []).append(
+                index
+            )
+
+        # After schema validation, it's safe to load the TODO elements
+        for user_email, indexes in valid_indexes_by_user.items():
+            todos = Todos(user_email=user_email, logger=logger)
+            user_results = await todos.create_todos(
+                [todos_details[index] for index in indexes]
+            )
+            for index, result in zip(indexes, user_results):
+                results[index] = result
+
+        created = sum(1 for result in results if result["status"] == "created")
+        logger.info(
+            f"Finished create_todo_items_batch() with {created} items created "
+            f"and {len(results) - created} items failed"
+        )
+        return {
+            "created": created,
+            "failed": len(results) - created,
+            "results": [
+                {"index": index, **result} for index, result in enumerate(results)
+            ],
+        }
+
+    except Exception as e:
+        logger.error(f"Error in create_todo_items_batch(): {e}")
+        raise e
+
+
+@router.patch("/todos:bulk", tags=["todos"])
+async def patch_todo_items_bulk(
+    user_email: str,
+    bulk_details: dict,
+):
+    try:
+        append_log_keys(user_email=user_email)
+        logger.info("Starting todos handler for patch_todo_items_bulk()")
+
+        ulids = bulk_details.get("ids")
+        todo_details = bulk_details.get("update")
+        if (
+            not isinstance(ulids, list)
+            or not 0 < len(ulids) <= MAX_BATCH_ITEMS
+            or not all(isinstance(ulid, str) and ulid for ulid in ulids)
+        ):
+            raise HTTPException(
+                status_code=400,
+                detail=f"ids must be a list with between 1 and {MAX_BATCH_ITEMS} ULIDs",
+            )
+        if not isinstance(todo_details, dict) or not todo_details:
+            raise HTTPException(
+                status_code=400,
+                detail="update must be an object with the fields to patch",
+            )
+
+        # Validate the update once with JSON-Schema (it's the same for all the items)
+        validation_result = validate_json(
+            data=todo_details,
+            validator=get_validator(JSONSchemaType.TODOS, SchemaOperation.PATCH),
+            logger=logger,
+        )
+        if isinstance(validation_result, Exception):
+            raise SchemaValidationException(todo_details, validation_result)
+
+        todo = Todos(user_email=user_email, logger=logger)
+        results = await todo.patch_todos(ulids=ulids, todo_data=todo_details)
+
+        updated = sum(1 for result in results if result["status"] == "updated")
+        logger.info(
+            f"Finished patch_todo_items_bulk() with {updated} items updated "
+            f"and {len(results) - updated} items failed"
+        )
+        return {
+            "updated": updated,
+            "failed": len(results) - updated,
+            "results": results,
+        }
+
+    except Exception as e:
+        logger.error(f"Error in patch_todo_items_bulk(): {e}")
+        raise e
+
+
 @router.patch("/todos/{todo_id}", tags=["todos"])
 async def patch_todo_item(
     user_email: str,
     todo_id: str,
     todo_details: dict,
-    correlation_id: Annotated[str | None, Header()] = uuid4(),
 ):
     try:
-        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        append_log_keys(user_email=user_email)
         logger.info("Starting todos handler for patch_todo_item()")
 
-        # Validate payload with JSON-Schema
-        todos_schema = Schema(JSONSchemaType.TODOS, logger=logger).get_schema()
-        todos_schema.pop(
-            "required", None
-        )  # For patch, do not enforce mandatory fields in schema
+        # Validate payload with JSON-Schema (patch does not enforce mandatory fields)
         validation_result = validate_json(
-            data=todo_details, json_schema=todos_schema, logger=logger
+            data=todo_details,
+            validator=get_validator(JSONSchemaType.TODOS, SchemaOperation.PATCH),
+            logger=logger,
         )
         if isinstance(validation_result, Exception):
             raise SchemaValidationException(todo_details, validation_result)
 
         todo = Todos(user_email=user_email, logger=logger)
-        result = todo.patch_todo(ulid=todo_id, todo_data=todo_details)
+        result = await todo.patch_todo(ulid=todo_id, todo_data=todo_details)
 
         logger.info("Finished patch_todo_item() successfully")
         return result
@@ -130,14 +418,14 @@ async def patch_todo_item(
 async def delete_todo_item(
     user_email: str,
     todo_id: str,
-    correlation_id: Annotated[str | None, Header()] = uuid4(),
+    return_deleted: bool = False,
 ):
     try:
-        logger.append_keys(correlation_id=correlation_id, user_email=user_email)
+        append_log_keys(user_email=user_email)
         logger.info("Starting todos handler for delete_todo_item()")
 
         todo = Todos(user_email=user_email, logger=logger)
-        result = todo.delete_todo(ulid=todo_id)
+        result = await todo.delete_todo(ulid=todo_id, return_deleted=return_deleted)
 
         logger.info("Finished delete_todo_item() successfully")
         return result
@@ -145,3 +433,37 @@ async def delete_todo_item(
     except Exception as e:
         logger.error(f"Error in delete_todo_item(): {e}")
         raise e
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """
+    Function to parse the <fields> query parameter into the list of fields to return, in
+    a canonical order (so that equivalent requests share their cache entries and ETags).
+    :param fields (Optional(str)): Comma-separated fields to return (all if None).
+    """
+    if fields is None:
+        return None
+
+    requested_fields = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown_fields = requested_fields.difference(TODO_PROJECTABLE_FIELDS)
+    if unknown_fields:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown_fields))}. "
+            f"Valid fields are: {', '.join(TODO_PROJECTABLE_FIELDS)}",
+        )
+    return [field for field in TODO_PROJECTABLE_FIELDS if field in requested_fields]
+
+
+def _get_list_etag(
+    result: TodosPage | TodosPartialPage, fields: Optional[list[str]] = None
+) -> str:
+    """
+    Function to get the ETag of a list response (same as the one used for <If-None-Match>).
+    :param result (TodosPage | TodosPartialPage): List response with the TODO items and
+        the next token.
+    :param fields (Optional(list[str])): Fields returned (all if None).
+    """
+    return compute_list_etag(
+        ((todo.SK, todo.updated_at) for todo in result.items), result.next_token, fields
+    )
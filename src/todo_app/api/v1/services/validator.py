@@ -1,35 +1,87 @@
 # Built-in imports
+from functools import lru_cache
 from typing import Union, Literal, Optional
 
 # External imports
 import jsonschema
-from jsonschema._format import FormatChecker
+from jsonschema import FormatChecker
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
 
 from aws_lambda_powertools import Logger
 
 # Own imports
+from todo_app.api.v1.schemas.schema import Schema
+from todo_app.common.enums import JSONSchemaType, SchemaOperation
 from todo_app.common.logger import custom_logger
+from todo_app.common.metrics import record_timing
+
+
+@lru_cache(maxsize=None)
+def get_validator(
+    json_schema_type: JSONSchemaType,
+    operation: SchemaOperation = SchemaOperation.CREATE,
+) -> Validator:
+    """
+    Returns the compiled JSON Schema validator for a schema type and operation. The schema
+    is loaded, checked and compiled only once per process, and then reused across requests.
+
+    :param json_schema_type (JSONSchemaType): Enumeration for the JSON Schema type.
+    :param operation (SchemaOperation): Operation that the payload is validated for.
+    """
+    json_schema = Schema(json_schema_type).get_schema()
+    if operation == SchemaOperation.PATCH:
+        # For patch, do not enforce mandatory fields in schema
+        json_schema.pop("required", None)
+
+    validator_class = jsonschema.validators.validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    return validator_class(
+        json_schema,
+        # Required to also validate "format" fields in schema (only the used formats)
+        format_checker=FormatChecker(formats=_get_schema_formats(json_schema)),
+    )
+
+
+def _get_schema_formats(json_schema: Union[dict, list]) -> set[str]:
+    """
+    Returns the "format" values used in a JSON Schema, so the format checker only keeps
+    their checkers (instead of all the ones registered by jsonschema).
+
+    :param json_schema (Union[dict, list]): JSON Schema (or any of its sub-schemas).
+    """
+    formats = set()
+    if isinstance(json_schema, dict):
+        if isinstance(json_schema.get("format"), str):
+            formats.add(json_schema["format"])
+        for value in json_schema.values():
+            formats |= _get_schema_formats(value)
+    elif isinstance(json_schema, list):
+        for value in json_schema:
+            formats |= _get_schema_formats(value)
+    return formats
 
 
 def validate_json(
     data: dict,
-    json_schema: dict,
+    validator: Validator,
     logger: Optional[Logger] = None,
 ) -> Union[Literal[True], Exception]:
     """
-    Generic validation function to apply a JSON Schema validation based on payload and a schema.
+    Generic validation function to apply a JSON Schema validation based on payload and a
+    compiled validator (see <get_validator>).
 
     :param data (dict): JSON object.
-    :param json_schema (dict): JSON Schema to use for the validation.
+    :param validator (Validator): Compiled JSON Schema validator to use for the validation.
     :param logger (Optional(Logger)): Logger object.
     """
     logger = logger or custom_logger()
     try:
-        jsonschema.validate(
-            instance=data,
-            schema=json_schema,
-            format_checker=FormatChecker(),  # Required to also validate "format" fields in schema
-        )
+        # Same error selection as <jsonschema.validate>, without re-checking the schema
+        with record_timing("validation_ms"):
+            validation_error = best_match(validator.iter_errors(data))
+        if validation_error is not None:
+            raise validation_error
     except jsonschema.ValidationError as validation_error:
         logger.error(
             "JSONSchema ValidationError occurred. "
@@ -37,13 +89,6 @@ def validate_json(
             f"json_path: {validation_error.json_path}"
         )
         return validation_error
-    except jsonschema.SchemaError as schema_error:
-        logger.error(
-            "JSONSchema SchemaError occured. "
-            f"message: {schema_error.message}."
-            f"json_path: {schema_error.json_path}"
-        )
-        return schema_error
     except Exception as e:
         logger.error("Unknown error for JSONSchema validation. " f"message: {str(e)}")
         return e
@@ -10,6 +10,16 @@ class JSONSchemaType(Enum):
     TODOS = "schema-todos.json"
 
 
+class SchemaOperation(Enum):
+    """
+    Enumerations for the operations that a JSON-Schema is validated for, as the same schema
+    is applied with different rules for each one (e.g. "patch" does not enforce required fields).
+    """
+
+    CREATE = "create"
+    PATCH = "patch"
+
+
 class DDBPrefixes(Enum):
     """
     Enumerations for DynamoDB Partition Keys and Sort Keys for TODO items and related information to
@@ -18,3 +28,22 @@ class DDBPrefixes(Enum):
 
     PK_USER = "USER#"
     SK_TODO_DATA = "TODO#"
+    SK_USER_STATS = "STATS"  # Single item per user, with the TODO counters
+    PK_IDEMPOTENCY = "IDEMPOTENCY#"  # Records of the requests with idempotency keys
+
+
+class DDBIndexes(Enum):
+    """
+    Enumerations for the DynamoDB Global Secondary Indexes (same names as in the CDK stack).
+    """
+
+    TODO_DATE = "todo-date-index"  # PK (HASH) + todo_date (RANGE)
+    OPEN_TODOS = "open-todos-index"  # PK (HASH) + OPEN_SK (RANGE), only for open TODOs
+
+
+class DDBAttributes(Enum):
+    """
+    Enumerations for the DynamoDB attributes that are only used as keys of the indexes.
+    """
+
+    OPEN_SK = "OPEN_SK"  # Copy of the "SK", only present while the TODO is not done
@@ -1,4 +1,8 @@
 # Built-in imports
+import os
+import random
+import logging
+import contextvars
 from typing import Optional, Union
 import uuid
 
@@ -6,13 +10,112 @@ import uuid
 from aws_lambda_powertools import Logger
 
 
+# Ratio of the requests that log their DEBUG records (and full payloads), from 0 to 1
+LOG_DEBUG_SAMPLE_RATE = float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", "0"))
+
+
+class LogContext:
+    """
+    Keys added to the log records of a single request, and whether the request was
+    sampled to log its DEBUG records.
+    """
+
+    __slots__ = ("keys", "debug_sampled")
+
+    def __init__(self, keys: dict, debug_sampled: bool = False) -> None:
+        """
+        :param keys (dict): Keys to add to the log records (e.g. "correlation_id").
+        :param debug_sampled (bool): Log the DEBUG records of the request.
+        """
+        self.keys = keys
+        self.debug_sampled = debug_sampled
+
+
+# Context of the request being processed (propagated to the thread-pools with the context)
+_log_context: contextvars.ContextVar[Optional[LogContext]] = contextvars.ContextVar(
+    "log_context", default=None
+)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Logging filter that adds the keys of the request context to the records, and drops
+    the records below the configured level for the requests that were not sampled.
+    ! Note--> unlike <Logger.append_keys>, the keys are not shared by concurrent requests.
+    """
+
+    def __init__(self, level: int) -> None:
+        """
+        :param level (int): Configured log level (for the requests that were not sampled).
+        """
+        super().__init__()
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        log_context = _log_context.get()
+        if log_context is None:
+            return record.levelno >= self.level
+        if record.levelno < self.level and not log_context.debug_sampled:
+            return False
+        record.__dict__.update(log_context.keys)
+        return True
+
+
 def custom_logger(
     correlation_id: Optional[Union[str, uuid.UUID, None]] = None
 ) -> Logger:
     """Returns a custom <aws_lambda_powertools.Logger> Object."""
-    return Logger(
+    logger = Logger(
         service="todo-app",
         log_uncaught_exceptions=True,
         owner="Santiago Garcia Arango",
         correlation_id=correlation_id,
     )
+    _add_request_context_filter(logger)
+    return logger
+
+
+def _add_request_context_filter(logger: Logger) -> None:
+    """
+    Function to add the <RequestContextFilter> once to the logger shared by all the
+    <Logger> objects of the service. With debug sampling, the logger is set to DEBUG
+    and the filter keeps the configured level for the requests that were not sampled.
+    :param logger (Logger): Logger of the service.
+    """
+    std_logger = logging.getLogger(logger.service)
+    if any(isinstance(f, RequestContextFilter) for f in std_logger.filters):
+        return
+
+    level = std_logger.getEffectiveLevel()
+    std_logger.addFilter(RequestContextFilter(level))
+    if LOG_DEBUG_SAMPLE_RATE > 0 and level > logging.DEBUG:
+        std_logger.setLevel(logging.DEBUG)
+
+
+def start_log_context(**keys) -> LogContext:
+    """
+    Function to start the logging context of a new request, with its debug sampling.
+    :param keys (dict): Keys to add to the log records of the request.
+    """
+    debug_sampled = random.random() < LOG_DEBUG_SAMPLE_RATE
+    if debug_sampled:
+        keys["debug_sampled"] = True
+    log_context = LogContext(keys, debug_sampled)
+    _log_context.set(log_context)
+    return log_context
+
+
+def append_log_keys(**keys) -> None:
+    """
+    Function to add keys to the log records of the current request (it replaces the
+    <Logger.append_keys>, that shares the keys with all the requests).
+    :param keys (dict): Keys to add to the log records of the request.
+    """
+    log_context = _log_context.get()
+    if log_context is None:
+        _log_context.set(LogContext(keys))
+        return
+    # New object, so the contexts copied to other tasks or threads are not changed
+    _log_context.set(
+        LogContext({**log_context.keys, **keys}, log_context.debug_sampled)
+    )
@@ -0,0 +1,202 @@
+# Built-in imports
+import os
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# External imports
+from aws_lambda_powertools.metrics import EphemeralMetrics, MetricUnit
+
+
+# Metrics configuration (namespace can also be set with "POWERTOOLS_METRICS_NAMESPACE")
+METRICS_ENABLED = os.environ.get("TODOS_METRICS_ENABLED", "true").lower() == "true"
+METRICS_NAMESPACE = os.environ.get("POWERTOOLS_METRICS_NAMESPACE", "TodoApp")
+METRICS_SERVICE = "todo-app"
+
+
+class RequestMetrics:
+    """
+    Collector of the hot-path timings of a single request, that are published as
+    CloudWatch Embedded Metric Format (EMF) logs once the response was sent.
+    """
+
+    def __init__(self) -> None:
+        self.validation_ms = 0.0
+        self.serialize_ms = 0.0
+        self.compress_ms = 0.0
+        self.items_returned = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        self.endpoint_finished_at: Optional[float] = None
+        self.dynamodb_ms: dict[str, float] = {}
+        self.dynamodb_calls: dict[str, int] = {}
+        self.dynamodb_retries: dict[str, int] = {}
+        self.dynamodb_throttles: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def dynamodb_total_ms(self) -> float:
+        return sum(self.dynamodb_ms.values())
+
+    def add_dynamodb_call(
+        self, operation: str, elapsed_ms: float, retries: int = 0
+    ) -> None:
+        """
+        Method to record a DynamoDB call (it can be called from the thread-pools).
+        :param operation (str): DynamoDB API operation (e.g. "GetItem").
+        :param elapsed_ms (float): Duration of the call in milliseconds (with retries).
+        :param retries (int): Attempts retried by botocore for the call.
+        """
+        with self._lock:
+            self.dynamodb_ms[operation] = (
+                self.dynamodb_ms.get(operation, 0) + elapsed_ms
+            )
+            self.dynamodb_calls[operation] = self.dynamodb_calls.get(operation, 0) + 1
+            self.dynamodb_retries[operation] = (
+                self.dynamodb_retries.get(operation, 0) + retries
+            )
+
+    def add_dynamodb_throttle(self, operation: str) -> None:
+        """
+        Method to record a throttled attempt of a DynamoDB call.
+        :param operation (str): DynamoDB API operation (e.g. "GetItem").
+        """
+        with self._lock:
+            self.dynamodb_throttles[operation] = (
+                self.dynamodb_throttles.get(operation, 0) + 1
+            )
+
+    def flush(self, route: str, status: int) -> None:
+        """
+        Method to publish the collected metrics as EMF (printed to stdout).
+        :param route (str): Route of the request (e.g. "GET /api/v1/todos/{todo_id}").
+        :param status (int): HTTP status code of the response.
+        """
+        metrics = _new_metrics(route, status)
+        metrics.add_metric("ValidationMs", MetricUnit.Milliseconds, self.validation_ms)
+        metrics.add_metric("SerializeMs", MetricUnit.Milliseconds, self.serialize_ms)
+        metrics.add_metric("CompressMs", MetricUnit.Milliseconds, self.compress_ms)
+        metrics.add_metric("ItemsReturned", MetricUnit.Count, self.items_returned)
+        metrics.add_metric("CacheHits", MetricUnit.Count, self.cache_hits)
+        metrics.add_metric("CacheMisses", MetricUnit.Count, self.cache_misses)
+        metrics.add_metric("CacheEvictions", MetricUnit.Count, self.cache_evictions)
+        metrics.add_metric(
+            "DynamoDBMs", MetricUnit.Milliseconds, self.dynamodb_total_ms
+        )
+        metrics.add_metric(
+            "DynamoDBCalls", MetricUnit.Count, sum(self.dynamodb_calls.values())
+        )
+        metrics.add_metric(
+            "DynamoDBRetries", MetricUnit.Count, sum(self.dynamodb_retries.values())
+        )
+        metrics.add_metric(
+            "DynamoDBThrottles",
+            MetricUnit.Count,
+            sum(self.dynamodb_throttles.values()),
+        )
+        metrics.flush_metrics()
+
+        # One EMF document per DynamoDB operation (with its own dimension)
+        for operation, elapsed_ms in self.dynamodb_ms.items():
+            metrics = _new_metrics(route, status)
+            metrics.add_dimension(name="operation", value=operation)
+            metrics.add_metric("DynamoDBMs", MetricUnit.Milliseconds, elapsed_ms)
+            metrics.add_metric(
+                "DynamoDBCalls", MetricUnit.Count, self.dynamodb_calls[operation]
+            )
+            metrics.add_metric(
+                "DynamoDBRetries", MetricUnit.Count, self.dynamodb_retries[operation]
+            )
+            metrics.add_metric(
+                "DynamoDBThrottles",
+                MetricUnit.Count,
+                self.dynamodb_throttles.get(operation, 0),
+            )
+            metrics.flush_metrics()
+
+
+def _new_metrics(route: str, status: int) -> EphemeralMetrics:
+    metrics = EphemeralMetrics(namespace=METRICS_NAMESPACE, service=METRICS_SERVICE)
+    metrics.add_dimension(name="route", value=route)
+    metrics.add_dimension(name="status", value=str(status))
+    return metrics
+
+
+# Collector of the request being processed (propagated to the thread-pools with the context)
+_request_metrics: contextvars.ContextVar[
+    Optional[RequestMetrics]
+] = contextvars.ContextVar("request_metrics", default=None)
+
+
+def start_request_metrics() -> Optional[RequestMetrics]:
+    """
+    Function to start collecting the metrics for the current request (None if disabled).
+    """
+    request_metrics = RequestMetrics() if METRICS_ENABLED else None
+    _request_metrics.set(request_metrics)
+    return request_metrics
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    """
+    Function to get the metrics collector of the current request (None outside requests).
+    """
+    return _request_metrics.get()
+
+
+@contextmanager
+def record_timing(name: str) -> Iterator[None]:
+    """
+    Context manager to add the elapsed time to a timing of the current request.
+    :param name (str): Timing to add to ("validation_ms", "serialize_ms" or
+        "compress_ms").
+    """
+    request_metrics = _request_metrics.get()
+    if request_metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        setattr(request_metrics, name, getattr(request_metrics, name) + elapsed_ms)
+
+
+def add_items_returned(count: int) -> None:
+    """
+    Function to add to the number of items returned by the current request.
+    :param count (int): Number of items.
+    """
+    request_metrics = _request_metrics.get()
+    if request_metrics is not None:
+        request_metrics.items_returned += count
+
+
+def add_cache_lookup(hit: bool) -> None:
+    """
+    Function to count a lookup of the in-container cache for the current request.
+    :param hit (bool): Whether the value was found in the cache.
+    """
+    request_metrics = _request_metrics.get()
+    if request_metrics is None:
+        return
+    if hit:
+        request_metrics.cache_hits += 1
+    else:
+        request_metrics.cache_misses += 1
+
+
+def add_cache_evictions(count: int) -> None:
+    """
+    Function to count the entries evicted from the in-container cache by the current
+    request (to size the cache).
+    :param count (int): Number of evicted entries.
+    """
+    request_metrics = _request_metrics.get()
+    if request_metrics is not None:
+        request_metrics.cache_evictions += count
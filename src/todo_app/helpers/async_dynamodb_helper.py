@@ -0,0 +1,264 @@
+# Built-in imports
+import asyncio
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Optional
+
+# Own imports
+from todo_app.helpers.dynamodb_helper import DynamoDBHelper
+
+
+class AsyncDynamoDBHelper:
+    """
+    Async wrapper for the <DynamoDBHelper> that offloads the blocking boto3 calls
+    to a bounded thread-pool, so that the event loop is never blocked by I/O.
+    """
+
+    def __init__(
+        self, dynamodb_helper: DynamoDBHelper, max_workers: Optional[int] = None
+    ) -> None:
+        """
+        :param dynamodb_helper (DynamoDBHelper): Sync helper that executes the operations.
+        :param max_workers (Optional(int)): Max concurrent DynamoDB calls (thread-pool size).
+        """
+        self.dynamodb_helper = dynamodb_helper
+        self.max_workers = max_workers or 10
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # Own executor (not the loop's default one) to isolate the DynamoDB I/O
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="dynamodb",
+            )
+        return self._executor
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Method to run a blocking function in the thread-pool and await its result.
+        The context (e.g. the request metrics) is propagated to the thread.
+        :param func (Callable): Blocking function to execute.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    async def run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Method to run other blocking calls that use the same DynamoDB client (e.g. the
+        idempotency persistence layer) in the same bounded thread-pool.
+        :param func (Callable): Blocking function to execute.
+        """
+        return await self._run(func, *args, **kwargs)
+
+    async def get_item_by_pk_and_sk(
+        self,
+        partition_key: str,
+        sort_key: str,
+        projection_attributes: Optional[list[str]] = None,
+        consistent_read: bool = False,
+    ) -> dict:
+        """
+        Async version of <DynamoDBHelper.get_item_by_pk_and_sk>.
+        :param partition_key (str): partition key value.
+        :param sort_key (str): sort key value.
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        :param consistent_read (bool): use a strongly consistent read (e.g. before a write).
+        """
+        return await self._run(
+            self.dynamodb_helper.get_item_by_pk_and_sk,
+            partition_key=partition_key,
+            sort_key=sort_key,
+            projection_attributes=projection_attributes,
+            consistent_read=consistent_read,
+        )
+
+    async def query_by_pk_and_sk_begins_with(
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        projection_attributes: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        Async version of <DynamoDBHelper.query_by_pk_and_sk_begins_with>.
+        :param partition_key (str): partition key value.
+        :param sort_key_portion (str): sort key portion to use in query.
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        """
+        return await self._run(
+            self.dynamodb_helper.query_by_pk_and_sk_begins_with,
+            partition_key=partition_key,
+            sort_key_portion=sort_key_portion,
+            projection_attributes=projection_attributes,
+        )
+
+    async def query_page_by_pk_and_sk_begins_with(
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        limit: int = 50,
+        exclusive_start_key: Optional[dict] = None,
+        deserialize: bool = True,
+        filter_expression: Optional[str] = None,
+        filter_attribute_values: Optional[dict] = None,
+        projection_attributes: Optional[list[str]] = None,
+    ) -> tuple[list[dict], Optional[dict]]:
+        """
+        Async version of <DynamoDBHelper.query_page_by_pk_and_sk_begins_with>.
+        :param partition_key (str): partition key value.
+        :param sort_key_portion (str): sort key portion to use in query.
+        :param limit (int): max number of items to evaluate for the page.
+        :param exclusive_start_key (Optional(dict)): key to continue from a previous page.
+        :param deserialize (bool): return Python dicts (or the low-level format if False).
+        :param filter_expression (Optional(str)): filter applied after the items are read.
+        :param filter_attribute_values (Optional(dict)): values used in the filter expression.
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        """
+        return await self._run(
+            self.dynamodb_helper.query_page_by_pk_and_sk_begins_with,
+            partition_key=partition_key,
+            sort_key_portion=sort_key_portion,
+            limit=limit,
+            exclusive_start_key=exclusive_start_key,
+            deserialize=deserialize,
+            filter_expression=filter_expression,
+            filter_attribute_values=filter_attribute_values,
+            projection_attributes=projection_attributes,
+        )
+
+    async def iter_query_pages_by_pk_and_sk_begins_with(
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        limit: int = 50,
+        deserialize: bool = True,
+        projection_attributes: Optional[list[str]] = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Async version of <DynamoDBHelper.iter_query_pages_by_pk_and_sk_begins_with>.
+        Each page is only fetched when the previous one was consumed.
+        :param partition_key (str): partition key value.
+        :param sort_key_portion (str): sort key portion to use in query.
+        :param limit (int): max number of items to evaluate for each page.
+        :param deserialize (bool): return Python dicts (or the low-level format if False).
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        """
+        last_evaluated_key = None
+
+        # Pagination loop for all the possible queries
+        while True:
+            items, last_evaluated_key = await self.query_page_by_pk_and_sk_begins_with(
+                partition_key=partition_key,
+                sort_key_portion=sort_key_portion,
+                limit=limit,
+                exclusive_start_key=last_evaluated_key,
+                deserialize=deserialize,
+                projection_attributes=projection_attributes,
+            )
+            yield items
+            if not last_evaluated_key:
+                return
+
+    async def query_page_by_index_range(
+        self,
+        index_name: str,
+        partition_key: str,
+        range_key_name: str,
+        range_from: Optional[str] = None,
+        range_to: Optional[str] = None,
+        limit: int = 50,
+        exclusive_start_key: Optional[dict] = None,
+        deserialize: bool = True,
+        projection_attributes: Optional[list[str]] = None,
+    ) -> tuple[list[dict], Optional[dict]]:
+        """
+        Async version of <DynamoDBHelper.query_page_by_index_range>.
+        :param index_name (str): name of the index to query.
+        :param partition_key (str): partition key value.
+        :param range_key_name (str): name of the index sort key attribute.
+        :param range_from (Optional(str)): min value of the range (unbounded if None).
+        :param range_to (Optional(str)): max value of the range (unbounded if None).
+        :param limit (int): max number of items to evaluate for the page.
+        :param exclusive_start_key (Optional(dict)): key to continue from a previous page.
+        :param deserialize (bool): return Python dicts (or the low-level format if False).
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        """
+        return await self._run(
+            self.dynamodb_helper.query_page_by_index_range,
+            index_name=index_name,
+            partition_key=partition_key,
+            range_key_name=range_key_name,
+            range_from=range_from,
+            range_to=range_to,
+            limit=limit,
+            exclusive_start_key=exclusive_start_key,
+            deserialize=deserialize,
+            projection_attributes=projection_attributes,
+        )
+
+    async def batch_write(self, items: list[dict]) -> list[dict]:
+        """
+        Async version of <DynamoDBHelper.batch_write>.
+        :param items (list[dict]): Items to be added in the format of name/value pairs.
+        """
+        return await self._run(self.dynamodb_helper.batch_write, items=items)
+
+    async def batch_get(
+        self, keys: list[tuple[str, str]], consistent_read: bool = False
+    ) -> list[dict]:
+        """
+        Async version of <DynamoDBHelper.batch_get>.
+        :param keys (list[tuple[str, str]]): Unique (partition key, sort key) values.
+        :param consistent_read (bool): use strongly consistent reads (e.g. before a write).
+        """
+        return await self._run(
+            self.dynamodb_helper.batch_get, keys=keys, consistent_read=consistent_read
+        )
+
+    async def update_item(
+        self,
+        partition_key: str,
+        sort_key: str,
+        data_attributes_only: dict,
+        condition_expression: Optional[str] = None,
+        condition_attribute_values: Optional[dict] = None,
+        return_values: str = "NONE",
+        remove_attributes: Optional[list[str]] = None,
+        add_attributes: Optional[dict] = None,
+    ) -> dict:
+        """
+        Async version of <DynamoDBHelper.update_item>.
+        :param partition_key (str): partition key value.
+        :param sort_key (str): sort key value.
+        :param data_attributes_only (dict): Item's data attributes to be updated in the format of name/value pairs.
+        :param condition_expression (Optional(str)): condition that must be met to update the item.
+        :param condition_attribute_values (Optional(dict)): values used in the condition expression.
+        :param return_values (str): attributes to return ("NONE", "ALL_NEW", "ALL_OLD", ...).
+        :param remove_attributes (Optional(list[str])): Item's attributes to be removed.
+        :param add_attributes (Optional(dict)): Item's numeric attributes to be incremented.
+        """
+        return await self._run(
+            self.dynamodb_helper.update_item,
+            partition_key=partition_key,
+            sort_key=sort_key,
+            data_attributes_only=data_attributes_only,
+            condition_expression=condition_expression,
+            condition_attribute_values=condition_attribute_values,
+            return_values=return_values,
+            remove_attributes=remove_attributes,
+            add_attributes=add_attributes,
+        )
+
+    async def transact_write(self, transact_items: list[dict]) -> dict:
+        """
+        Async version of <DynamoDBHelper.transact_write>.
+        :param transact_items (list[dict]): Operations in the low-level format.
+        """
+        return await self._run(
+            self.dynamodb_helper.transact_write, transact_items=transact_items
+        )
@@ -0,0 +1,134 @@
+# Built-in imports
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+# Own imports
+from todo_app.common.metrics import add_cache_evictions, add_cache_lookup
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache with TTL and LRU eviction, keyed by partition key and sort key.
+    It lives in the Lambda container (or process), so it is shared by all requests served by it.
+    ! Note--> each container only sees its own writes, so the reads served by the other
+    containers can be stale for up to the TTL after an update or delete.
+    """
+
+    def __init__(self, ttl_seconds: float = 0.0, max_items: int = 1000) -> None:
+        """
+        :param ttl_seconds (float): Seconds that an entry is valid for (0 disables the cache).
+        :param max_items (int): Max number of TODO items held before evicting the least
+            recently used entries (a cached page counts as the items it contains).
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+
+        self._entries: OrderedDict[
+            tuple[str, str], tuple[float, int, Any]
+        ] = OrderedDict()
+        self._keys_by_partition: dict[str, set[tuple[str, str]]] = {}
+        self._current_items = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_items > 0
+
+    def get(self, partition_key: str, sort_key: str) -> Optional[Any]:
+        """
+        Method to get a cached value (None when not cached or expired).
+        :param partition_key (str): partition key value.
+        :param sort_key (str): sort key value (or any other key within the partition).
+        """
+        if not self.enabled:
+            return None
+
+        key = (partition_key, sort_key)
+        value = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, _, value = entry
+                if expires_at <= time.monotonic():
+                    self._remove(key)
+                    value = None
+                else:
+                    self._entries.move_to_end(key)
+
+        add_cache_lookup(hit=value is not None)
+        return value
+
+    def set(
+        self, partition_key: str, sort_key: str, value: Any, item_count: int = 1
+    ) -> None:
+        """
+        Method to cache a value, evicting the least recently used entries if needed.
+        :param partition_key (str): partition key value.
+        :param sort_key (str): sort key value (or any other key within the partition).
+        :param value (Any): value to cache (it must not be modified after caching it).
+        :param item_count (int): number of TODO items in the value (e.g. for a page).
+        """
+        if not self.enabled or item_count > self.max_items:
+            return
+
+        key = (partition_key, sort_key)
+        evictions = 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            expires_at = time.monotonic() + self.ttl_seconds
+            self._entries[key] = (expires_at, item_count, value)
+            self._keys_by_partition.setdefault(partition_key, set()).add(key)
+            self._current_items += item_count
+
+            while self._current_items > self.max_items:
+                self._remove(next(iter(self._entries)))
+                evictions += 1
+
+        if evictions:
+            add_cache_evictions(evictions)
+
+    def delete(self, partition_key: str, sort_key: str) -> None:
+        """
+        Method to invalidate a single cached value.
+        :param partition_key (str): partition key value.
+        :param sort_key (str): sort key value (or any other key within the partition).
+        """
+        with self._lock:
+            if (partition_key, sort_key) in self._entries:
+                self._remove((partition_key, sort_key))
+
+    def invalidate_partition(
+        self, partition_key: str, sort_key_prefix: str = ""
+    ) -> None:
+        """
+        Method to invalidate all the cached values of a partition with a sort key prefix.
+        :param partition_key (str): partition key value.
+        :param sort_key_prefix (str): prefix of the sort keys to invalidate (all if empty).
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._keys_by_partition.get(partition_key, ())
+                if key[1].startswith(sort_key_prefix)
+            ]
+            for key in keys:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_partition.clear()
+            self._current_items = 0
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        # ! Note--> must be called with the lock acquired
+        _, item_count, _ = self._entries.pop(key)
+        self._current_items -= item_count
+        partition_keys = self._keys_by_partition[key[0]]
+        partition_keys.discard(key)
+        if not partition_keys:
+            del self._keys_by_partition[key[0]]
@@ -1,32 +1,242 @@
 # Built-in imports
-import boto3
-from boto3.dynamodb.conditions import Key
+import os
+import time
+import random
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+# External imports
+import botocore.session
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Own imports
 from todo_app.common.logger import custom_logger
+from todo_app.common.metrics import get_request_metrics
+from todo_app.helpers.dynamodb_serializer import (
+    deserialize_item,
+    serialize,
+    serialize_item,
+)
 
 logger = custom_logger()
 
+# Single botocore session shared by all the helpers (created on first use)
+_botocore_session: Optional[botocore.session.Session] = None
+_botocore_lock = threading.Lock()
+
+# DynamoDB limits for the batch operations
+BATCH_WRITE_MAX_ITEMS = 25
+BATCH_GET_MAX_KEYS = 100
+
+# DynamoDB limit for the operations of a transaction
+TRANSACT_WRITE_MAX_ITEMS = 100
+
+# Backoff configuration for the retries of unprocessed items (in seconds)
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 2.0
+
+
+# Error codes of the DynamoDB calls that were throttled (retried by botocore)
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "ThrottlingException",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+    ]
+)
+
+
+def _log_write_failure(message: str, error: ClientError) -> None:
+    """
+    Function to log a failed write. Failed conditions are expected (e.g. missing items or
+    concurrent writes), so they are logged as info and the callers classify them.
+    :param message (str): Description of the failed write.
+    :param error (ClientError): Error raised by the write.
+    """
+    error_code = error.response["Error"]["Code"]
+    is_condition_failure = error_code == "ConditionalCheckFailedException" or (
+        error_code == "TransactionCanceledException"
+        and any(
+            reason.get("Code") == "ConditionalCheckFailed"
+            for reason in error.response.get("CancellationReasons", [])
+        )
+    )
+    if is_condition_failure:
+        logger.info(message)
+    else:
+        logger.error(message)
+
+
+class UnprocessedKeysError(Exception):
+    """
+    Exception raised when <BatchGetItem> keeps returning <UnprocessedKeys> after all the
+    retries (e.g. the table is throttled), so the callers can answer with a retryable error.
+    """
+
+    def __init__(self, unprocessed_keys: int, attempts: int) -> None:
+        """
+        :param unprocessed_keys (int): Number of keys that could not be read.
+        :param attempts (int): Number of attempts made for the keys.
+        """
+        self.unprocessed_keys = unprocessed_keys
+        super().__init__(
+            f"batch_get_item could not process {unprocessed_keys} keys "
+            f"after {attempts} attempts"
+        )
+
+
+def get_botocore_config() -> Config:
+    """
+    Function to build the botocore configuration of the DynamoDB clients from environment
+    variables. The defaults are sized for the thread-pools of the helpers (the connections
+    are reused with keep-alive) and fail fast, as the Lambda timeout is a few seconds.
+    """
+    return Config(
+        max_pool_connections=int(os.environ.get("DYNAMODB_MAX_POOL_CONNECTIONS", "50")),
+        connect_timeout=float(os.environ.get("DYNAMODB_CONNECT_TIMEOUT", "2")),
+        read_timeout=float(os.environ.get("DYNAMODB_READ_TIMEOUT", "5")),
+        retries={
+            "mode": os.environ.get("DYNAMODB_RETRY_MODE", "adaptive"),
+            "total_max_attempts": int(os.environ.get("DYNAMODB_MAX_ATTEMPTS", "3")),
+        },
+        tcp_keepalive=(
+            os.environ.get("DYNAMODB_TCP_KEEPALIVE", "true").lower() == "true"
+        ),
+    )
+
+
+def get_botocore_session() -> botocore.session.Session:
+    """
+    Function to get the botocore session shared by all the clients of the app (created on
+    first use, as the session loads its data files).
+    """
+    global _botocore_session
+    if _botocore_session is None:
+        with _botocore_lock:
+            if _botocore_session is None:
+                _botocore_session = botocore.session.get_session()
+    return _botocore_session
+
+
+def _sleep_with_jitter(attempt: int) -> None:
+    """
+    Sleep with exponential backoff and "full jitter" before a retry attempt.
+    :param attempt (int): Number of the retry attempt (starting at 1).
+    """
+    time.sleep(random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)))
+
+
+def _start_call_timer(context: dict, **kwargs) -> None:
+    """
+    Botocore "before-call" handler that keeps the start time of a DynamoDB call.
+    :param context (dict): Request context shared by the events of the same call.
+    """
+    context["todo_app_start_time"] = time.perf_counter()
+
+
+def _record_call_metrics(model, context: dict, parsed: dict, **kwargs) -> None:
+    """
+    Botocore "after-call" handler that adds the DynamoDB call to the request metrics.
+    :param model (OperationModel): Model of the DynamoDB operation that was called.
+    :param context (dict): Request context shared by the events of the same call.
+    :param parsed (dict): Parsed response of the call (also for the error responses).
+    """
+    request_metrics = get_request_metrics()
+    start_time = context.get("todo_app_start_time")
+    if request_metrics is not None and start_time is not None:
+        request_metrics.add_dynamodb_call(
+            model.name,
+            (time.perf_counter() - start_time) * 1000,
+            retries=parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0),
+        )
+
+
+def _record_throttle_metrics(response, operation, **kwargs) -> None:
+    """
+    Botocore "needs-retry" handler that counts the throttled attempts of the DynamoDB
+    calls in the request metrics. It never decides the retries (always returns None).
+    :param response (Optional(tuple)): HTTP response and parsed response of the attempt.
+    :param operation (OperationModel): Model of the DynamoDB operation that was called.
+    """
+    if response is None:
+        return None
+    error_code = response[1].get("Error", {}).get("Code")
+    request_metrics = get_request_metrics()
+    if request_metrics is not None and error_code in THROTTLING_ERROR_CODES:
+        request_metrics.add_dynamodb_throttle(operation.name)
+    return None
+
+
+def _get_projection_params(projection_attributes: list[str]) -> tuple[str, dict]:
+    """
+    Function to build a <ProjectionExpression> and its attribute names. Attribute names are
+    always set through placeholders, so that DynamoDB reserved words can be projected.
+    :param projection_attributes (list[str]): Names of the attributes to return.
+    """
+    names = {f"#p{index}": name for index, name in enumerate(projection_attributes)}
+    return ", ".join(names), names
+
 
 class DynamoDBHelper:
     """Custom DynamoDB Helper for simplifying CRUD operations."""
 
-    def __init__(self, table_name: str, endpoint_url: str = None) -> None:
+    def __init__(
+        self,
+        table_name: str,
+        endpoint_url: str = None,
+        config: Optional[Config] = None,
+    ) -> None:
         """
         :param table_name (str): Name of the DynamoDB table to connect with.
         :param endpoint_url (Optional(str)): Endpoint for DynamoDB (only for local tests).
+        :param config (Optional(Config)): Botocore configuration (pool, timeouts, retries).
         """
         self.table_name = table_name
-        self.dynamodb_client = boto3.client("dynamodb", endpoint_url=endpoint_url)
-        self.dynamodb_resource = boto3.resource("dynamodb", endpoint_url=endpoint_url)
-        self.table = self.dynamodb_resource.Table(self.table_name)
+        self.endpoint_url = endpoint_url
+        self.config = config
+        self._dynamodb_client = None
 
-    def get_item_by_pk_and_sk(self, partition_key: str, sort_key: str) -> dict:
+    @property
+    def dynamodb_client(self):
+        """
+        Low-level DynamoDB client, created on first use (to keep it out of the cold start
+        for requests that never touch the table).
+        """
+        if self._dynamodb_client is None:
+            botocore_session = get_botocore_session()
+            with _botocore_lock:
+                if self._dynamodb_client is None:
+                    dynamodb_client = botocore_session.create_client(
+                        "dynamodb", endpoint_url=self.endpoint_url, config=self.config
+                    )
+                    dynamodb_client.meta.events.register(
+                        "before-call.dynamodb", _start_call_timer
+                    )
+                    dynamodb_client.meta.events.register(
+                        "after-call.dynamodb", _record_call_metrics
+                    )
+                    dynamodb_client.meta.events.register(
+                        "needs-retry.dynamodb", _record_throttle_metrics
+                    )
+                    self._dynamodb_client = dynamodb_client
+        return self._dynamodb_client
+
+    def get_item_by_pk_and_sk(
+        self,
+        partition_key: str,
+        sort_key: str,
+        projection_attributes: Optional[list[str]] = None,
+        consistent_read: bool = False,
+    ) -> dict:
         """
         Method to get a single DynamoDB item from the primary key (pk+sk).
         :param partition_key (str): partition key value.
         :param sort_key (str): sort key value.
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        :param consistent_read (bool): use a strongly consistent read (e.g. before a write).
         """
         logger.info(
             f"Starting get_item_by_pk_and_sk with "
@@ -43,10 +253,19 @@ class DynamoDBHelper:
             },
         }
         try:
-            response = self.dynamodb_client.get_item(
-                TableName=self.table_name,
-                Key=primary_key_dict,
-            )
+            get_params = {
+                "TableName": self.table_name,
+                "Key": primary_key_dict,
+            }
+            if consistent_read:
+                get_params["ConsistentRead"] = True
+            if projection_attributes:
+                (
+                    get_params["ProjectionExpression"],
+                    get_params["ExpressionAttributeNames"],
+                ) = _get_projection_params(projection_attributes)
+
+            response = self.dynamodb_client.get_item(**get_params)
             return response["Item"] if "Item" in response else {}
 
         except ClientError as error:
@@ -60,52 +279,212 @@ class DynamoDBHelper:
             raise error
 
     def query_by_pk_and_sk_begins_with(
-        self, partition_key: str, sort_key_portion: str
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        projection_attributes: Optional[list[str]] = None,
     ) -> list[dict]:
         """
         Method to run a query against DynamoDB with partition key and the sort
-        key with <begins-with> functionality on it.
+        key with <begins-with> functionality on it (walks all the pages).
+        :param partition_key (str): partition key value.
+        :param sort_key_portion (str): sort key portion to use in query.
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        """
+        all_items = []
+        for items in self.iter_query_pages_by_pk_and_sk_begins_with(
+            partition_key=partition_key,
+            sort_key_portion=sort_key_portion,
+            projection_attributes=projection_attributes,
+        ):
+            all_items.extend(items)
+        return all_items
+
+    def iter_query_pages_by_pk_and_sk_begins_with(
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        limit: int = 50,
+        deserialize: bool = True,
+        projection_attributes: Optional[list[str]] = None,
+    ) -> Iterator[list[dict]]:
+        """
+        Generator to run a query against DynamoDB with partition key and the sort
+        key with <begins-with> functionality on it, that yields one page at a time.
         :param partition_key (str): partition key value.
         :param sort_key_portion (str): sort key portion to use in query.
+        :param limit (int): max number of items to evaluate for each page.
+        :param deserialize (bool): return Python dicts (or the low-level format if False).
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        """
+        last_evaluated_key = None
+
+        # Pagination loop for all the possible queries
+        while True:
+            items, last_evaluated_key = self.query_page_by_pk_and_sk_begins_with(
+                partition_key=partition_key,
+                sort_key_portion=sort_key_portion,
+                limit=limit,
+                exclusive_start_key=last_evaluated_key,
+                deserialize=deserialize,
+                projection_attributes=projection_attributes,
+            )
+            yield items
+            if not last_evaluated_key:
+                return
+
+    def query_page_by_pk_and_sk_begins_with(
+        self,
+        partition_key: str,
+        sort_key_portion: str,
+        limit: int = 50,
+        exclusive_start_key: Optional[dict] = None,
+        deserialize: bool = True,
+        filter_expression: Optional[str] = None,
+        filter_attribute_values: Optional[dict] = None,
+        projection_attributes: Optional[list[str]] = None,
+    ) -> tuple[list[dict], Optional[dict]]:
+        """
+        Method to run a single-page query against DynamoDB with partition key and
+        the sort key with <begins-with> functionality on it.
+        Returns the page items and the <LastEvaluatedKey> (None when there are no more pages).
+        :param partition_key (str): partition key value.
+        :param sort_key_portion (str): sort key portion to use in query.
+        :param limit (int): max number of items to evaluate for the page.
+        :param exclusive_start_key (Optional(dict)): key to continue from a previous page.
+        :param deserialize (bool): return Python dicts (or the low-level format if False).
+        :param filter_expression (Optional(str)): filter applied after the items are read
+            (so the page can have less items than the limit, even if there are more pages).
+        :param filter_attribute_values (Optional(dict)): values used in the filter expression.
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
         """
         logger.info(
-            f"Starting query_by_pk_and_sk_begins_with with "
+            f"Starting query_page_by_pk_and_sk_begins_with with "
             f"pk: ({partition_key}) and sk: ({sort_key_portion})"
         )
 
-        all_items = []
         try:
             # The structure key for a single-table-design "PK" and "SK" naming
-            key_condition = Key("PK").eq(partition_key) & Key("SK").begins_with(
-                sort_key_portion
+            query_params = {
+                "TableName": self.table_name,
+                "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk)",
+                "ExpressionAttributeValues": {
+                    ":pk": {"S": partition_key},
+                    ":sk": {"S": sort_key_portion},
+                },
+                "Limit": limit,
+            }
+            if exclusive_start_key:
+                query_params["ExclusiveStartKey"] = serialize_item(exclusive_start_key)
+            if filter_expression:
+                query_params["FilterExpression"] = filter_expression
+                query_params["ExpressionAttributeValues"].update(
+                    serialize_item(filter_attribute_values or {})
+                )
+            if projection_attributes:
+                (
+                    query_params["ProjectionExpression"],
+                    query_params["ExpressionAttributeNames"],
+                ) = _get_projection_params(projection_attributes)
+
+            response = self.dynamodb_client.query(**query_params)
+            items = response.get("Items", [])
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            return (
+                [deserialize_item(item) for item in items] if deserialize else items,
+                deserialize_item(last_evaluated_key) if last_evaluated_key else None,
+            )
+        except ClientError as error:
+            logger.error(
+                f"query operation failed for: "
+                f"table_name: {self.table_name}."
+                f"pk: {partition_key}."
+                f"sort_key_portion: {sort_key_portion}."
+                f"error: {error}."
             )
-            limit = 50
+            raise error
 
-            # Initial query before pagination
-            response = self.table.query(
-                KeyConditionExpression=key_condition,
-                Limit=limit,
+    def query_page_by_index_range(
+        self,
+        index_name: str,
+        partition_key: str,
+        range_key_name: str,
+        range_from: Optional[str] = None,
+        range_to: Optional[str] = None,
+        limit: int = 50,
+        exclusive_start_key: Optional[dict] = None,
+        deserialize: bool = True,
+        projection_attributes: Optional[list[str]] = None,
+    ) -> tuple[list[dict], Optional[dict]]:
+        """
+        Method to run a single-page query against a DynamoDB index with partition key
+        "PK" and a range (inclusive) on its sort key, so that only the items in the range
+        are read. Returns the page items and the <LastEvaluatedKey>.
+        :param index_name (str): name of the index to query.
+        :param partition_key (str): partition key value.
+        :param range_key_name (str): name of the index sort key attribute.
+        :param range_from (Optional(str)): min value of the range (unbounded if None).
+        :param range_to (Optional(str)): max value of the range (unbounded if None).
+        :param limit (int): max number of items to evaluate for the page.
+        :param exclusive_start_key (Optional(dict)): key to continue from a previous page.
+        :param deserialize (bool): return Python dicts (or the low-level format if False).
+        :param projection_attributes (Optional(list[str])): attributes to return (all if None).
+        """
+        logger.info(
+            f"Starting query_page_by_index_range with index: ({index_name}), "
+            f"pk: ({partition_key}) and range: ({range_from}, {range_to})"
+        )
+
+        key_condition_expression = "PK = :pk"
+        expression_attribute_values = {":pk": {"S": partition_key}}
+        if range_from is not None and range_to is not None:
+            key_condition_expression += " AND #rk BETWEEN :from AND :to"
+        elif range_from is not None:
+            key_condition_expression += " AND #rk >= :from"
+        elif range_to is not None:
+            key_condition_expression += " AND #rk <= :to"
+        if range_from is not None:
+            expression_attribute_values[":from"] = {"S": range_from}
+        if range_to is not None:
+            expression_attribute_values[":to"] = {"S": range_to}
+        expression_attribute_names = (
+            {"#rk": range_key_name} if "#rk" in key_condition_expression else {}
+        )
+        if projection_attributes:
+            projection_expression, projection_names = _get_projection_params(
+                projection_attributes
             )
-            if "Items" in response:
-                all_items.extend(response["Items"])
+            expression_attribute_names.update(projection_names)
 
-            # Pagination loop for possible following queries
-            while "LastEvaluatedKey" in response:
-                response = self.table.query(
-                    KeyConditionExpression=key_condition,
-                    Limit=limit,
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                )
-                if "Items" in response:
-                    all_items.extend(response["Items"])
+        try:
+            query_params = {
+                "TableName": self.table_name,
+                "IndexName": index_name,
+                "KeyConditionExpression": key_condition_expression,
+                "ExpressionAttributeValues": expression_attribute_values,
+                "Limit": limit,
+            }
+            if expression_attribute_names:
+                query_params["ExpressionAttributeNames"] = expression_attribute_names
+            if projection_attributes:
+                query_params["ProjectionExpression"] = projection_expression
+            if exclusive_start_key:
+                query_params["ExclusiveStartKey"] = serialize_item(exclusive_start_key)
 
-            return all_items
+            response = self.dynamodb_client.query(**query_params)
+            items = response.get("Items", [])
+            last_evaluated_key = response.get("LastEvaluatedKey")
+            return (
+                [deserialize_item(item) for item in items] if deserialize else items,
+                deserialize_item(last_evaluated_key) if last_evaluated_key else None,
+            )
         except ClientError as error:
             logger.error(
                 f"query operation failed for: "
                 f"table_name: {self.table_name}."
+                f"index_name: {index_name}."
                 f"pk: {partition_key}."
-                f"sort_key_portion: {sort_key_portion}."
+                f"range: ({range_from}, {range_to})."
                 f"error: {error}."
             )
             raise error
@@ -116,14 +495,14 @@ class DynamoDBHelper:
         :param data (dict): Item to be added in the format of name/value pairs.
         """
         logger.info("Starting put_item operation.")
-        logger.debug(f"data: {data}")
+        logger.debug("put_item data: %s", data)
 
         try:
             response = self.dynamodb_client.put_item(
                 TableName=self.table_name,
                 Item=data,
             )
-            logger.info(response)
+            logger.debug("put_item response", extra={"response": response})
             return response
         except ClientError as error:
             logger.error(
@@ -134,85 +513,352 @@ class DynamoDBHelper:
             )
             raise error
 
+    def batch_write(
+        self,
+        items: list[dict],
+        max_concurrency: int = 4,
+        max_attempts: int = 5,
+    ) -> list[dict]:
+        """
+        Method to add multiple DynamoDB items with <BatchWriteItem>. The items are sent in
+        chunks of 25 (the DynamoDB limit) concurrently, and the <UnprocessedItems> are
+        retried with exponential backoff and full jitter.
+        Returns the items that could not be written.
+        :param items (list[dict]): Items to be added in the format of name/value pairs.
+        :param max_concurrency (int): Max number of chunks to send at the same time.
+        :param max_attempts (int): Max number of attempts for each chunk.
+        """
+        logger.info(f"Starting batch_write operation for {len(items)} items.")
+
+        chunks = [
+            items[i : i + BATCH_WRITE_MAX_ITEMS]
+            for i in range(0, len(items), BATCH_WRITE_MAX_ITEMS)
+        ]
+        if not chunks:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(chunks))
+        ) as executor:
+            # Each chunk runs with a copy of the context (e.g. the request metrics)
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._batch_write_chunk,
+                    chunk,
+                    max_attempts,
+                )
+                for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+            return [item for failed_items in results for item in failed_items]
+
+    def _batch_write_chunk(self, items: list[dict], max_attempts: int) -> list[dict]:
+        """
+        Method to write a single chunk of up to 25 items, retrying the unprocessed ones.
+        Returns the items that could not be written.
+        :param items (list[dict]): Items to be added in the format of name/value pairs.
+        :param max_attempts (int): Max number of attempts for the chunk.
+        """
+        write_requests = [{"PutRequest": {"Item": item}} for item in items]
+        for attempt in range(max_attempts):
+            if attempt:
+                _sleep_with_jitter(attempt)
+
+            try:
+                response = self.dynamodb_client.batch_write_item(
+                    RequestItems={self.table_name: write_requests},
+                )
+            except ClientError as error:
+                logger.error(
+                    f"batch_write_item operation failed for: "
+                    f"table_name: {self.table_name}."
+                    f"items: {len(write_requests)}."
+                    f"error: {error}."
+                )
+                break
+
+            write_requests = response.get("UnprocessedItems", {}).get(
+                self.table_name, []
+            )
+            if not write_requests:
+                return []
+            logger.warning(
+                f"batch_write_item returned {len(write_requests)} unprocessed items "
+                f"(attempt {attempt + 1} of {max_attempts})."
+            )
+
+        return [request["PutRequest"]["Item"] for request in write_requests]
+
+    def batch_get(
+        self,
+        keys: list[tuple[str, str]],
+        max_concurrency: int = 4,
+        max_attempts: int = 5,
+        consistent_read: bool = False,
+    ) -> list[dict]:
+        """
+        Method to get multiple DynamoDB items from their primary keys (pk+sk) with
+        <BatchGetItem>. The keys are sent in chunks of 100 (the DynamoDB limit)
+        concurrently, and the <UnprocessedKeys> are retried with exponential backoff
+        and full jitter. Non-existing items are not returned, and the order is not kept.
+        Raises <UnprocessedKeysError> if some keys are still unprocessed after the retries.
+        :param keys (list[tuple[str, str]]): Unique (partition key, sort key) values.
+        :param max_concurrency (int): Max number of chunks to send at the same time.
+        :param max_attempts (int): Max number of attempts for each chunk.
+        :param consistent_read (bool): use strongly consistent reads (e.g. before a write).
+        """
+        logger.info(f"Starting batch_get operation for {len(keys)} keys.")
+
+        # The structure key for a single-table-design "PK" and "SK" naming
+        primary_key_dicts = [
+            {"PK": {"S": partition_key}, "SK": {"S": sort_key}}
+            for partition_key, sort_key in keys
+        ]
+        chunks = [
+            primary_key_dicts[i : i + BATCH_GET_MAX_KEYS]
+            for i in range(0, len(primary_key_dicts), BATCH_GET_MAX_KEYS)
+        ]
+        if not chunks:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(chunks))
+        ) as executor:
+            # Each chunk runs with a copy of the context (e.g. the request metrics)
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._batch_get_chunk,
+                    chunk,
+                    max_attempts,
+                    consistent_read,
+                )
+                for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+            return [item for items in results for item in items]
+
+    def _batch_get_chunk(
+        self, keys: list[dict], max_attempts: int, consistent_read: bool = False
+    ) -> list[dict]:
+        """
+        Method to get a single chunk of up to 100 items, retrying the unprocessed keys.
+        :param keys (list[dict]): Primary keys of the items to get.
+        :param max_attempts (int): Max number of attempts for the chunk.
+        :param consistent_read (bool): use strongly consistent reads.
+        """
+        all_items = []
+        for attempt in range(max_attempts):
+            if attempt:
+                _sleep_with_jitter(attempt)
+
+            try:
+                response = self.dynamodb_client.batch_get_item(
+                    RequestItems={
+                        self.table_name: {
+                            "Keys": keys,
+                            "ConsistentRead": consistent_read,
+                        }
+                    },
+                )
+            except ClientError as error:
+                logger.error(
+                    f"batch_get_item operation failed for: "
+                    f"table_name: {self.table_name}."
+                    f"keys: {len(keys)}."
+                    f"error: {error}."
+                )
+                raise error
+
+            all_items.extend(response.get("Responses", {}).get(self.table_name, []))
+            keys = (
+                response.get("UnprocessedKeys", {})
+                .get(self.table_name, {})
+                .get("Keys", [])
+            )
+            if not keys:
+                return all_items
+            logger.warning(
+                f"batch_get_item returned {len(keys)} unprocessed keys "
+                f"(attempt {attempt + 1} of {max_attempts})."
+            )
+
+        raise UnprocessedKeysError(len(keys), max_attempts)
+
     def update_item(
-        self, partition_key: str, sort_key: str, data_attributes_only: dict
+        self,
+        partition_key: str,
+        sort_key: str,
+        data_attributes_only: dict,
+        condition_expression: Optional[str] = None,
+        condition_attribute_values: Optional[dict] = None,
+        return_values: str = "NONE",
+        remove_attributes: Optional[list[str]] = None,
+        add_attributes: Optional[dict] = None,
     ) -> dict:
         """
         Method to update an existing item in a "patch" fashion (only deltas).
         :param partition_key (str): partition key value.
         :param sort_key (str): sort key value.
         :param data_attributes_only (dict): Item's data attributes to be updated in the format of name/value pairs.
+        :param condition_expression (Optional(str)): condition that must be met to update the item.
+        :param condition_attribute_values (Optional(dict)): values used in the condition expression.
+        :param return_values (str): attributes to return ("NONE", "ALL_NEW", "ALL_OLD", ...).
+        :param remove_attributes (Optional(list[str])): Item's attributes to be removed.
+        :param add_attributes (Optional(dict)): Item's numeric attributes to be incremented.
         """
 
         logger.info("Starting update_item operation.")
         logger.debug(
-            f"pk: {partition_key}, sk: {sort_key} data: {data_attributes_only}"
+            "update_item pk: %s, sk: %s, data: %s",
+            partition_key,
+            sort_key,
+            data_attributes_only,
         )
 
         try:
-            primary_key_dict = {
-                "PK": partition_key,
-                "SK": sort_key,
-            }
-            a, v = self._get_update_params(data_attributes_only)
-            response = self.table.update_item(
-                Key=primary_key_dict,
-                UpdateExpression=a,
-                ExpressionAttributeValues=dict(v),
+            update_params = self.get_update_request(
+                partition_key=partition_key,
+                sort_key=sort_key,
+                data_attributes_only=data_attributes_only,
+                condition_expression=condition_expression,
+                condition_attribute_values=condition_attribute_values,
+                remove_attributes=remove_attributes,
+                add_attributes=add_attributes,
             )
-            logger.info(response)
+            update_params["ReturnValues"] = return_values
+
+            response = self.dynamodb_client.update_item(**update_params)
+            logger.debug("update_item response", extra={"response": response})
+            if "Attributes" in response:
+                response["Attributes"] = deserialize_item(response["Attributes"])
             return response
         except ClientError as error:
-            logger.error(
-                f"put_item operation failed for: "
+            _log_write_failure(
+                f"update_item operation failed for: "
                 f"table_name: {self.table_name}."
                 f"pk: {partition_key}."
                 f"sk: {sort_key}."
                 f"data_attributes_only: {data_attributes_only}."
-                f"error: {error}."
+                f"error: {error}.",
+                error,
             )
             raise error
 
-    def _get_update_params(self, payload: dict):
+    def get_update_request(
+        self,
+        partition_key: str,
+        sort_key: str,
+        data_attributes_only: dict,
+        condition_expression: Optional[str] = None,
+        condition_attribute_values: Optional[dict] = None,
+        remove_attributes: Optional[list[str]] = None,
+        add_attributes: Optional[dict] = None,
+    ) -> dict:
+        """
+        Method to build the parameters of an update in a "patch" fashion (only deltas),
+        shared by <update_item> and the "Update" operations of <transact_write>.
+        :param partition_key (str): partition key value.
+        :param sort_key (str): sort key value.
+        :param data_attributes_only (dict): Item's data attributes to be updated in the format of name/value pairs.
+        :param condition_expression (Optional(str)): condition that must be met to update the item.
+        :param condition_attribute_values (Optional(dict)): values used in the condition expression.
+        :param remove_attributes (Optional(list[str])): Item's attributes to be removed.
+        :param add_attributes (Optional(dict)): Item's numeric attributes to be incremented.
+        """
+        update_expression, names, values = self._get_update_params(
+            data_attributes_only, remove_attributes, add_attributes
+        )
+        update_params = {
+            "TableName": self.table_name,
+            "Key": {
+                "PK": {"S": partition_key},
+                "SK": {"S": sort_key},
+            },
+            "UpdateExpression": update_expression,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+        if condition_expression:
+            update_params["ConditionExpression"] = condition_expression
+            update_params["ExpressionAttributeValues"].update(
+                serialize_item(condition_attribute_values or {})
+            )
+        return update_params
+
+    def _get_update_params(
+        self,
+        payload: dict,
+        remove_attributes: Optional[list[str]] = None,
+        add_attributes: Optional[dict] = None,
+    ) -> tuple[str, dict, dict]:
         """
-        Given a dictionary we generate an update expression and a dict of values
-        to update a dynamodb table.
+        Given a dictionary we generate an update expression, a dict of attribute names
+        and a dict of values to update a dynamodb table. Attribute names are always set
+        through placeholders, so that DynamoDB reserved words can be updated.
 
         :payload (dict): Parameters to use for formatting.
+        :remove_attributes (Optional(list[str])): Attributes to remove from the item.
+        :add_attributes (Optional(dict)): Numeric attributes to increment (atomic counters).
         """
-        update_expression = ["set "]
+        update_expression = []
+        remove_expression = []
+        add_expression = []
+        update_names = dict()
         update_values = dict()
 
-        for key, val in payload.items():
-            update_expression.append(f" {key} = :{key},")
-            update_values[f":{key}"] = val
+        for index, (key, val) in enumerate(payload.items()):
+            update_expression.append(f"#k{index} = :v{index}")
+            update_names[f"#k{index}"] = key
+            update_values[f":v{index}"] = serialize(val)
+
+        for index, key in enumerate(remove_attributes or []):
+            remove_expression.append(f"#r{index}")
+            update_names[f"#r{index}"] = key
 
-        return "".join(update_expression)[:-1], update_values
+        for index, (key, val) in enumerate((add_attributes or {}).items()):
+            add_expression.append(f"#a{index} :a{index}")
+            update_names[f"#a{index}"] = key
+            update_values[f":a{index}"] = serialize(val)
 
-    def delete_item(self, partition_key: str, sort_key: str) -> dict:
+        expression = []
+        if update_expression:
+            expression.append(f"SET {', '.join(update_expression)}")
+        if remove_expression:
+            expression.append(f"REMOVE {', '.join(remove_expression)}")
+        if add_expression:
+            expression.append(f"ADD {', '.join(add_expression)}")
+        return " ".join(expression), update_names, update_values
+
+    def transact_write(self, transact_items: list[dict]) -> dict:
         """
-        Method to delete an existing item in DynamoDB
-        :param partition_key (str): partition key value.
-        :param sort_key (str): sort key value.
+        Method to write multiple DynamoDB items atomically with <TransactWriteItems> (all the
+        operations are applied, or none of them). Up to 100 operations, one per item.
+        :param transact_items (list[dict]): Operations in the low-level format (e.g.
+            {"Put": {...}}, {"Update": {...}}, {"Delete": {...}}), the "TableName" is optional.
         """
-
-        logger.info("Starting delete_item operation.")
-        logger.debug(f"pk: {partition_key}, sk: {sort_key}")
+        logger.info(
+            f"Starting transact_write operation for {len(transact_items)} operations."
+        )
+        logger.debug("transact_write items: %s", transact_items)
 
         try:
-            primary_key_dict = {
-                "PK": partition_key,
-                "SK": sort_key,
-            }
-            response = self.table.delete_item(Key=primary_key_dict)
-            logger.info(response)
+            response = self.dynamodb_client.transact_write_items(
+                TransactItems=[
+                    {operation: {"TableName": self.table_name, **params}}
+                    for transact_item in transact_items
+                    for operation, params in transact_item.items()
+                ],
+            )
+            logger.debug("transact_write_items response", extra={"response": response})
             return response
         except ClientError as error:
-            logger.error(
-                f"put_item operation failed for: "
+            _log_write_failure(
+                f"transact_write_items operation failed for: "
                 f"table_name: {self.table_name}."
-                f"pk: {partition_key}."
-                f"sk: {sort_key}."
-                f"error: {error}."
+                f"operations: {len(transact_items)}."
+                f"error: {error}.",
+                error,
             )
             raise error
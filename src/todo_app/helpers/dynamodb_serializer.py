@@ -0,0 +1,85 @@
+# Built-in imports
+from decimal import Decimal
+from typing import Any
+
+
+def serialize(value: Any) -> dict:
+    """
+    Function to convert a Python value into a DynamoDB attribute value (low-level format).
+    Lightweight alternative to <boto3.dynamodb.types.TypeSerializer> for the types used by the app.
+    :param value (Any): Python value (str, bool, int, float, Decimal, None, bytes, dict, list or set).
+    """
+    # ! Note--> "bool" must be checked before "int", as it's a subclass of it
+    if isinstance(value, str):
+        return {"S": value}
+    if isinstance(value, bool):
+        return {"BOOL": value}
+    if isinstance(value, (int, float, Decimal)):
+        return {"N": str(value)}
+    if value is None:
+        return {"NULL": True}
+    if isinstance(value, (bytes, bytearray)):
+        return {"B": bytes(value)}
+    if isinstance(value, dict):
+        return {"M": {key: serialize(val) for key, val in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return {"L": [serialize(val) for val in value]}
+    if isinstance(value, (set, frozenset)) and value:
+        if all(isinstance(val, str) for val in value):
+            return {"SS": list(value)}
+        if all(isinstance(val, (int, float, Decimal)) for val in value):
+            return {"NS": [str(val) for val in value]}
+    raise TypeError(f"Unsupported type for DynamoDB serialization: {type(value)}")
+
+
+def deserialize(attribute_value: dict) -> Any:
+    """
+    Function to convert a DynamoDB attribute value (low-level format) into a Python value.
+    Numbers are returned as <int> when integral and as <Decimal> otherwise.
+    :param attribute_value (dict): DynamoDB attribute value (e.g. {"S": "value"}).
+    """
+    ((data_type, value),) = attribute_value.items()
+    if data_type == "S":
+        return value
+    if data_type == "N":
+        return _deserialize_number(value)
+    if data_type == "BOOL":
+        return value
+    if data_type == "NULL":
+        return None
+    if data_type == "M":
+        return {key: deserialize(val) for key, val in value.items()}
+    if data_type == "L":
+        return [deserialize(val) for val in value]
+    if data_type == "B":
+        return value
+    if data_type == "SS":
+        return set(value)
+    if data_type == "NS":
+        return {_deserialize_number(val) for val in value}
+    if data_type == "BS":
+        return set(value)
+    raise TypeError(f"Unsupported DynamoDB type for deserialization: {data_type}")
+
+
+def serialize_item(item: dict) -> dict:
+    """
+    Function to convert a Python dict into a DynamoDB item (low-level format).
+    :param item (dict): Python dict with the item's attributes.
+    """
+    return {key: serialize(value) for key, value in item.items()}
+
+
+def deserialize_item(item: dict) -> dict:
+    """
+    Function to convert a DynamoDB item (low-level format) into a Python dict.
+    :param item (dict): DynamoDB item with the attribute values.
+    """
+    return {key: deserialize(value) for key, value in item.items()}
+
+
+def _deserialize_number(value: str) -> int | Decimal:
+    try:
+        return int(value)
+    except ValueError:
+        return Decimal(value)
@@ -0,0 +1,75 @@
+# Built-in imports
+import hashlib
+from typing import Iterable, Optional
+
+
+class NotModifiedException(Exception):
+    """
+    Exception raised when the resource matches the ETag of the request (<If-None-Match>),
+    so that the response can be sent without converting or serializing the resource.
+    """
+
+    def __init__(self, etag: str) -> None:
+        """
+        :param etag (str): Current ETag of the resource.
+        """
+        self.etag = etag
+        super().__init__(f"Resource not modified (ETag: {etag})")
+
+
+def _weak_etag(value: str) -> str:
+    # Weak ETags, as they identify the version of the data (not the exact bytes sent)
+    return f'W/"{hashlib.blake2b(value.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def _fields_suffix(fields: Optional[Iterable[str]]) -> str:
+    # Partial representations (projections) have their own ETags
+    return f"\n{','.join(fields)}" if fields else ""
+
+
+def compute_todo_etag(
+    sort_key: str, updated_at: str, fields: Optional[Iterable[str]] = None
+) -> str:
+    """
+    Function to compute the ETag of a TODO item, derived from its last update.
+    :param sort_key (str): Sort key of the TODO item.
+    :param updated_at (str): Last update timestamp of the TODO item.
+    :param fields (Optional(Iterable[str])): Projected fields (None for the full item).
+    """
+    return _weak_etag(f"{sort_key}|{updated_at}{_fields_suffix(fields)}")
+
+
+def compute_list_etag(
+    versions: Iterable[tuple[str, str]],
+    next_token: Optional[str] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Function to compute the ETag of a page of TODO items, derived from the version of
+    each item in the page (so that creations, updates and deletions change it).
+    ! Note--> as it is derived from the page, the conditional requests still read the page
+    (a 304 only saves the model conversion, the serialization and the transfer).
+    :param versions (Iterable[tuple[str, str]]): (sort key, updated_at) of each item.
+    :param next_token (Optional(str)): Pagination token returned with the page.
+    :param fields (Optional(Iterable[str])): Projected fields (None for the full items).
+    """
+    page_version = "\n".join(f"{sk}|{updated_at}" for sk, updated_at in versions)
+    return _weak_etag(f"{page_version}\n{next_token or ''}{_fields_suffix(fields)}")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Function to check if an <If-None-Match> header matches an ETag (weak comparison).
+    :param if_none_match (Optional(str)): Value of the <If-None-Match> header.
+    :param etag (str): Current ETag of the resource.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,239 @@
+# Built-in imports
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+# Own imports
+from todo_app.common.logger import custom_logger
+from todo_app.helpers.async_dynamodb_helper import AsyncDynamoDBHelper
+
+logger = custom_logger()
+
+# Max attempts when the stored record changes between the write and the read of it
+IDEMPOTENCY_MAX_ATTEMPTS = 3
+
+
+class IdempotencyInProgressError(Exception):
+    """
+    Raised when another request with the same idempotency key is still in progress.
+    """
+
+
+class IdempotencyKeyReusedError(Exception):
+    """
+    Raised when an idempotency key is reused with a different payload.
+    """
+
+
+class IdempotencyHelper:
+    """
+    Helper to run async operations only once per idempotency key, with the Powertools
+    idempotency persistence layer. The records are kept in the same DynamoDB table (PK/SK),
+    in a partition per scope (a persistence layer per scope, with its own static partition
+    key), and the completed ones are also kept in memory, so the retries served by the
+    same container are answered without calling DynamoDB.
+    ! Note--> <idempotent_function> doesn't support coroutines, so the persistence layer is
+    driven directly here (same flow as the Powertools <IdempotencyHandler>).
+    """
+
+    def __init__(
+        self,
+        async_dynamodb_helper: AsyncDynamoDBHelper,
+        function_name: str,
+        partition_key_prefix: str,
+        expires_after_seconds: int = 3600,
+        local_cache_max_items: int = 256,
+        in_progress_timeout_seconds: int = 30,
+        persistence_layers_max_items: int = 128,
+    ) -> None:
+        """
+        :param async_dynamodb_helper (AsyncDynamoDBHelper): Helper with the table, client and thread-pool to use.
+        :param function_name (str): Name of the operation (part of the hashed keys).
+        :param partition_key_prefix (str): Prefix of the partition key of the records
+            (followed by the scope of each request).
+        :param expires_after_seconds (int): Seconds that a stored response is replayed for.
+        :param local_cache_max_items (int): Max number of records kept in memory (per scope).
+        :param in_progress_timeout_seconds (int): Seconds that an in-progress record blocks
+            its key when the remaining time of the invocation is unknown (outside Lambda).
+        :param persistence_layers_max_items (int): Max number of scopes whose persistence
+            layers (and records in memory) are kept, the least recently used are dropped.
+        """
+        self.async_dynamodb_helper = async_dynamodb_helper
+        self.function_name = function_name
+        self.partition_key_prefix = partition_key_prefix
+        self.expires_after_seconds = expires_after_seconds
+        self.local_cache_max_items = local_cache_max_items
+        self.in_progress_timeout_seconds = in_progress_timeout_seconds
+        self.persistence_layers_max_items = persistence_layers_max_items
+        self._persistence_layers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_persistence_layer(self, scope: str):
+        """
+        Method to get the Powertools persistence layer of a scope, that keeps its records in
+        the "<partition_key_prefix><scope>" partition (its <static_pk_value>), with the
+        hashed keys as sort keys. The layers are created on first use (their modules
+        import boto3, so they are kept out of the cold start for requests without
+        idempotency keys) and kept for the most recently used scopes.
+        :param scope (str): Owner of the idempotency keys (e.g. the user).
+        """
+        with self._lock:
+            persistence_layer = self._persistence_layers.get(scope)
+            if persistence_layer is not None:
+                self._persistence_layers.move_to_end(scope)
+                return persistence_layer
+
+            from aws_lambda_powertools.utilities.idempotency import (
+                DynamoDBPersistenceLayer,
+                IdempotencyConfig,
+            )
+
+            dynamodb_helper = self.async_dynamodb_helper.dynamodb_helper
+            persistence_layer = DynamoDBPersistenceLayer(
+                table_name=dynamodb_helper.table_name,
+                key_attr="PK",
+                sort_key_attr="SK",
+                static_pk_value=f"{self.partition_key_prefix}{scope}",
+                boto3_client=dynamodb_helper.dynamodb_client,
+            )
+            persistence_layer.configure(
+                IdempotencyConfig(
+                    event_key_jmespath="[scope, idempotency_key]",
+                    payload_validation_jmespath="payload",
+                    raise_on_no_idempotency_key=True,
+                    expires_after_seconds=self.expires_after_seconds,
+                    use_local_cache=True,
+                    local_cache_max_items=self.local_cache_max_items,
+                ),
+                function_name=self.function_name,
+            )
+            self._persistence_layers[scope] = persistence_layer
+            while len(self._persistence_layers) > self.persistence_layers_max_items:
+                self._persistence_layers.popitem(last=False)
+            return persistence_layer
+
+    async def run(
+        self,
+        idempotency_key: str,
+        scope: str,
+        payload: dict,
+        operation: Callable[[], Awaitable[dict]],
+        remaining_time_in_millis: Optional[int] = None,
+    ) -> dict:
+        """
+        Method to run the operation once for the idempotency key, or to return the response
+        stored by a previous run of it. Raises <IdempotencyInProgressError> or
+        <IdempotencyKeyReusedError> when the stored record can't be replayed.
+        :param idempotency_key (str): Key sent by the client (e.g. "Idempotency-Key" header).
+        :param scope (str): Owner of the key (e.g. the user), so keys are not shared (and
+            its records are kept in their own partition).
+        :param payload (dict): Request payload (a reused key must have the same payload).
+        :param operation (Callable): Coroutine function that returns the response as a dict.
+        :param remaining_time_in_millis (Optional(int)): Time left for the invocation, so
+            the in-progress records of failed invocations expire with them (the in-progress
+            timeout is used if None).
+        """
+        from aws_lambda_powertools.utilities.idempotency.exceptions import (
+            IdempotencyInconsistentStateError,
+            IdempotencyItemNotFoundError,
+        )
+
+        persistence_layer = self.get_persistence_layer(scope)
+        data = {"scope": scope, "idempotency_key": idempotency_key, "payload": payload}
+        if remaining_time_in_millis is None:
+            remaining_time_in_millis = self.in_progress_timeout_seconds * 1000
+
+        for attempt in range(1, IDEMPOTENCY_MAX_ATTEMPTS + 1):
+            try:
+                data_record = await self._save_in_progress(
+                    persistence_layer, data, remaining_time_in_millis
+                )
+                if data_record is None:
+                    break
+                return self._get_stored_response(data_record, idempotency_key)
+            except (IdempotencyInconsistentStateError, IdempotencyItemNotFoundError):
+                # The record expired or was deleted meanwhile, so it's written again
+                logger.warning(
+                    f"Idempotency record changed for: {idempotency_key}, "
+                    f"attempt {attempt} of {IDEMPOTENCY_MAX_ATTEMPTS}"
+                )
+                if attempt == IDEMPOTENCY_MAX_ATTEMPTS:
+                    raise
+
+        try:
+            response = await operation()
+        except Exception as e:
+            # Failed runs must not be replayed (the client can retry with the same key)
+            await self.async_dynamodb_helper.run_blocking(
+                persistence_layer.delete_record, data=data, exception=e
+            )
+            raise
+
+        await self.async_dynamodb_helper.run_blocking(
+            persistence_layer.save_success, data=data, result=response
+        )
+        return response
+
+    async def _save_in_progress(
+        self,
+        persistence_layer: Any,
+        data: dict,
+        remaining_time_in_millis: Optional[int],
+    ) -> Optional[Any]:
+        """
+        Method to save the in-progress record for the request, or to get the record that
+        already exists for its idempotency key (Powertools <DataRecord>).
+        Returns None when the record was saved (the operation must be executed).
+        :param persistence_layer (DynamoDBPersistenceLayer): Persistence layer of the scope.
+        :param data (dict): Idempotency data of the request (scope, key and payload).
+        :param remaining_time_in_millis (Optional(int)): Time left for the invocation.
+        """
+        from aws_lambda_powertools.utilities.idempotency.exceptions import (
+            IdempotencyItemAlreadyExistsError,
+            IdempotencyValidationError,
+        )
+
+        try:
+            try:
+                await self.async_dynamodb_helper.run_blocking(
+                    persistence_layer.save_inprogress,
+                    data=data,
+                    remaining_time_in_millis=remaining_time_in_millis,
+                )
+                return None
+            except IdempotencyItemAlreadyExistsError as error:
+                # The record returned by the failed write is used when available (it's
+                # only read again for the records found in the local cache)
+                if error.old_data_record is not None:
+                    return error.old_data_record
+                return await self.async_dynamodb_helper.run_blocking(
+                    persistence_layer.get_record, data=data
+                )
+        except IdempotencyValidationError as error:
+            raise IdempotencyKeyReusedError(
+                f"Idempotency key already used with a different payload: "
+                f"{data['idempotency_key']}"
+            ) from error
+
+    def _get_stored_response(self, data_record: Any, idempotency_key: str) -> dict:
+        """
+        Method to get the response of a stored idempotency record (Powertools <DataRecord>).
+        :param data_record (DataRecord): Record found for the idempotency key.
+        :param idempotency_key (str): Key sent by the client for the request.
+        """
+        from aws_lambda_powertools.utilities.idempotency.exceptions import (
+            IdempotencyInconsistentStateError,
+        )
+        from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import (
+            STATUS_CONSTANTS,
+        )
+
+        if data_record.status == STATUS_CONSTANTS["EXPIRED"]:
+            raise IdempotencyInconsistentStateError("Idempotency record expired")
+        if data_record.status == STATUS_CONSTANTS["INPROGRESS"]:
+            raise IdempotencyInProgressError(
+                f"Request already in progress for: {idempotency_key}"
+            )
+
+        logger.info(f"Replaying stored response for: {idempotency_key}")
+        return data_record.response_json_as_dict()
@@ -0,0 +1,117 @@
+# Built-in imports
+import os
+import json
+import hmac
+import base64
+import hashlib
+import secrets
+import threading
+from typing import Optional
+
+# Own imports
+from todo_app.helpers.dynamodb_helper import get_botocore_session
+
+
+# Secret to sign the pagination tokens (same value needed across all Lambda containers)
+# ! Note--> deployments keep it in Secrets Manager (read once per container, on first use),
+# and "PAGINATION_TOKEN_SECRET" can be set for local runs. Without any of them, a random key
+# is generated per process (so the tokens are only valid in the container that issued them)
+PAGINATION_TOKEN_SECRET_ARN = os.environ.get("PAGINATION_TOKEN_SECRET_ARN")
+PAGINATION_TOKEN_SECRET = os.environ.get("PAGINATION_TOKEN_SECRET")
+_secret: Optional[bytes] = None
+_secret_lock = threading.Lock()
+
+
+def is_secret_loaded() -> bool:
+    """
+    Function to check if the key to sign the pagination tokens was already loaded (so
+    async callers only go through <load_secret> in an executor when it was not).
+    """
+    return _secret is not None
+
+
+def load_secret() -> bytes:
+    """
+    Function to get the key to sign the pagination tokens (blocking on the first call,
+    which reads it from Secrets Manager). If the secret is configured but can't be read,
+    the error is raised (no tokens are signed with a fallback key).
+    """
+    global _secret
+    if _secret is None:
+        with _secret_lock:
+            if _secret is None:
+                _secret = _read_secret()
+    return _secret
+
+
+def _read_secret() -> bytes:
+    """
+    Function to read the key to sign the pagination tokens from its configured source.
+    """
+    if PAGINATION_TOKEN_SECRET_ARN:
+        # Client from the shared session (boto3 is never imported by the app)
+        secrets_manager_client = get_botocore_session().create_client("secretsmanager")
+        response = secrets_manager_client.get_secret_value(
+            SecretId=PAGINATION_TOKEN_SECRET_ARN
+        )
+        return response["SecretString"].encode("utf-8")
+    if PAGINATION_TOKEN_SECRET:
+        return PAGINATION_TOKEN_SECRET.encode("utf-8")
+    return secrets.token_bytes(32)
+
+
+def _b64encode(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).decode("ascii").rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(load_secret(), payload, hashlib.sha256).digest()
+
+
+def encode_next_token(
+    last_evaluated_key: Optional[dict], query_scope: str
+) -> Optional[str]:
+    """
+    Function to encode a DynamoDB <LastEvaluatedKey> as an opaque and signed pagination token.
+    :param last_evaluated_key (Optional(dict)): Last evaluated key returned by a DynamoDB query.
+    :param query_scope (str): Query (index and filters) that returned the key.
+    """
+    if not last_evaluated_key:
+        return None
+
+    payload = json.dumps(
+        {"key": last_evaluated_key, "query": query_scope},
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_next_token(next_token: str, query_scope: str) -> dict:
+    """
+    Function to decode a pagination token into the DynamoDB <ExclusiveStartKey> to use.
+    Raises ValueError if the token is malformed, its signature is not valid or it was
+    issued for another query.
+    :param next_token (str): Pagination token from a previous response.
+    :param query_scope (str): Query (index and filters) that the token is used with.
+    """
+    try:
+        encoded_payload, encoded_signature = next_token.split(".")
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except ValueError as error:
+        raise ValueError("Pagination token is malformed") from error
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise ValueError("Pagination token signature is not valid")
+
+    token_data = json.loads(payload)
+    if not isinstance(token_data, dict) or not isinstance(token_data.get("key"), dict):
+        raise ValueError("Pagination token is malformed")
+    if token_data.get("query") != query_scope:
+        raise ValueError("Pagination token was issued for another query")
+    return token_data["key"]
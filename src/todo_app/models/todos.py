@@ -2,7 +2,21 @@
 from typing import Optional, Self
 
 # External imports
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+# Own imports
+from todo_app.common.enums import DDBAttributes
+
+
+def _is_done_value(attribute_value: Optional[dict]) -> bool:
+    """
+    Function to get the status of a TODO item from its DynamoDB attribute value.
+    :param attribute_value (Optional(dict)): "is_done" attribute (None if not stored).
+    """
+    # Stored as "True"/"False" strings (or BOOL for legacy items)
+    if not attribute_value:
+        return False
+    return attribute_value.get("S") == "True" or attribute_value.get("BOOL") is True
 
 
 class TodoModel(BaseModel):
@@ -33,9 +47,15 @@ class TodoModel(BaseModel):
 
         # Remove None values from the dictionary
         dynamodb_dict = {
-            key: value for key, value in dynamodb_dict.items() if value is not None
+            key: value
+            for key, value in dynamodb_dict.items()
+            if value.get("S") is not None
         }
 
+        # Key of the sparse "open TODOs" index (only present while the TODO is not done)
+        if not self.is_done:
+            dynamodb_dict[DDBAttributes.OPEN_SK.value] = {"S": self.SK}
+
         return dynamodb_dict
 
     @classmethod
@@ -51,6 +71,128 @@ class TodoModel(BaseModel):
             updated_at=dynamodb_item["updated_at"]["S"],
         )
 
+    @classmethod
+    def from_dynamodb_items(cls, dynamodb_items: list[dict]) -> list["TodoModel"]:
+        """
+        Method to convert DynamoDB items (low-level format) into validated models, with a
+        single <TypeAdapter> call for all of them (faster than one validation per item,
+        and than <model_construct> in pure Python).
+        :param dynamodb_items (list[dict]): DynamoDB items read from the table.
+        """
+        return _TODO_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "PK": dynamodb_item["PK"]["S"],
+                    "SK": dynamodb_item["SK"]["S"],
+                    "todo_title": dynamodb_item["todo_title"]["S"],
+                    "todo_details": dynamodb_item.get("todo_details", {}).get("S"),
+                    "todo_date": dynamodb_item["todo_date"]["S"],
+                    "is_done": _is_done_value(dynamodb_item.get("is_done")),
+                    "created_at": dynamodb_item["created_at"]["S"],
+                    "updated_at": dynamodb_item["updated_at"]["S"],
+                }
+                for dynamodb_item in dynamodb_items
+            ]
+        )
+
+
+class TodosPage(BaseModel):
+    """
+    Class that represents a page of TODO items (list responses).
+    """
+
+    items: list[TodoModel]
+    next_token: Optional[str] = Field(None)
+
+
+class TodoPartialModel(BaseModel):
+    """
+    Class that represents a TODO item with only some of its fields (<fields> projections).
+    Only the keys and the requested fields are set, so the responses must exclude the unset
+    fields (e.g. <model_dump_json(exclude_unset=True)>).
+    """
+
+    PK: str
+    SK: str
+    todo_title: Optional[str] = Field(None)
+    todo_details: Optional[str] = Field(None)
+    todo_date: Optional[str] = Field(None)
+    is_done: Optional[bool] = Field(None)
+    created_at: Optional[str] = Field(None)
+    updated_at: Optional[str] = Field(None)
+
+    @classmethod
+    def from_dynamodb_items(
+        cls, dynamodb_items: list[dict], fields: list[str]
+    ) -> list["TodoPartialModel"]:
+        """
+        Method to convert projected DynamoDB items (low-level format) into validated partial
+        models, with a single <TypeAdapter> call (see <TodoModel.from_dynamodb_items>).
+        Only the keys and the requested fields are set (each model has its own set).
+        The <updated_at> is always kept (for the ETags), but only returned if requested.
+        :param dynamodb_items (list[dict]): DynamoDB items read from the table.
+        :param fields (list[str]): Fields requested by the client (besides the keys).
+        """
+        fields_set = {"PK", "SK", *fields}
+        values = []
+        for dynamodb_item in dynamodb_items:
+            item_values = {}
+            for field in fields_set | {"updated_at"}:
+                attribute_value = dynamodb_item.get(field)
+                if not attribute_value:
+                    continue
+                if field == "is_done":
+                    item_values[field] = _is_done_value(attribute_value)
+                else:
+                    item_values[field] = attribute_value["S"]
+            values.append(item_values)
+
+        todos = _TODO_PARTIAL_LIST_ADAPTER.validate_python(values)
+        if "updated_at" not in fields_set:
+            # ! Note--> the set of each model is its own, so it is safe to update in place
+            for todo in todos:
+                todo.model_fields_set.discard("updated_at")
+        return todos
+
+
+# Validators of the TODO lists read from the table (built once, as they are expensive)
+_TODO_LIST_ADAPTER = TypeAdapter(list[TodoModel])
+_TODO_PARTIAL_LIST_ADAPTER = TypeAdapter(list[TodoPartialModel])
+
+# Fields that can be requested in the projections (the keys are always returned)
+TODO_PROJECTABLE_FIELDS = tuple(
+    field for field in TodoPartialModel.model_fields if field not in ("PK", "SK")
+)
+
+
+class TodosPartialPage(BaseModel):
+    """
+    Class that represents a page of partial TODO items (list responses with <fields>).
+    """
+
+    items: list[TodoPartialModel]
+    next_token: Optional[str] = Field(None)
+
+
+class TodoStatsModel(BaseModel):
+    """
+    Class that represents the TODO counters of a user (kept in its "STATS" item).
+    """
+
+    total_todos: int = Field(0)
+    open_todos: int = Field(0)
+    done_todos: int = Field(0)
+
+    @classmethod
+    def from_dynamodb_item(cls, dynamodb_item: dict) -> "TodoStatsModel":
+        total_todos = int(dynamodb_item.get("total_todos", {}).get("N", 0))
+        open_todos = int(dynamodb_item.get("open_todos", {}).get("N", 0))
+        return cls(
+            total_todos=total_todos,
+            open_todos=open_todos,
+            done_todos=total_todos - open_todos,
+        )
+
 
 # TODO: Instead of a duplicated model for "PATCH" requests, create an abstraction for both
 class TodoModelUpdates(BaseModel):
@@ -0,0 +1,112 @@
+# Built-in imports
+import os
+
+# The app reads its configuration when imported, so it must be set before the imports
+os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["DYNAMODB_TABLE"] = "todo-app-unit-tests"
+os.environ["PAGINATION_TOKEN_SECRET"] = "unit-tests-secret"
+os.environ["TODOS_CACHE_TTL_SECONDS"] = "0"
+os.environ["TODOS_METRICS_ENABLED"] = "false"
+os.environ["POWERTOOLS_LOG_LEVEL"] = "WARNING"
+
+# External imports
+import boto3
+import pytest
+from moto import mock_dynamodb
+from fastapi.testclient import TestClient
+
+
+TABLE_NAME = os.environ["DYNAMODB_TABLE"]
+USER_EMAIL = "rick@example.com"
+
+
+@pytest.fixture
+def dynamodb_table():
+    """DynamoDB table of the app (with its indexes), mocked for each test."""
+    with mock_dynamodb():
+        boto3.client("dynamodb").create_table(
+            TableName=TABLE_NAME,
+            AttributeDefinitions=[
+                {"AttributeName": name, "AttributeType": "S"}
+                for name in ("PK", "SK", "todo_date", "OPEN_SK")
+            ],
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": index_name,
+                    "KeySchema": [
+                        {"AttributeName": "PK", "KeyType": "HASH"},
+                        {"AttributeName": range_key, "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+                for index_name, range_key in (
+                    ("todo-date-index", "todo_date"),
+                    ("open-todos-index", "OPEN_SK"),
+                )
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield boto3.resource("dynamodb").Table(TABLE_NAME)
+
+
+@pytest.fixture
+def client(dynamodb_table):
+    """Client for the FastAPI app, backed by the mocked table."""
+    from todo_app.api.v1.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def create_todo(client):
+    """Function to create a TODO item for the test user (returns the created item)."""
+
+    def _create_todo(**todo_details) -> dict:
+        response = client.post(
+            "/api/v1/todos",
+            json={
+                "user_email": USER_EMAIL,
+                "todo_title": "Complete project",
+                "todo_details": "Finish the report",
+                "todo_date": "2024-02-29",
+                **todo_details,
+            },
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return _create_todo
+
+
+@pytest.fixture
+def dynamodb_calls(monkeypatch):
+    """Names of the DynamoDB operations sent by the app (in order of the calls)."""
+    from todo_app.access_patterns.todos import async_dynamodb_helper
+
+    calls = []
+
+    def spy(name, operation):
+        async def record_call(*args, **kwargs):
+            calls.append(name)
+            return await operation(*args, **kwargs)
+
+        return record_call
+
+    for name in (
+        "get_item_by_pk_and_sk",
+        "query_page_by_pk_and_sk_begins_with",
+        "query_page_by_index_range",
+        "batch_write",
+        "batch_get",
+        "update_item",
+        "transact_write",
+    ):
+        operation = getattr(async_dynamodb_helper, name)
+        monkeypatch.setattr(async_dynamodb_helper, name, spy(name, operation))
+    return calls
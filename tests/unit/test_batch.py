@@ -0,0 +1,88 @@
+# External imports
+import pytest
+
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+from todo_app.helpers.dynamodb_helper import DynamoDBHelper
+from conftest import TABLE_NAME, USER_EMAIL
+
+
+def build_items(count: int) -> list[dict]:
+    return [
+        {"PK": {"S": f"USER#{USER_EMAIL}"}, "SK": {"S": f"TODO#{index:03}"}}
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def batch_write_calls(dynamodb_table, monkeypatch):
+    """Helper for the mocked table that records the items sent by each batch write."""
+    monkeypatch.setattr(
+        "todo_app.helpers.dynamodb_helper._sleep_with_jitter", lambda attempt: None
+    )
+    helper = DynamoDBHelper(TABLE_NAME)
+    calls = []
+    batch_write_item = helper.dynamodb_client.batch_write_item
+
+    def record_batch_write_item(RequestItems):
+        calls.append(len(RequestItems[TABLE_NAME]))
+        return batch_write_item(RequestItems=RequestItems)
+
+    monkeypatch.setattr(
+        helper.dynamodb_client, "batch_write_item", record_batch_write_item
+    )
+    return helper, calls
+
+
+def test_batch_write_is_sent_in_chunks(batch_write_calls, dynamodb_table):
+    helper, calls = batch_write_calls
+
+    failed_items = helper.batch_write(build_items(60))
+
+    assert failed_items == []
+    assert sorted(calls) == [10, 25, 25]
+    assert dynamodb_table.scan()["Count"] == 60
+
+
+def test_batch_write_retries_unprocessed_items(
+    batch_write_calls, dynamodb_table, monkeypatch
+):
+    helper, _ = batch_write_calls
+    batch_write_item = helper.dynamodb_client.batch_write_item
+
+    # Only the first half of each request is processed
+    def partial_batch_write_item(RequestItems):
+        requests = RequestItems[TABLE_NAME]
+        half = (len(requests) + 1) // 2
+        batch_write_item(RequestItems={TABLE_NAME: requests[:half]})
+        return {
+            "UnprocessedItems": {TABLE_NAME: requests[half:]} if requests[half:] else {}
+        }
+
+    monkeypatch.setattr(
+        helper.dynamodb_client, "batch_write_item", partial_batch_write_item
+    )
+    failed_items = helper.batch_write(build_items(10), max_attempts=2)
+
+    # 10 items sent, 5 retried and 2 left after the last attempt
+    assert failed_items == build_items(10)[8:]
+    assert dynamodb_table.scan()["Count"] == 8
+
+
+def test_batch_create_reports_items_not_written(client, monkeypatch):
+    helper = todos_module.async_dynamodb_helper
+    batch_write = helper.batch_write
+
+    # The first item is never written
+    async def partial_batch_write(items):
+        return [*items[:1], *await batch_write(items[1:])]
+
+    monkeypatch.setattr(helper, "batch_write", partial_batch_write)
+    todo = {"user_email": USER_EMAIL, "todo_title": "New", "todo_date": "2024-03-01"}
+    response = client.post("/api/v1/todos:batch", json=[todo, todo, {"todo_title": 1}])
+
+    assert (response.json()["created"], response.json()["failed"]) == (1, 2)
+    assert response.json()["results"][0]["error"] == "TODO item could not be written"
+    assert response.json()["results"][1]["status"] == "created"
+    stats = client.get("/api/v1/todos/stats", params={"user_email": USER_EMAIL})
+    assert stats.json()["total_todos"] == 1
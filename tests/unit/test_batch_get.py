@@ -0,0 +1,130 @@
+# External imports
+import pytest
+
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+from todo_app.helpers.dynamodb_helper import DynamoDBHelper, UnprocessedKeysError
+from conftest import TABLE_NAME, USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+def build_keys(count: int) -> list[tuple[str, str]]:
+    return [(f"USER#{USER_EMAIL}", f"TODO#{index:03}") for index in range(count)]
+
+
+@pytest.fixture
+def batch_get_calls(dynamodb_table, monkeypatch):
+    """Helper for the mocked table that records the keys sent by each batch get."""
+    monkeypatch.setattr(
+        "todo_app.helpers.dynamodb_helper._sleep_with_jitter", lambda attempt: None
+    )
+    with dynamodb_table.batch_writer() as batch:
+        for partition_key, sort_key in build_keys(250):
+            batch.put_item(Item={"PK": partition_key, "SK": sort_key})
+    helper = DynamoDBHelper(TABLE_NAME)
+    calls = []
+    batch_get_item = helper.dynamodb_client.batch_get_item
+
+    def record_batch_get_item(RequestItems):
+        calls.append(len(RequestItems[TABLE_NAME]["Keys"]))
+        return batch_get_item(RequestItems=RequestItems)
+
+    monkeypatch.setattr(helper.dynamodb_client, "batch_get_item", record_batch_get_item)
+    return helper, calls
+
+
+def test_batch_get_is_sent_in_chunks(batch_get_calls):
+    helper, calls = batch_get_calls
+
+    items = helper.batch_get(build_keys(260))
+
+    # Non-existing items are not returned
+    assert len(items) == 250
+    assert sorted(calls) == [60, 100, 100]
+
+
+def partial_batch_get_item(batch_get_item, processed_keys: int):
+    """Batch get that only processes the first keys of each request."""
+
+    def _batch_get_item(RequestItems):
+        keys = RequestItems[TABLE_NAME]["Keys"]
+        response = batch_get_item(
+            RequestItems={TABLE_NAME: {"Keys": keys[:processed_keys]}}
+        )
+        if keys[processed_keys:]:
+            response["UnprocessedKeys"] = {TABLE_NAME: {"Keys": keys[processed_keys:]}}
+        return response
+
+    return _batch_get_item
+
+
+def test_batch_get_retries_unprocessed_keys(batch_get_calls, monkeypatch):
+    helper, _ = batch_get_calls
+    monkeypatch.setattr(
+        helper.dynamodb_client,
+        "batch_get_item",
+        partial_batch_get_item(helper.dynamodb_client.batch_get_item, 4),
+    )
+
+    items = helper.batch_get(build_keys(10))
+
+    assert len(items) == 10
+    assert len({item["SK"]["S"] for item in items}) == 10
+
+
+def test_batch_get_fails_with_unprocessed_keys(batch_get_calls, monkeypatch):
+    helper, _ = batch_get_calls
+    monkeypatch.setattr(
+        helper.dynamodb_client,
+        "batch_get_item",
+        partial_batch_get_item(helper.dynamodb_client.batch_get_item, 4),
+    )
+
+    with pytest.raises(UnprocessedKeysError) as error:
+        helper.batch_get(build_keys(10), max_attempts=2)
+
+    assert error.value.unprocessed_keys == 2
+
+
+def test_read_todos_by_ids(client, create_todo):
+    todos = [create_todo(todo_title=f"TODO {index}") for index in range(3)]
+    ulids = [todo["SK"].split("#")[1] for todo in todos]
+
+    response = client.get(
+        "/api/v1/todos",
+        params={
+            **PARAMS,
+            "ids": f"{ulids[2]},{ulids[0]},01HQ0000000000000000000000,{ulids[2]}",
+        },
+    )
+
+    # Order of the ULIDs kept, without duplicates or non-existing TODO items
+    assert response.status_code == 200
+    assert response.json() == {"items": [todos[2], todos[0]], "next_token": None}
+
+
+@pytest.mark.parametrize(
+    "extra_params",
+    [{"ids": ","}, {"ids": ",".join(["01HQ0000000000000000000000"] * 301)}],
+)
+def test_read_todos_by_ids_validation(client, extra_params):
+    response = client.get("/api/v1/todos", params={**PARAMS, **extra_params})
+
+    assert response.status_code == 400
+
+
+def test_read_todos_by_ids_with_unprocessed_keys(client, create_todo, monkeypatch):
+    ulid = create_todo()["SK"].split("#")[1]
+
+    async def failed_batch_get(keys, **kwargs):
+        raise UnprocessedKeysError(len(keys), 5)
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper, "batch_get", failed_batch_get
+    )
+    response = client.get("/api/v1/todos", params={**PARAMS, "ids": ulid})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,128 @@
+# External imports
+import pytest
+from botocore.exceptions import ClientError
+
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+from conftest import USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+@pytest.fixture
+def todo_ids(client) -> list[str]:
+    """ULIDs of 150 open TODO items of the test user."""
+    todo = {"user_email": USER_EMAIL, "todo_title": "New", "todo_date": "2024-03-01"}
+    response = client.post("/api/v1/todos:batch", json=[todo] * 150)
+    return [result["todo"]["SK"].split("#")[1] for result in response.json()["results"]]
+
+
+@pytest.fixture
+def transaction_sizes(monkeypatch):
+    """Number of operations of each transaction sent by the app."""
+    sizes = []
+    transact_write = todos_module.async_dynamodb_helper.transact_write
+
+    async def record_transact_write(transact_items):
+        sizes.append(len(transact_items))
+        return await transact_write(transact_items)
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper, "transact_write", record_transact_write
+    )
+    return sizes
+
+
+@pytest.mark.parametrize(
+    "update, expected_sizes",
+    [
+        # Up to 100 operations per transaction
+        ({"todo_title": "Updated"}, [100, 50]),
+        # One operation of each transaction is kept for the user stats
+        ({"is_done": True}, [100, 52]),
+    ],
+)
+def test_bulk_patch_is_sent_in_chunks(
+    client, dynamodb_table, todo_ids, transaction_sizes, update, expected_sizes
+):
+    response = client.patch(
+        "/api/v1/todos:bulk", params=PARAMS, json={"ids": todo_ids, "update": update}
+    )
+
+    assert response.json()["updated"] == 150
+    assert transaction_sizes == expected_sizes
+    todo_items = dynamodb_table.scan()["Items"]
+    assert all(
+        todo_item[key] == str(value)
+        for todo_item in todo_items
+        if todo_item["SK"].startswith("TODO#")
+        for key, value in update.items()
+    )
+
+
+def test_bulk_patch_reports_missing_todos(client, todo_ids):
+    response = client.patch(
+        "/api/v1/todos:bulk",
+        params=PARAMS,
+        json={
+            "ids": [todo_ids[0], "01HQ0000000000000000000000", todo_ids[0]],
+            "update": {"todo_title": "Updated"},
+        },
+    )
+
+    assert response.json()["updated"] == 1
+    assert response.json()["results"] == [
+        {"todo_id": todo_ids[0], "status": "updated"},
+        {
+            "todo_id": "01HQ0000000000000000000000",
+            "status": "failed",
+            "error": "TODO item does not exist",
+        },
+    ]
+
+
+def test_bulk_patch_retries_canceled_transactions(client, todo_ids, monkeypatch):
+    transact_write = todos_module.async_dynamodb_helper.transact_write
+    canceled = []
+
+    # The first transaction is canceled by a conflict with another write
+    async def conflicting_transact_write(transact_items):
+        if not canceled:
+            canceled.append(transact_items)
+            raise ClientError(
+                {
+                    "Error": {"Code": "TransactionCanceledException"},
+                    "CancellationReasons": [{"Code": "None"}]
+                    * (len(transact_items) - 1)
+                    + [{"Code": "TransactionConflict"}],
+                },
+                "TransactWriteItems",
+            )
+        return await transact_write(transact_items)
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper,
+        "transact_write",
+        conflicting_transact_write,
+    )
+    response = client.patch(
+        "/api/v1/todos:bulk",
+        params=PARAMS,
+        json={"ids": todo_ids[:10], "update": {"is_done": True}},
+    )
+
+    assert len(canceled) == 1
+    assert response.json()["updated"] == 10
+    stats = client.get("/api/v1/todos/stats", params=PARAMS).json()
+    assert stats["open_todos"] == 140
+
+
+def test_bulk_patch_validates_the_update(client, todo_ids):
+    response = client.patch(
+        "/api/v1/todos:bulk",
+        params=PARAMS,
+        json={"ids": todo_ids[:1], "update": {"is_done": "yes"}},
+    )
+
+    assert response.status_code == 400
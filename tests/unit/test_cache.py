@@ -0,0 +1,124 @@
+# External imports
+import pytest
+
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+from todo_app.common.metrics import _request_metrics, start_request_metrics
+from todo_app.helpers.cache import TTLCache
+from conftest import USER_EMAIL
+
+
+PARTITION_KEY = f"USER#{USER_EMAIL}"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock of the cache (advanced manually by the tests)."""
+    current_time = [1000.0]
+    monkeypatch.setattr(
+        "todo_app.helpers.cache.time.monotonic", lambda: current_time[0]
+    )
+    return current_time
+
+
+@pytest.fixture
+def request_metrics(monkeypatch):
+    """Metrics collector of a request, to check the counters of the cache."""
+    monkeypatch.setattr("todo_app.common.metrics.METRICS_ENABLED", True)
+    yield start_request_metrics()
+    _request_metrics.set(None)
+
+
+@pytest.fixture
+def todos_cache(monkeypatch):
+    """Enabled cache for the TODO reads of the app."""
+    cache = TTLCache(ttl_seconds=60, max_items=100)
+    monkeypatch.setattr(todos_module, "todos_cache", cache)
+    return cache
+
+
+def test_cache_hit_and_miss(clock, request_metrics):
+    cache = TTLCache(ttl_seconds=5)
+    cache.set(PARTITION_KEY, "TODO#1", {"SK": {"S": "TODO#1"}})
+
+    assert cache.get(PARTITION_KEY, "TODO#1") == {"SK": {"S": "TODO#1"}}
+    assert cache.get(PARTITION_KEY, "TODO#2") is None
+    assert (request_metrics.cache_hits, request_metrics.cache_misses) == (1, 1)
+
+
+def test_cache_entries_expire_after_ttl(clock, request_metrics):
+    cache = TTLCache(ttl_seconds=5)
+    cache.set(PARTITION_KEY, "TODO#1", {"SK": {"S": "TODO#1"}})
+
+    clock[0] += 4.9
+    assert cache.get(PARTITION_KEY, "TODO#1") is not None
+    clock[0] += 0.1
+    assert cache.get(PARTITION_KEY, "TODO#1") is None
+    assert request_metrics.cache_misses == 1
+
+
+def test_cache_is_disabled_without_ttl(request_metrics):
+    cache = TTLCache(ttl_seconds=0)
+    cache.set(PARTITION_KEY, "TODO#1", {"SK": {"S": "TODO#1"}})
+
+    assert cache.get(PARTITION_KEY, "TODO#1") is None
+    assert request_metrics.cache_misses == 0
+
+
+def test_cache_evicts_least_recently_used_items(clock, request_metrics):
+    cache = TTLCache(ttl_seconds=5, max_items=3)
+    cache.set(PARTITION_KEY, "TODO#1", "todo-1")
+    cache.set(PARTITION_KEY, "LIST#ALL", ["todo-1", "todo-2"], item_count=2)
+    cache.get(PARTITION_KEY, "TODO#1")
+    cache.set(PARTITION_KEY, "TODO#3", "todo-3")
+
+    assert cache.get(PARTITION_KEY, "LIST#ALL") is None
+    assert cache.get(PARTITION_KEY, "TODO#1") == "todo-1"
+    assert cache.get(PARTITION_KEY, "TODO#3") == "todo-3"
+    assert request_metrics.cache_evictions == 1
+
+
+def test_cache_invalidates_partition_prefix(clock):
+    cache = TTLCache(ttl_seconds=5)
+    cache.set(PARTITION_KEY, "TODO#1", "todo-1")
+    cache.set(PARTITION_KEY, "LIST#ALL#50#", ["todo-1"])
+    cache.invalidate_partition(PARTITION_KEY, "LIST#")
+
+    assert cache.get(PARTITION_KEY, "LIST#ALL#50#") is None
+    assert cache.get(PARTITION_KEY, "TODO#1") == "todo-1"
+
+
+def test_read_is_served_from_cache(client, create_todo, todos_cache, dynamodb_table):
+    todo = create_todo()
+    todo_id = todo["SK"].split("#")[1]
+    # Written behind the app, so only the cached value is returned
+    dynamodb_table.update_item(
+        Key={"PK": PARTITION_KEY, "SK": todo["SK"]},
+        UpdateExpression="SET todo_title = :title",
+        ExpressionAttributeValues={":title": "Changed outside"},
+    )
+
+    response = client.get(f"/api/v1/todos/{todo_id}", params={"user_email": USER_EMAIL})
+
+    assert response.json()["todo_title"] == "Complete project"
+
+
+def test_cache_is_invalidated_on_writes(client, create_todo, todos_cache):
+    todo = create_todo()
+    todo_id = todo["SK"].split("#")[1]
+    params = {"user_email": USER_EMAIL}
+    assert len(client.get("/api/v1/todos", params=params).json()["items"]) == 1
+
+    client.patch(
+        f"/api/v1/todos/{todo_id}", params=params, json={"todo_title": "Updated"}
+    )
+    create_todo()
+
+    response = client.get("/api/v1/todos", params=params)
+    assert len(response.json()["items"]) == 2
+    response = client.get(f"/api/v1/todos/{todo_id}", params=params)
+    assert response.json()["todo_title"] == "Updated"
+
+    client.delete(f"/api/v1/todos/{todo_id}", params=params)
+    response = client.get(f"/api/v1/todos/{todo_id}", params=params)
+    assert response.json() == {}
@@ -0,0 +1,77 @@
+# External imports
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+# Own imports
+from todo_app.api.v1.middlewares.compression import (
+    CompressionMiddleware,
+    select_encoding,
+)
+
+
+LARGE_BODY = "TODO item " * 500
+
+
+@pytest.fixture
+def compression_client():
+    """Client for an app with the compression middleware (and a threshold of 100)."""
+    app = FastAPI()
+
+    @app.get("/text/{size}")
+    async def text(size: int):
+        return PlainTextResponse(LARGE_BODY[:size])
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([LARGE_BODY, LARGE_BODY]))
+
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0, identity", None),
+        ("*", "gzip"),
+        ("", None),
+    ],
+)
+def test_select_encoding(accept_encoding, expected, monkeypatch):
+    monkeypatch.setattr("todo_app.api.v1.middlewares.compression.brotli", None)
+
+    assert select_encoding(accept_encoding) == expected
+
+
+def test_large_response_is_compressed(compression_client):
+    response = compression_client.get("/text/5000", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < 5000
+    assert response.text == LARGE_BODY
+
+
+def test_streaming_response_is_compressed(compression_client):
+    response = compression_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.text == LARGE_BODY * 2
+
+
+@pytest.mark.parametrize(
+    "path, accept_encoding",
+    [("/text/50", "gzip"), ("/text/5000", "identity")],
+)
+def test_uncompressed_response_varies_on_encoding(
+    compression_client, path, accept_encoding
+):
+    response = compression_client.get(
+        path, headers={"Accept-Encoding": accept_encoding}
+    )
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
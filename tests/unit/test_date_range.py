@@ -0,0 +1,101 @@
+# External imports
+import pytest
+
+# Own imports
+from conftest import USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+TODO_DATES = ["2024-01-31", "2024-02-01", "2024-02-15", "2024-02-29", "2024-03-01"]
+
+
+@pytest.fixture
+def todos(create_todo) -> list[dict]:
+    """TODO items of the user, one per date."""
+    # ! Note--> created in order of their dates, as moto paginates the indexes in the
+    # order of the table keys (DynamoDB uses the order of the index keys)
+    return [create_todo(todo_date=todo_date) for todo_date in TODO_DATES]
+
+
+def get_dates(response) -> list[str]:
+    assert response.status_code == 200, response.text
+    return [todo["todo_date"] for todo in response.json()["items"]]
+
+
+@pytest.mark.parametrize(
+    "due_from, due_to, expected",
+    [
+        # Both bounds are inclusive
+        ("2024-02-01", "2024-02-29", TODO_DATES[1:4]),
+        ("2024-02-15", "2024-02-15", ["2024-02-15"]),
+        ("2024-02-16", "2024-02-28", []),
+        # Unbounded at one side
+        ("2024-02-29", None, TODO_DATES[3:]),
+        (None, "2024-02-01", TODO_DATES[:2]),
+    ],
+)
+def test_date_range_bounds(client, todos, due_from, due_to, expected):
+    range_params = {"due_from": due_from, "due_to": due_to}
+    response = client.get(
+        "/api/v1/todos",
+        params={
+            **PARAMS,
+            **{name: value for name, value in range_params.items() if value},
+        },
+    )
+
+    assert get_dates(response) == expected
+
+
+def test_date_range_pages(client, todos):
+    params = {**PARAMS, "due_from": "2024-02-01", "due_to": "2024-03-01", "limit": 2}
+    dates = []
+    next_token = None
+    for _ in range(3):
+        response = client.get(
+            "/api/v1/todos",
+            params={**params, **({"next_token": next_token} if next_token else {})},
+        )
+        dates.extend(get_dates(response))
+        next_token = response.json()["next_token"]
+        if not next_token:
+            break
+
+    assert dates == TODO_DATES[1:]
+    assert next_token is None
+
+
+@pytest.mark.parametrize(
+    "other_params",
+    [
+        {"due_from": "2024-02-02", "due_to": "2024-03-01"},
+        {"due_to": "2024-03-01"},
+        {},
+        {"is_done": False},
+    ],
+)
+def test_date_range_token_of_other_query(client, todos, other_params):
+    params = {**PARAMS, "due_from": "2024-02-01", "due_to": "2024-03-01", "limit": 2}
+    next_token = client.get("/api/v1/todos", params=params).json()["next_token"]
+
+    response = client.get(
+        "/api/v1/todos",
+        params={**PARAMS, **other_params, "limit": 2, "next_token": next_token},
+    )
+
+    assert response.status_code == 400
+    assert "Invalid next_token" in response.json()["detail"]
+
+
+@pytest.mark.parametrize(
+    "range_params, expected_status",
+    [
+        ({"due_from": "2024-03-01", "due_to": "2024-02-01"}, 400),
+        ({"due_from": "2024-02-01", "is_done": True}, 400),
+        ({"due_from": "2024-02-30"}, 422),
+    ],
+)
+def test_invalid_date_ranges_are_rejected(client, range_params, expected_status):
+    response = client.get("/api/v1/todos", params={**PARAMS, **range_params})
+
+    assert response.status_code == expected_status
@@ -0,0 +1,64 @@
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+from conftest import USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+def test_delete_is_a_single_transaction(client, create_todo, dynamodb_calls):
+    todo_id = create_todo()["SK"].split("#")[1]
+    dynamodb_calls.clear()
+
+    response = client.delete(f"/api/v1/todos/{todo_id}", params=PARAMS)
+
+    assert response.status_code == 200
+    assert dynamodb_calls == ["transact_write"]
+    response = client.get(f"/api/v1/todos/{todo_id}", params=PARAMS)
+    assert response.json() == {}
+
+
+def test_delete_returns_deleted_todo_on_request(client, create_todo, dynamodb_calls):
+    todo = create_todo()
+    dynamodb_calls.clear()
+
+    response = client.delete(
+        f"/api/v1/todos/{todo['SK'].split('#')[1]}",
+        params={**PARAMS, "return_deleted": True},
+    )
+
+    assert response.json() == todo
+    assert dynamodb_calls == ["get_item_by_pk_and_sk", "transact_write"]
+
+
+def test_delete_of_missing_todo_is_rejected(client, create_todo, dynamodb_calls):
+    todo_id = create_todo()["SK"].split("#")[1]
+    client.delete(f"/api/v1/todos/{todo_id}", params=PARAMS)
+    dynamodb_calls.clear()
+
+    response = client.delete(f"/api/v1/todos/{todo_id}", params=PARAMS)
+
+    assert response.status_code == 400
+    assert "item does not exist" in response.json()["detail"]
+    # The failed condition is only then checked with a read
+    assert dynamodb_calls == ["transact_write", "get_item_by_pk_and_sk"]
+
+
+def test_delete_conflict(client, create_todo, monkeypatch):
+    todo_id = create_todo(is_done=True)["SK"].split("#")[1]
+
+    # Status read as open each time, while the TODO item stays done
+    async def get_item_by_pk_and_sk(**kwargs):
+        return {"is_done": {"S": "False"}}
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper,
+        "get_item_by_pk_and_sk",
+        get_item_by_pk_and_sk,
+    )
+    response = client.delete(f"/api/v1/todos/{todo_id}", params=PARAMS)
+
+    assert response.status_code == 409
+    monkeypatch.undo()
+    response = client.get(f"/api/v1/todos/{todo_id}", params=PARAMS)
+    assert response.json()["is_done"] is True
@@ -0,0 +1,88 @@
+# Built-in imports
+from decimal import Decimal
+
+# External imports
+import pytest
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+# Own imports
+from todo_app.helpers.dynamodb_serializer import (
+    deserialize,
+    deserialize_item,
+    serialize,
+    serialize_item,
+)
+
+
+VALUES = [
+    "Complete project",
+    "",
+    True,
+    False,
+    None,
+    0,
+    -42,
+    10**20,
+    Decimal("3.14"),
+    Decimal("-0.001"),
+    b"\x00binary",
+    {"title": "Nested", "tags": ["a", 1, False], "meta": {"empty": "", "none": None}},
+    [],
+    {},
+    [{"done": True}, [Decimal("1.5"), "x"]],
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_serialize_matches_boto3(value):
+    assert serialize(value) == TypeSerializer().serialize(value)
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_deserialize_matches_boto3(value):
+    attribute_value = TypeSerializer().serialize(value)
+
+    # boto3 returns every number as Decimal (and bytes as Binary), which are equal
+    assert deserialize(attribute_value) == TypeDeserializer().deserialize(
+        attribute_value
+    )
+    assert deserialize(attribute_value) == value
+
+
+@pytest.mark.parametrize("value", [{"a", "b", "c"}, {1, 2, Decimal("2.5")}])
+def test_sets_match_boto3(value):
+    attribute_value = serialize(value)
+    ((data_type, values),) = attribute_value.items()
+    ((expected_type, expected_values),) = TypeSerializer().serialize(value).items()
+
+    # Sets have no order
+    assert (data_type, sorted(values)) == (expected_type, sorted(expected_values))
+    assert deserialize(attribute_value) == TypeDeserializer().deserialize(
+        attribute_value
+    )
+
+
+def test_integral_numbers_are_deserialized_as_int():
+    assert type(deserialize({"N": "7"})) is int
+    assert type(deserialize({"N": "7.5"})) is Decimal
+
+
+def test_item_round_trip():
+    item = {
+        "PK": "USER#rick@example.com",
+        "SK": "TODO#01HQ1Z6S2K4W8Y0B3C5D7E9F1G",
+        "is_done": False,
+        "total_todos": 3,
+        "todo_details": None,
+    }
+
+    assert serialize_item(item) == {
+        key: TypeSerializer().serialize(value) for key, value in item.items()
+    }
+    assert deserialize_item(serialize_item(item)) == item
+
+
+@pytest.mark.parametrize("value", [object(), set(), {1, "mixed"}])
+def test_unsupported_values_are_rejected(value):
+    with pytest.raises(TypeError):
+        serialize(value)
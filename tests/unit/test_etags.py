@@ -0,0 +1,75 @@
+# Own imports
+from todo_app.helpers.etags import etag_matches
+from conftest import USER_EMAIL
+
+
+def test_etag_matches_weak_and_multiple_etags():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"xyz", "abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+    assert not etag_matches('W/"xyz"', 'W/"abc"')
+
+
+def test_read_todo_not_modified(client, create_todo):
+    todo_id = create_todo()["SK"].split("#")[1]
+    params = {"user_email": USER_EMAIL}
+    etag = client.get(f"/api/v1/todos/{todo_id}", params=params).headers["ETag"]
+
+    response = client.get(
+        f"/api/v1/todos/{todo_id}", params=params, headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_read_todo_modified_after_update(client, create_todo):
+    todo_id = create_todo()["SK"].split("#")[1]
+    params = {"user_email": USER_EMAIL}
+    etag = client.get(f"/api/v1/todos/{todo_id}", params=params).headers["ETag"]
+    client.patch(
+        f"/api/v1/todos/{todo_id}", params=params, json={"todo_title": "Updated"}
+    )
+
+    response = client.get(
+        f"/api/v1/todos/{todo_id}", params=params, headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["todo_title"] == "Updated"
+
+
+def test_read_todo_projection_has_its_own_etag(client, create_todo):
+    todo_id = create_todo()["SK"].split("#")[1]
+    params = {"user_email": USER_EMAIL}
+    etag = client.get(f"/api/v1/todos/{todo_id}", params=params).headers["ETag"]
+
+    response = client.get(
+        f"/api/v1/todos/{todo_id}",
+        params={**params, "fields": "todo_title"},
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"PK", "SK", "todo_title"}
+
+
+def test_list_todos_not_modified_until_creation(client, create_todo):
+    create_todo()
+    params = {"user_email": USER_EMAIL}
+    etag = client.get("/api/v1/todos", params=params).headers["ETag"]
+
+    response = client.get(
+        "/api/v1/todos", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    create_todo()
+    response = client.get(
+        "/api/v1/todos", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
@@ -0,0 +1,103 @@
+# External imports
+import pytest
+
+# Own imports
+from conftest import USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+@pytest.fixture
+def todos(create_todo, dynamodb_table) -> list[dict]:
+    """TODO items of the user (an open one, and a done one without details)."""
+    todos = [create_todo(), create_todo(is_done=True)]
+    dynamodb_table.update_item(
+        Key={"PK": todos[1]["PK"], "SK": todos[1]["SK"]},
+        UpdateExpression="REMOVE todo_details",
+    )
+    todos[1]["todo_details"] = None
+    return todos
+
+
+def get_ulid(todo: dict) -> str:
+    return todo["SK"].split("#")[1]
+
+
+@pytest.mark.parametrize(
+    "extra_params",
+    [{}, {"is_done": True}, {"due_from": "2024-01-01", "due_to": "2024-12-31"}],
+)
+def test_list_returns_requested_fields(client, todos, extra_params):
+    response = client.get(
+        "/api/v1/todos",
+        params={**PARAMS, **extra_params, "fields": "is_done, todo_details"},
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    # Only the fields that the TODO items have (no details for the done one)
+    expected = [
+        {
+            "PK": todo["PK"],
+            "SK": todo["SK"],
+            "is_done": todo["is_done"],
+            **({"todo_details": todo["todo_details"]} if todo["todo_details"] else {}),
+        }
+        for todo in todos
+        if extra_params.get("is_done") in (None, todo["is_done"])
+    ]
+    assert items == expected
+
+
+def test_list_by_ids_returns_requested_fields(client, todos):
+    response = client.get(
+        "/api/v1/todos",
+        params={
+            **PARAMS,
+            "ids": f"{get_ulid(todos[1])},{get_ulid(todos[0])}",
+            "fields": "updated_at",
+        },
+    )
+
+    assert response.json()["items"] == [
+        {"PK": todo["PK"], "SK": todo["SK"], "updated_at": todo["updated_at"]}
+        for todo in (todos[1], todos[0])
+    ]
+
+
+def test_item_returns_requested_fields(client, todos):
+    response = client.get(
+        f"/api/v1/todos/{get_ulid(todos[0])}",
+        params={**PARAMS, "fields": "todo_title,is_done"},
+    )
+
+    assert response.json() == {
+        "PK": todos[0]["PK"],
+        "SK": todos[0]["SK"],
+        "todo_title": todos[0]["todo_title"],
+        "is_done": False,
+    }
+
+
+@pytest.mark.parametrize("path", ["/api/v1/todos", "/api/v1/todos/{ulid}"])
+def test_unknown_fields_are_rejected(client, todos, path):
+    response = client.get(
+        path.format(ulid=get_ulid(todos[0])),
+        params={**PARAMS, "fields": "todo_title,PK,owner"},
+    )
+
+    assert response.status_code == 400
+    assert "Unknown fields: PK, owner" in response.json()["detail"]
+
+
+def test_list_docs_include_partial_pages(client):
+    operation = client.get("/api/v1/docs/openapi.json").json()["paths"][
+        "/api/v1/todos"
+    ]["get"]
+
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    assert {option["$ref"].split("/")[-1] for option in schema["anyOf"]} == {
+        "TodosPage",
+        "TodosPartialPage",
+    }
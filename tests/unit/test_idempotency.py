@@ -0,0 +1,114 @@
+# Built-in imports
+import uuid
+import warnings
+from collections import OrderedDict
+
+# External imports
+import pytest
+
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+from conftest import USER_EMAIL
+
+
+TODO = {
+    "user_email": USER_EMAIL,
+    "todo_title": "Complete project",
+    "todo_date": "2024-02-29",
+}
+
+
+@pytest.fixture
+def idempotency_key() -> str:
+    """Unique key for each test (completed records are also kept in memory)."""
+    return str(uuid.uuid4())
+
+
+def get_todo_items(dynamodb_table) -> list[dict]:
+    return [
+        item
+        for item in dynamodb_table.scan()["Items"]
+        if item["SK"].startswith("TODO#")
+    ]
+
+
+def test_retry_replays_the_stored_response(
+    client, dynamodb_table, dynamodb_calls, idempotency_key
+):
+    headers = {"Idempotency-Key": idempotency_key}
+    response = client.post("/api/v1/todos", json=TODO, headers=headers)
+    dynamodb_calls.clear()
+
+    retry_response = client.post("/api/v1/todos", json=TODO, headers=headers)
+
+    assert retry_response.status_code == 200
+    assert retry_response.json() == response.json()
+    assert len(get_todo_items(dynamodb_table)) == 1
+    assert "transact_write" not in dynamodb_calls
+
+
+def test_reused_key_with_another_payload_is_rejected(
+    client, dynamodb_table, idempotency_key
+):
+    headers = {"Idempotency-Key": idempotency_key}
+    client.post("/api/v1/todos", json=TODO, headers=headers)
+
+    response = client.post(
+        "/api/v1/todos", json={**TODO, "todo_title": "Other"}, headers=headers
+    )
+
+    assert response.status_code == 422
+    assert len(get_todo_items(dynamodb_table)) == 1
+
+
+def test_records_are_kept_in_a_partition_per_user(
+    client, dynamodb_table, idempotency_key
+):
+    headers = {"Idempotency-Key": idempotency_key}
+    other_todo = {**TODO, "user_email": "morty@example.com"}
+
+    with warnings.catch_warnings(record=True) as recorded_warnings:
+        warnings.simplefilter("always")
+        client.post("/api/v1/todos", json=TODO, headers=headers)
+        client.post("/api/v1/todos", json=other_todo, headers=headers)
+
+    # Same key for both users, so each one has its own TODO item and record
+    assert len(get_todo_items(dynamodb_table)) == 2
+    records = [
+        item
+        for item in dynamodb_table.scan()["Items"]
+        if item["PK"].startswith("IDEMPOTENCY#")
+    ]
+    assert sorted(record["PK"] for record in records) == [
+        "IDEMPOTENCY#morty@example.com",
+        f"IDEMPOTENCY#{USER_EMAIL}",
+    ]
+    # Outside Lambda, the in-progress records expire after the fallback timeout
+    assert all("in_progress_expiration" in record for record in records)
+    assert not [
+        warning
+        for warning in recorded_warnings
+        if "remaining time" in str(warning.message)
+    ]
+
+
+def test_records_are_replayed_after_the_scope_is_evicted(
+    client, dynamodb_table, monkeypatch, idempotency_key
+):
+    idempotency = todos_module.create_todo_idempotency
+    # Only one persistence layer is kept (without the ones of the previous tests)
+    monkeypatch.setattr(idempotency, "persistence_layers_max_items", 1)
+    monkeypatch.setattr(idempotency, "_persistence_layers", OrderedDict())
+    headers = {"Idempotency-Key": idempotency_key}
+    response = client.post("/api/v1/todos", json=TODO, headers=headers)
+    persistence_layer = idempotency.get_persistence_layer(USER_EMAIL)
+
+    # Another user takes the only persistence layer that is kept
+    other_todo = {**TODO, "user_email": "morty@example.com"}
+    client.post("/api/v1/todos", json=other_todo, headers=headers)
+    retry_response = client.post("/api/v1/todos", json=TODO, headers=headers)
+
+    # The stored response is read from the table by a new persistence layer
+    assert retry_response.json() == response.json()
+    assert idempotency.get_persistence_layer(USER_EMAIL) is not persistence_layer
+    assert len(get_todo_items(dynamodb_table)) == 2
@@ -0,0 +1,136 @@
+# Built-in imports
+import asyncio
+import logging
+
+# External imports
+import httpx
+import pytest
+
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+import todo_app.common.logger as logger_module
+from todo_app.common.logger import (
+    RequestContextFilter,
+    append_log_keys,
+    start_log_context,
+)
+
+
+class RecordsHandler(logging.Handler):
+    """Handler that keeps the records logged by the service."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def log_records(monkeypatch):
+    """Records of the service logger, with its level (and filter level) set to INFO."""
+    std_logger = logging.getLogger("todo-app")
+    (request_filter,) = [
+        log_filter
+        for log_filter in std_logger.filters
+        if isinstance(log_filter, RequestContextFilter)
+    ]
+    monkeypatch.setattr(request_filter, "level", logging.INFO)
+    level = std_logger.level
+    std_logger.setLevel(logging.INFO)
+    handler = RecordsHandler()
+    std_logger.addHandler(handler)
+    yield handler.records
+    std_logger.removeHandler(handler)
+    std_logger.setLevel(level)
+
+
+def test_concurrent_requests_log_their_own_keys(client, log_records, monkeypatch):
+    query_page = todos_module.async_dynamodb_helper.query_page_by_pk_and_sk_begins_with
+
+    # Slow reads, so that the requests are processed at the same time
+    async def slow_query_page(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return await query_page(*args, **kwargs)
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper,
+        "query_page_by_pk_and_sk_begins_with",
+        slow_query_page,
+    )
+    users = {f"user{index}@example.com": f"correlation-{index}" for index in range(5)}
+
+    async def send_requests() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as async_client:
+            return await asyncio.gather(
+                *(
+                    async_client.get(
+                        "/api/v1/todos",
+                        params={"user_email": user_email},
+                        headers={"correlation-id": correlation_id},
+                    )
+                    for user_email, correlation_id in users.items()
+                )
+            )
+
+    responses = asyncio.run(send_requests())
+
+    assert [response.status_code for response in responses] == [200] * len(users)
+    request_records = [
+        record for record in log_records if hasattr(record, "user_email")
+    ]
+    assert {record.user_email for record in request_records} == set(users)
+    for record in request_records:
+        assert record.correlation_id == users[record.user_email]
+
+
+def test_requests_get_a_new_correlation_id(client, log_records):
+    for _ in range(2):
+        client.get("/api/v1/todos", params={"user_email": "rick@example.com"})
+
+    correlation_ids = {
+        record.correlation_id
+        for record in log_records
+        if hasattr(record, "correlation_id")
+    }
+    assert len(correlation_ids) == 2
+
+
+@pytest.mark.parametrize(
+    "sample_rate, expected_debug_records",
+    [(0.0, 0), (1.0, 1)],
+)
+def test_debug_records_of_sampled_requests(
+    monkeypatch, sample_rate, expected_debug_records
+):
+    monkeypatch.setattr(logger_module, "LOG_DEBUG_SAMPLE_RATE", sample_rate)
+    std_logger = logging.getLogger(f"test-sampling-{sample_rate}")
+    std_logger.setLevel(logging.DEBUG)
+    std_logger.addFilter(RequestContextFilter(logging.WARNING))
+    handler = RecordsHandler()
+    std_logger.addHandler(handler)
+
+    async def handle_request() -> None:
+        # Each request runs in its own context (as in the ASGI server)
+        start_log_context(correlation_id="sampled")
+        append_log_keys(user_email="rick@example.com")
+        std_logger.debug("Full payload")
+        std_logger.info("Not logged without debug sampling")
+        std_logger.warning("Always logged")
+
+    asyncio.run(handle_request())
+
+    debug_records = [
+        record for record in handler.records if record.levelno == logging.DEBUG
+    ]
+    assert len(debug_records) == expected_debug_records
+    assert handler.records[-1].getMessage() == "Always logged"
+    assert handler.records[-1].user_email == "rick@example.com"
+    assert getattr(handler.records[-1], "debug_sampled", False) is bool(sample_rate)
+    # Records outside of the requests keep the configured level
+    std_logger.info("Outside of a request")
+    assert handler.records[-1].getMessage() != "Outside of a request"
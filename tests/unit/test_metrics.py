@@ -0,0 +1,58 @@
+# Built-in imports
+import json
+
+# External imports
+import pytest
+
+# Own imports
+import todo_app.common.metrics as metrics_module
+from conftest import USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+def get_emf_documents(output: str) -> list[dict]:
+    """EMF documents printed to stdout (the other lines are the logs)."""
+    documents = [json.loads(line) for line in output.splitlines() if line]
+    return [document for document in documents if "_aws" in document]
+
+
+def get_metric_names(document: dict) -> set[str]:
+    (directive,) = document["_aws"]["CloudWatchMetrics"]
+    return {metric["Name"] for metric in directive["Metrics"]}
+
+
+@pytest.fixture
+def todo_id(create_todo) -> str:
+    return create_todo()["SK"].split("#")[1]
+
+
+def test_request_metrics_are_published_as_emf(client, todo_id, capsys, monkeypatch):
+    monkeypatch.setattr(metrics_module, "METRICS_ENABLED", True)
+    capsys.readouterr()
+
+    response = client.get(f"/api/v1/todos/{todo_id}", params=PARAMS)
+
+    assert response.status_code == 200
+    request_document, operation_document = get_emf_documents(capsys.readouterr().out)
+    assert request_document["route"] == "GET /api/v1/todos/{todo_id}"
+    assert request_document["status"] == "200"
+    assert {"DynamoDBMs", "SerializeMs", "ValidationMs"} <= get_metric_names(
+        request_document
+    )
+    assert request_document["DynamoDBMs"][0] > 0
+    assert request_document["SerializeMs"][0] > 0
+    assert request_document["DynamoDBCalls"] == [1.0]
+    assert request_document["ItemsReturned"] == [1.0]
+    # Timings of each DynamoDB operation, with their own dimension
+    assert operation_document["operation"] == "GetItem"
+    assert operation_document["DynamoDBMs"] == request_document["DynamoDBMs"]
+
+
+def test_request_metrics_are_not_published_when_disabled(client, todo_id, capsys):
+    capsys.readouterr()
+
+    client.get(f"/api/v1/todos/{todo_id}", params=PARAMS)
+
+    assert get_emf_documents(capsys.readouterr().out) == []
@@ -0,0 +1,38 @@
+# Own imports
+from todo_app.models.todos import TodoModel, TodoPartialModel
+
+
+DYNAMODB_ITEM = {
+    "PK": {"S": "USER#rick@example.com"},
+    "SK": {"S": "TODO#01HQ1Z6S2K4W8Y0B3C5D7E9F1G"},
+    "todo_title": {"S": "Complete project"},
+    "todo_date": {"S": "2024-02-29"},
+    "is_done": {"S": "True"},
+    "created_at": {"S": "2024-01-05T05:51:02.350Z"},
+    "updated_at": {"S": "2024-01-06T02:31:02.350Z"},
+}
+
+
+def test_bulk_conversion_matches_item_conversion():
+    legacy_item = {**DYNAMODB_ITEM, "is_done": {"BOOL": False}}
+
+    todos = TodoModel.from_dynamodb_items([DYNAMODB_ITEM, legacy_item])
+
+    assert todos[0] == TodoModel.from_dynamodb_item(DYNAMODB_ITEM)
+    assert todos[0].todo_details is None
+    assert todos[1].is_done is False
+
+
+def test_partial_conversion_only_sets_requested_fields():
+    todos = TodoPartialModel.from_dynamodb_items(
+        [DYNAMODB_ITEM, DYNAMODB_ITEM], ["is_done"]
+    )
+
+    assert todos[0].model_dump(exclude_unset=True) == {
+        "PK": "USER#rick@example.com",
+        "SK": "TODO#01HQ1Z6S2K4W8Y0B3C5D7E9F1G",
+        "is_done": True,
+    }
+    # Kept for the ETags, but not returned
+    assert todos[0].updated_at == "2024-01-06T02:31:02.350Z"
+    assert todos[0].model_fields_set is not todos[1].model_fields_set
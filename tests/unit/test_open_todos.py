@@ -0,0 +1,83 @@
+# External imports
+import pytest
+
+# Own imports
+from scripts.backfill_open_todos import backfill_open_todos
+from todo_app.helpers.dynamodb_helper import DynamoDBHelper
+from conftest import TABLE_NAME, USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+def get_open_sk(dynamodb_table, todo: dict):
+    todo_item = dynamodb_table.get_item(Key={"PK": todo["PK"], "SK": todo["SK"]})
+    return todo_item["Item"].get("OPEN_SK")
+
+
+def test_only_open_todos_are_in_the_index(client, create_todo, dynamodb_table):
+    open_todo = create_todo()
+    done_todo = create_todo(is_done=True)
+
+    assert get_open_sk(dynamodb_table, open_todo) == open_todo["SK"]
+    assert get_open_sk(dynamodb_table, done_todo) is None
+
+
+@pytest.mark.parametrize("is_done, expected_open_sk", [(True, False), (False, True)])
+def test_status_patch_updates_the_index(
+    client, create_todo, dynamodb_table, is_done, expected_open_sk
+):
+    todo = create_todo(is_done=not is_done)
+
+    client.patch(
+        f"/api/v1/todos/{todo['SK'].split('#')[1]}",
+        params=PARAMS,
+        json={"is_done": is_done},
+    )
+
+    assert (get_open_sk(dynamodb_table, todo) is not None) is expected_open_sk
+
+
+def test_open_todos_are_read_from_the_index(client, create_todo, dynamodb_calls):
+    open_todos = [create_todo(), create_todo()]
+    create_todo(is_done=True)
+    dynamodb_calls.clear()
+
+    response = client.get("/api/v1/todos", params={**PARAMS, "is_done": False})
+
+    assert response.json()["items"] == open_todos
+    assert dynamodb_calls == ["query_page_by_index_range"]
+
+
+def test_done_todos_are_filtered_from_the_partition(client, create_todo):
+    create_todo()
+    done_todo = create_todo(is_done=True)
+
+    response = client.get("/api/v1/todos", params={**PARAMS, "is_done": True})
+
+    assert response.json()["items"] == [done_todo]
+
+
+def test_backfill_adds_open_todos_to_the_index(client, create_todo, dynamodb_table):
+    todos = [create_todo() for _ in range(3)]
+    done_todo = create_todo(is_done=True)
+    # TODO items written before the index (one of them with a legacy BOOL status)
+    for todo, is_done in zip(todos, ["False", False, "False"]):
+        dynamodb_table.update_item(
+            Key={"PK": todo["PK"], "SK": todo["SK"]},
+            UpdateExpression="SET is_done = :is_done REMOVE OPEN_SK",
+            ExpressionAttributeValues={":is_done": is_done},
+        )
+    response = client.get("/api/v1/todos", params={**PARAMS, "is_done": False})
+    assert response.json()["items"] == []
+
+    result = backfill_open_todos(DynamoDBHelper(TABLE_NAME), page_size=2)
+
+    assert result == {"found": 3, "updated": 3}
+    assert get_open_sk(dynamodb_table, done_todo) is None
+    response = client.get("/api/v1/todos", params={**PARAMS, "is_done": False})
+    assert [todo["SK"] for todo in response.json()["items"]] == [
+        todo["SK"] for todo in todos
+    ]
+    # Nothing left to update when run again
+    assert backfill_open_todos(DynamoDBHelper(TABLE_NAME)) == {"found": 0, "updated": 0}
@@ -0,0 +1,134 @@
+# Built-in imports
+import os
+import sys
+import subprocess
+
+# External imports
+import boto3
+import pytest
+from moto import mock_secretsmanager
+
+# Own imports
+import todo_app.helpers.pagination as pagination_module
+from todo_app.helpers.pagination import decode_next_token, encode_next_token
+from conftest import USER_EMAIL
+
+
+LAST_EVALUATED_KEY = {
+    "PK": {"S": f"USER#{USER_EMAIL}"},
+    "SK": {"S": "TODO#01HQ1Z6S2K4W8Y0B3C5D7E9F1G"},
+}
+
+
+def test_encode_next_token_without_key():
+    assert encode_next_token(None, "ALL") is None
+
+
+def test_decode_next_token_returns_signed_key():
+    next_token = encode_next_token(LAST_EVALUATED_KEY, "ALL")
+
+    assert decode_next_token(next_token, "ALL") == LAST_EVALUATED_KEY
+
+
+def test_decode_next_token_rejects_tampered_payload():
+    next_token = encode_next_token(LAST_EVALUATED_KEY, "ALL")
+    other_token = encode_next_token({"PK": {"S": "USER#morty@example.com"}}, "ALL")
+    tampered_token = f"{other_token.split('.')[0]}.{next_token.split('.')[1]}"
+
+    with pytest.raises(ValueError, match="signature is not valid"):
+        decode_next_token(tampered_token, "ALL")
+
+
+@pytest.mark.parametrize("next_token", ["not-a-token", "a.b.c", "%%%.%%%"])
+def test_decode_next_token_rejects_malformed_token(next_token):
+    with pytest.raises(ValueError):
+        decode_next_token(next_token, "ALL")
+
+
+def test_decode_next_token_rejects_other_query():
+    next_token = encode_next_token(LAST_EVALUATED_KEY, "DONE#True")
+
+    with pytest.raises(ValueError, match="another query"):
+        decode_next_token(next_token, "DONE#False")
+
+
+def test_list_with_token_of_other_user(client, create_todo):
+    for _ in range(2):
+        create_todo()
+    response = client.get(
+        "/api/v1/todos", params={"user_email": USER_EMAIL, "limit": 1}
+    )
+    next_token = response.json()["next_token"]
+
+    response = client.get(
+        "/api/v1/todos",
+        params={"user_email": "morty@example.com", "next_token": next_token},
+    )
+
+    assert response.status_code == 400
+    assert "does not belong to the user" in response.json()["detail"]
+
+
+def test_list_with_token_of_other_query(client, create_todo):
+    for _ in range(2):
+        create_todo()
+    response = client.get(
+        "/api/v1/todos", params={"user_email": USER_EMAIL, "limit": 1}
+    )
+    next_token = response.json()["next_token"]
+
+    response = client.get(
+        "/api/v1/todos",
+        params={"user_email": USER_EMAIL, "is_done": False, "next_token": next_token},
+    )
+
+    assert response.status_code == 400
+    assert "another query" in response.json()["detail"]
+
+
+def test_list_pages_with_next_token(client, create_todo):
+    created_ids = {create_todo()["SK"] for _ in range(3)}
+
+    listed_ids = set()
+    params = {"user_email": USER_EMAIL, "limit": 2}
+    while True:
+        response = client.get("/api/v1/todos", params=params)
+        assert response.status_code == 200
+        listed_ids.update(item["SK"] for item in response.json()["items"])
+        if not response.json()["next_token"]:
+            break
+        params["next_token"] = response.json()["next_token"]
+
+    assert listed_ids == created_ids
+
+
+def test_secret_is_read_from_secrets_manager(monkeypatch):
+    with mock_secretsmanager():
+        secret_arn = boto3.client("secretsmanager").create_secret(
+            Name="pagination-token", SecretString="secret-from-secrets-manager"
+        )["ARN"]
+        monkeypatch.setattr(
+            pagination_module, "PAGINATION_TOKEN_SECRET_ARN", secret_arn
+        )
+        monkeypatch.setattr(pagination_module, "_secret", None)
+
+        assert not pagination_module.is_secret_loaded()
+        assert pagination_module.load_secret() == b"secret-from-secrets-manager"
+        assert pagination_module.is_secret_loaded()
+
+
+def test_app_does_not_import_boto3():
+    # Fresh interpreter, as the tests themselves import boto3
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, todo_app.api.v1.main; print('boto3' in sys.modules)",
+        ],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
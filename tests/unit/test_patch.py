@@ -0,0 +1,65 @@
+# Own imports
+from todo_app.access_patterns.todos import dynamodb_helper
+from conftest import USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+def test_patch_is_a_single_conditional_update(client, create_todo, dynamodb_calls):
+    todo = create_todo()
+    todo_id = todo["SK"].split("#")[1]
+    dynamodb_calls.clear()
+
+    response = client.patch(
+        f"/api/v1/todos/{todo_id}",
+        params=PARAMS,
+        json={"todo_title": "Updated", "todo_details": "New details"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["todo_title"] == "Updated"
+    assert response.json()["todo_details"] == "New details"
+    assert response.json()["created_at"] == todo["created_at"]
+    assert response.json()["updated_at"] != todo["updated_at"]
+    assert dynamodb_calls == ["update_item"]
+
+
+def test_patch_of_missing_todo_is_rejected(client, dynamodb_table):
+    response = client.patch(
+        "/api/v1/todos/01HQ0000000000000000000000",
+        params=PARAMS,
+        json={"todo_title": "Updated"},
+    )
+
+    assert response.status_code == 400
+    assert "item does not exist" in response.json()["detail"]
+    # The update did not create a partial TODO item
+    assert dynamodb_table.scan()["Count"] == 0
+
+
+def test_patch_of_another_user_todo_is_rejected(client, create_todo):
+    todo_id = create_todo()["SK"].split("#")[1]
+
+    response = client.patch(
+        f"/api/v1/todos/{todo_id}",
+        params={"user_email": "morty@example.com"},
+        json={"todo_title": "Updated"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_update_item_sets_reserved_word_attributes(dynamodb_table):
+    dynamodb_table.put_item(Item={"PK": "USER#1", "SK": "TODO#1"})
+
+    response = dynamodb_helper.update_item(
+        partition_key="USER#1",
+        sort_key="TODO#1",
+        data_attributes_only={"name": "Rick", "status": "active"},
+        condition_expression="attribute_exists(PK)",
+        return_values="ALL_NEW",
+    )
+
+    assert response["Attributes"]["name"] == "Rick"
+    assert response["Attributes"]["status"] == "active"
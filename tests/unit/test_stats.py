@@ -0,0 +1,286 @@
+# External imports
+import pytest
+from botocore.exceptions import ClientError
+
+# Own imports
+import todo_app.access_patterns.todos as todos_module
+from conftest import USER_EMAIL
+
+
+PARAMS = {"user_email": USER_EMAIL}
+
+
+def get_stats(client) -> dict:
+    response = client.get("/api/v1/todos/stats", params=PARAMS)
+    assert response.status_code == 200
+    return response.json()
+
+
+def get_ulid(todo: dict) -> str:
+    return todo["SK"].split("#")[1]
+
+
+@pytest.fixture
+def transact_write_calls(monkeypatch):
+    """Operations of each transaction sent to DynamoDB."""
+    calls = []
+    transact_write = todos_module.async_dynamodb_helper.transact_write
+
+    async def record_transact_write(transact_items):
+        calls.append([next(iter(item)) for item in transact_items])
+        return await transact_write(transact_items)
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper, "transact_write", record_transact_write
+    )
+    return calls
+
+
+def test_stats_of_creations(client, create_todo):
+    create_todo()
+    create_todo(is_done=True)
+
+    assert get_stats(client) == {"total_todos": 2, "open_todos": 1, "done_todos": 1}
+
+
+@pytest.mark.parametrize("is_done", [True, False])
+def test_delete_updates_stats_in_one_transaction(
+    client, create_todo, transact_write_calls, is_done
+):
+    todo = create_todo(is_done=is_done)
+    create_todo()
+    transact_write_calls.clear()
+
+    response = client.delete(f"/api/v1/todos/{get_ulid(todo)}", params=PARAMS)
+
+    assert response.status_code == 200
+    assert get_stats(client) == {"total_todos": 1, "open_todos": 1, "done_todos": 0}
+    # Open TODO items are expected, so the done ones need a retry with their status
+    assert transact_write_calls == [["Delete", "Update"]] * (2 if is_done else 1)
+
+
+def test_delete_returns_deleted_todo(client, create_todo):
+    todo = create_todo(is_done=True)
+
+    response = client.delete(
+        f"/api/v1/todos/{get_ulid(todo)}", params={**PARAMS, "return_deleted": True}
+    )
+
+    assert response.json() == todo
+    assert get_stats(client) == {"total_todos": 0, "open_todos": 0, "done_todos": 0}
+
+
+def test_delete_returns_version_deleted_after_concurrent_patch(
+    client, create_todo, dynamodb_table, transact_write_calls, monkeypatch
+):
+    todo = create_todo()
+    get_item = todos_module.async_dynamodb_helper.get_item_by_pk_and_sk
+    reads = []
+
+    # The TODO item is patched right after it's read for the response
+    async def get_item_by_pk_and_sk(**kwargs):
+        todo_item = await get_item(**kwargs)
+        if not reads:
+            dynamodb_table.update_item(
+                Key={"PK": todo["PK"], "SK": todo["SK"]},
+                UpdateExpression="SET todo_title = :title, updated_at = :updated_at",
+                ExpressionAttributeValues={
+                    ":title": "Patched",
+                    ":updated_at": "2099-01-01T00:00:00",
+                },
+            )
+        reads.append(todo_item)
+        return todo_item
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper,
+        "get_item_by_pk_and_sk",
+        get_item_by_pk_and_sk,
+    )
+    transact_write_calls.clear()
+    response = client.delete(
+        f"/api/v1/todos/{get_ulid(todo)}", params={**PARAMS, "return_deleted": True}
+    )
+
+    assert response.json()["todo_title"] == "Patched"
+    assert len(transact_write_calls) == 2
+    assert dynamodb_table.scan()["Count"] == 1
+
+
+def test_status_patch_without_change_skips_the_write(
+    client, create_todo, dynamodb_calls, capsys
+):
+    todo = create_todo(is_done=True)
+    dynamodb_calls.clear()
+    capsys.readouterr()
+
+    response = client.patch(
+        f"/api/v1/todos/{get_ulid(todo)}", params=PARAMS, json={"is_done": True}
+    )
+
+    assert response.json() == todo
+    # Failed write (with the concurrent read) and the read of the current status
+    assert sorted(dynamodb_calls) == [
+        "get_item_by_pk_and_sk",
+        "get_item_by_pk_and_sk",
+        "transact_write",
+    ]
+    # Failed conditions are expected, so they are not logged as errors
+    assert '"level":"ERROR"' not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "initial_is_done, is_done, expected_open",
+    [(False, True, 0), (True, False, 1), (False, False, 1), (True, True, 0)],
+)
+def test_status_patch_updates_stats(
+    client, create_todo, initial_is_done, is_done, expected_open
+):
+    todo = create_todo(is_done=initial_is_done)
+
+    response = client.patch(
+        f"/api/v1/todos/{get_ulid(todo)}", params=PARAMS, json={"is_done": is_done}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["is_done"] is is_done
+    assert response.json()["todo_title"] == todo["todo_title"]
+    assert get_stats(client)["open_todos"] == expected_open
+    # The open TODO items are the ones in the sparse index
+    response = client.get("/api/v1/todos", params={**PARAMS, "is_done": False})
+    assert len(response.json()["items"]) == expected_open
+
+
+def test_status_patch_of_legacy_todo(client, create_todo, dynamodb_table):
+    todo = create_todo()
+    dynamodb_table.update_item(
+        Key={"PK": todo["PK"], "SK": todo["SK"]},
+        UpdateExpression="SET is_done = :is_done",
+        ExpressionAttributeValues={":is_done": True},
+    )
+
+    client.patch(
+        f"/api/v1/todos/{get_ulid(todo)}", params=PARAMS, json={"is_done": True}
+    )
+
+    # Stats of the creation (open), as the legacy status was not counted
+    assert get_stats(client)["open_todos"] == 1
+
+
+def test_status_patch_conflict(client, create_todo, monkeypatch):
+    todo = create_todo(is_done=True)
+    get_item = todos_module.async_dynamodb_helper.get_item_by_pk_and_sk
+
+    # Status read as open each time, while the TODO item stays done
+    async def get_item_by_pk_and_sk(**kwargs):
+        return {**await get_item(**kwargs), "is_done": {"S": "False"}}
+
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper,
+        "get_item_by_pk_and_sk",
+        get_item_by_pk_and_sk,
+    )
+    response = client.patch(
+        f"/api/v1/todos/{get_ulid(todo)}", params=PARAMS, json={"is_done": True}
+    )
+
+    assert response.status_code == 409
+    assert get_stats(client)["open_todos"] == 0
+
+
+def test_bulk_status_patch_updates_stats(client, create_todo):
+    ulids = [get_ulid(create_todo(is_done=index % 2 == 0)) for index in range(5)]
+
+    response = client.patch(
+        "/api/v1/todos:bulk",
+        params=PARAMS,
+        json={
+            "ids": [*ulids, "01HQ0000000000000000000000"],
+            "update": {"is_done": True},
+        },
+    )
+
+    assert response.json()["updated"] == 5
+    assert response.json()["results"][-1]["status"] == "failed"
+    assert get_stats(client) == {"total_todos": 5, "open_todos": 0, "done_todos": 5}
+
+
+@pytest.mark.parametrize("method", ["PATCH", "DELETE"])
+def test_missing_todo_keeps_stats(client, create_todo, method):
+    create_todo()
+
+    response = client.request(
+        method,
+        "/api/v1/todos/01HQ0000000000000000000000",
+        params=PARAMS,
+        json={"is_done": True} if method == "PATCH" else None,
+    )
+
+    assert response.status_code == 400
+    assert get_stats(client) == {"total_todos": 1, "open_todos": 1, "done_todos": 0}
+
+
+@pytest.fixture
+def legacy_todos(create_todo, dynamodb_table) -> list[dict]:
+    """TODO items (1 open and 2 done) of a user that existed before the stats."""
+    todos = [create_todo(), create_todo(is_done=True), create_todo(is_done=True)]
+    dynamodb_table.delete_item(Key={"PK": f"USER#{USER_EMAIL}", "SK": "STATS"})
+    return todos
+
+
+def test_stats_are_recounted_when_missing(client, legacy_todos, dynamodb_table):
+    assert get_stats(client) == {"total_todos": 3, "open_todos": 1, "done_todos": 2}
+
+    stats_item = dynamodb_table.get_item(
+        Key={"PK": f"USER#{USER_EMAIL}", "SK": "STATS"}
+    )["Item"]
+    assert (stats_item["total_todos"], stats_item["open_todos"]) == (3, 1)
+
+
+NEW_TODO = {"user_email": USER_EMAIL, "todo_title": "New", "todo_date": "2024-03-01"}
+
+
+@pytest.mark.parametrize(
+    "method, path, body, expected",
+    [
+        ("DELETE", "/api/v1/todos/{ulid}", None, (2, 0)),
+        ("PATCH", "/api/v1/todos/{ulid}", {"is_done": True}, (3, 0)),
+        ("PATCH", "/api/v1/todos:bulk", {"update": {"is_done": True}}, (3, 0)),
+        ("POST", "/api/v1/todos", NEW_TODO, (4, 2)),
+        ("POST", "/api/v1/todos:batch", [NEW_TODO, NEW_TODO], (5, 3)),
+    ],
+)
+def test_writes_recount_missing_stats(
+    client, legacy_todos, method, path, body, expected
+):
+    ulid = get_ulid(legacy_todos[0])
+    if path.endswith(":bulk"):
+        body = {**body, "ids": [ulid]}
+
+    response = client.request(method, path.format(ulid=ulid), params=PARAMS, json=body)
+
+    assert response.status_code == 200
+    # Counted once (from the recount or from the write, never both)
+    stats = get_stats(client)
+    assert (stats["total_todos"], stats["open_todos"]) == expected
+
+
+def test_batch_create_retries_stats_update(client, monkeypatch):
+    update_item = todos_module.async_dynamodb_helper.update_item
+    failures = []
+
+    async def flaky_update_item(**kwargs):
+        if "add_attributes" in kwargs and not failures:
+            failures.append(kwargs)
+            raise ClientError({"Error": {"Code": "InternalServerError"}}, "UpdateItem")
+        return await update_item(**kwargs)
+
+    get_stats(client)
+    monkeypatch.setattr(
+        todos_module.async_dynamodb_helper, "update_item", flaky_update_item
+    )
+    response = client.post("/api/v1/todos:batch", json=[NEW_TODO, NEW_TODO])
+
+    assert response.json()["created"] == 2
+    assert len(failures) == 1
+    assert get_stats(client) == {"total_todos": 2, "open_todos": 2, "done_todos": 0}